@@ -0,0 +1,48 @@
+"""browse order without avg_rating
+
+Revision ID: 04afd609edd7
+Revises: 1df86336a7d1
+Create Date: 2026-10-17 21:12:05.730418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '04afd609edd7'
+down_revision: Union[str, Sequence[str], None] = '1df86336a7d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Trebuie să fie identice cu movie_sort_keys() din app/routers/movies.py
+BROWSE_KEYS = [
+    sa.text("coalesce(popularity, -1.0) DESC"),
+    sa.text("id DESC"),
+]
+OLD_BROWSE_KEYS = [
+    sa.text("coalesce(popularity, -1.0) DESC"),
+    sa.text("coalesce(avg_rating, 0.0) DESC"),
+    sa.text("id DESC"),
+]
+
+
+def _browse_indexes(keys) -> None:
+    op.drop_index("ix_movies_browse_rated", table_name="movies")
+    op.drop_index("ix_movies_browse", table_name="movies")
+    op.create_index("ix_movies_browse", "movies", keys)
+    op.create_index("ix_movies_browse_rated", "movies", keys, postgresql_where=sa.text("avg_rating > 0"))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # avg_rating scos din ordinea listelor: o schimbare de rating nu mai mută
+    # filmul între pagini cache-uite care nu sunt etichetate cu id-ul lui
+    _browse_indexes(BROWSE_KEYS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _browse_indexes(OLD_BROWSE_KEYS)
@@ -0,0 +1,30 @@
+"""import job attempts and retry delay
+
+Revision ID: 1df86336a7d1
+Revises: 2985a5736578
+Create Date: 2026-10-17 20:04:26.551930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1df86336a7d1'
+down_revision: Union[str, Sequence[str], None] = '2985a5736578'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("import_jobs", sa.Column("attempts", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("import_jobs", sa.Column("run_after", sa.TIMESTAMP(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("import_jobs", "run_after")
+    op.drop_column("import_jobs", "attempts")
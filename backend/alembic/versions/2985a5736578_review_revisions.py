@@ -0,0 +1,66 @@
+"""review revisions, reviews no longer bump movies.rev
+
+Revision ID: 2985a5736578
+Revises: a32ee138b6f8
+Create Date: 2026-10-17 19:32:41.207615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2985a5736578'
+down_revision: Union[str, Sequence[str], None] = 'a32ee138b6f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NEXT_REV = sa.text("nextval('content_rev_seq')")
+
+
+def _user_content_bump_rev(bump_movies: bool) -> str:
+    movie_old = movie_new = ""
+    if bump_movies:
+        movie_old = """
+                IF TG_TABLE_NAME = 'reviews' THEN
+                    UPDATE movies SET rev = nextval('content_rev_seq') WHERE id = OLD.movie_id;
+                END IF;"""
+        movie_new = movie_old.replace("OLD.", "NEW.")
+    return f"""
+        CREATE OR REPLACE FUNCTION user_content_bump_rev() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE users SET rev = nextval('content_rev_seq') WHERE id = OLD.user_id;{movie_old}
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                UPDATE users SET rev = nextval('content_rev_seq') WHERE id = NEW.user_id;{movie_new}
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Versiunea listei /reviews/movie/{id} vine din reviews: (max(rev), count) pe
+    # ix_reviews_movie_rev. UPDATE-ul pe movies din trigger bloca rândul filmului
+    # la fiecare review (și, cu ix_movies_rev, era un update non-HOT).
+    op.add_column("reviews", sa.Column("rev", sa.BigInteger(), nullable=False, server_default=NEXT_REV))
+    # movies_bump_rev() doar setează NEW.rev, deci e refolosită pentru reviews
+    op.execute("""
+        CREATE TRIGGER reviews_rev BEFORE UPDATE ON reviews
+        FOR EACH ROW EXECUTE FUNCTION movies_bump_rev()
+    """)
+    op.create_index("ix_reviews_movie_rev", "reviews", ["movie_id", "rev"])
+    op.execute(_user_content_bump_rev(bump_movies=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(_user_content_bump_rev(bump_movies=True))
+    op.drop_index("ix_reviews_movie_rev", table_name="reviews")
+    op.execute("DROP TRIGGER reviews_rev ON reviews")
+    op.drop_column("reviews", "rev")
@@ -0,0 +1,43 @@
+"""import jobs
+
+Revision ID: 2fa16608fda0
+Revises: c3a4d05c04ac
+Create Date: 2026-10-17 11:02:17.540982
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2fa16608fda0'
+down_revision: Union[str, Sequence[str], None] = 'c3a4d05c04ac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "import_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("tmdb_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=10), server_default="queued", nullable=False),
+        sa.Column("movie_id", sa.Integer(), sa.ForeignKey("movies.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+    )
+    op.create_index(op.f("ix_import_jobs_id"), "import_jobs", ["id"], unique=False)
+    op.create_index(op.f("ix_import_jobs_tmdb_id"), "import_jobs", ["tmdb_id"], unique=False)
+    op.create_index(op.f("ix_import_jobs_status"), "import_jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_import_jobs_status"), table_name="import_jobs")
+    op.drop_index(op.f("ix_import_jobs_tmdb_id"), table_name="import_jobs")
+    op.drop_index(op.f("ix_import_jobs_id"), table_name="import_jobs")
+    op.drop_table("import_jobs")
@@ -0,0 +1,29 @@
+"""movies rev index
+
+Revision ID: 3cbe95d2ccde
+Revises: d977056f0e0d
+Create Date: 2026-10-17 18:03:27.915460
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3cbe95d2ccde'
+down_revision: Union[str, Sequence[str], None] = 'd977056f0e0d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Leaderboard-urile citesc la fiecare refresh doar filmele cu rev > watermark
+    op.create_index("ix_movies_rev", "movies", ["rev"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_movies_rev", table_name="movies")
@@ -0,0 +1,47 @@
+"""movie facets rollup
+
+Revision ID: 3f8da37049b2
+Revises: d31a4c73017a
+Create Date: 2026-10-17 15:20:41.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8da37049b2'
+down_revision: Union[str, Sequence[str], None] = 'd31a4c73017a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Numărul de filme per (gen, an, bucket de rating) + aceleași numărători fără gen
+    # (genre_id = 0), într-o singură trecere cu GROUPING SETS. year = 0: fără release_date.
+    # Bucket-ul e floor(avg_rating), deci avg_rating >= k <=> rating_bucket >= k pentru k întreg.
+    op.execute("""
+        CREATE MATERIALIZED VIEW movie_facets AS
+        SELECT
+            coalesce(mg.genre_id, 0) AS genre_id,
+            coalesce(extract(year FROM m.release_date)::int, 0) AS year,
+            floor(coalesce(m.avg_rating, 0))::int AS rating_bucket,
+            count(DISTINCT m.id) AS movies
+        FROM movies m
+        LEFT JOIN movie_genres mg ON mg.movie_id = m.id
+        GROUP BY GROUPING SETS (
+            (mg.genre_id, extract(year FROM m.release_date), floor(coalesce(m.avg_rating, 0))),
+            (extract(year FROM m.release_date), floor(coalesce(m.avg_rating, 0)))
+        )
+        HAVING grouping(mg.genre_id) = 1 OR mg.genre_id IS NOT NULL
+    """)
+    # Necesar pentru REFRESH MATERIALIZED VIEW CONCURRENTLY (citirile nu sunt blocate)
+    op.create_index("ux_movie_facets", "movie_facets", ["genre_id", "year", "rating_bucket"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW movie_facets")
@@ -0,0 +1,48 @@
+"""movie rating totals
+
+Revision ID: 4acb165ed60e
+Revises: 3f8da37049b2
+Create Date: 2026-10-17 16:05:12.204318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4acb165ed60e'
+down_revision: Union[str, Sequence[str], None] = '3f8da37049b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Suma și numărul rating-urilor: avg_rating se actualizează cu delte în O(1),
+    # fără AVG peste toate review-urile filmului la fiecare scriere
+    op.add_column("movies", sa.Column("rating_sum", sa.BigInteger(), nullable=False, server_default="0"))
+    op.add_column("movies", sa.Column("rating_count", sa.Integer(), nullable=False, server_default="0"))
+
+    # Backfill din reviews; avg_rating recalculat din aceleași totaluri
+    op.execute("""
+        UPDATE movies m
+        SET rating_sum = t.rating_sum,
+            rating_count = t.rating_count,
+            avg_rating = round(t.rating_sum::numeric / t.rating_count, 2)
+        FROM (
+            SELECT movie_id, sum(rating) AS rating_sum, count(rating) AS rating_count
+            FROM reviews
+            WHERE rating IS NOT NULL
+            GROUP BY movie_id
+        ) t
+        WHERE t.movie_id = m.id
+    """)
+    op.execute("UPDATE movies SET avg_rating = 0.0 WHERE rating_count = 0 AND avg_rating IS DISTINCT FROM 0.0")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("movies", "rating_count")
+    op.drop_column("movies", "rating_sum")
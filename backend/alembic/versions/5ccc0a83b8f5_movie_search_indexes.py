@@ -0,0 +1,51 @@
+"""movie full-text and trigram search
+
+Revision ID: 5ccc0a83b8f5
+Revises: 2fa16608fda0
+Create Date: 2026-10-17 11:48:05.117630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5ccc0a83b8f5'
+down_revision: Union[str, Sequence[str], None] = '2fa16608fda0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # tsvector generat (titlu cu pondere A, descriere B), ținut la zi de Postgres
+    op.execute(
+        """
+        ALTER TABLE movies ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+    op.create_index("ix_movies_search_vector", "movies", ["search_vector"], postgresql_using="gin")
+
+    # Trigram pe titlu: toleranță la typo (%) și ILIKE '%term%' indexat
+    op.create_index(
+        "ix_movies_title_trgm",
+        "movies",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_movies_title_trgm", table_name="movies")
+    op.drop_index("ix_movies_search_vector", table_name="movies")
+    op.drop_column("movies", "search_vector")
@@ -0,0 +1,32 @@
+"""review feed indexes
+
+Revision ID: a32ee138b6f8
+Revises: 3cbe95d2ccde
+Create Date: 2026-10-17 18:47:09.338105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a32ee138b6f8'
+down_revision: Union[str, Sequence[str], None] = '3cbe95d2ccde'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Paginarea keyset (created_at DESC, id DESC) pe /reviews/movie/{id}, /reviews/user/{id}
+    # și /reviews/me: filtrul și ordinea citite direct din index, fără Sort
+    op.create_index("ix_reviews_movie_created", "reviews", ["movie_id", "created_at", "id"])
+    op.create_index("ix_reviews_user_created", "reviews", ["user_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reviews_user_created", table_name="reviews")
+    op.drop_index("ix_reviews_movie_created", table_name="reviews")
@@ -0,0 +1,36 @@
+"""sync checkpoints
+
+Revision ID: c3a4d05c04ac
+Revises: 10890036401e
+Create Date: 2026-10-17 10:12:41.208311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a4d05c04ac'
+down_revision: Union[str, Sequence[str], None] = '10890036401e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "sync_checkpoints",
+        sa.Column("name", sa.String(length=50), primary_key=True),
+        sa.Column("synced_until", sa.Date(), nullable=True),
+        sa.Column("window_start", sa.Date(), nullable=True),
+        sa.Column("window_end", sa.Date(), nullable=True),
+        sa.Column("page", sa.Integer(), server_default="1", nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("sync_checkpoints")
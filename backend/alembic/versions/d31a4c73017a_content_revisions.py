@@ -0,0 +1,81 @@
+"""content revisions for etags
+
+Revision ID: d31a4c73017a
+Revises: eb6f1d135104
+Create Date: 2026-10-17 14:05:12.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd31a4c73017a'
+down_revision: Union[str, Sequence[str], None] = 'eb6f1d135104'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NEXT_REV = sa.text("nextval('content_rev_seq')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # O singură secvență globală: max(rev) peste un set de filme crește la orice
+    # modificare a oricărui film din set (cu contoare per rând nu ar fi garantat)
+    op.execute("CREATE SEQUENCE content_rev_seq")
+    op.add_column("movies", sa.Column("rev", sa.BigInteger(), nullable=False, server_default=NEXT_REV))
+    op.add_column("users", sa.Column("rev", sa.BigInteger(), nullable=False, server_default=NEXT_REV))
+
+    # Orice UPDATE pe movies (rating, sync TMDB, scripturi) primește un rev nou
+    op.execute("""
+        CREATE FUNCTION movies_bump_rev() RETURNS trigger AS $$
+        BEGIN
+            NEW.rev := nextval('content_rev_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER movies_bump_rev BEFORE UPDATE ON movies
+        FOR EACH ROW EXECUTE FUNCTION movies_bump_rev()
+    """)
+
+    # Watchlist / diary / reviews: rev-ul user-ului (și al filmului, pentru reviews)
+    op.execute("""
+        CREATE FUNCTION user_content_bump_rev() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE users SET rev = nextval('content_rev_seq') WHERE id = OLD.user_id;
+                IF TG_TABLE_NAME = 'reviews' THEN
+                    UPDATE movies SET rev = nextval('content_rev_seq') WHERE id = OLD.movie_id;
+                END IF;
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                UPDATE users SET rev = nextval('content_rev_seq') WHERE id = NEW.user_id;
+                IF TG_TABLE_NAME = 'reviews' THEN
+                    UPDATE movies SET rev = nextval('content_rev_seq') WHERE id = NEW.movie_id;
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in ("watchlist", "diary_entries", "reviews"):
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_rev AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION user_content_bump_rev()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ("watchlist", "diary_entries", "reviews"):
+        op.execute(f"DROP TRIGGER {table}_bump_rev ON {table}")
+    op.execute("DROP FUNCTION user_content_bump_rev()")
+    op.execute("DROP TRIGGER movies_bump_rev ON movies")
+    op.execute("DROP FUNCTION movies_bump_rev()")
+    op.drop_column("users", "rev")
+    op.drop_column("movies", "rev")
+    op.execute("DROP SEQUENCE content_rev_seq")
@@ -0,0 +1,46 @@
+"""movie rating stats
+
+Revision ID: d977056f0e0d
+Revises: 4acb165ed60e
+Create Date: 2026-10-17 17:12:48.619043
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd977056f0e0d'
+down_revision: Union[str, Sequence[str], None] = '4acb165ed60e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RATING_VALUES = range(1, 11)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "movie_rating_stats",
+        sa.Column("movie_id", sa.Integer(), sa.ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True),
+        *(sa.Column(f"rating_{v}", sa.Integer(), nullable=False, server_default="0") for v in RATING_VALUES),
+        sa.Column("review_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("spoiler_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Backfill: o singură trecere peste reviews
+    histogram = ", ".join(f"count(*) FILTER (WHERE rating = {v})" for v in RATING_VALUES)
+    columns = ", ".join(f"rating_{v}" for v in RATING_VALUES)
+    op.execute(f"""
+        INSERT INTO movie_rating_stats (movie_id, {columns}, review_count, spoiler_count)
+        SELECT movie_id, {histogram}, count(*), count(*) FILTER (WHERE is_spoiler)
+        FROM reviews
+        GROUP BY movie_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("movie_rating_stats")
@@ -0,0 +1,45 @@
+"""movie browse indexes
+
+Revision ID: eb6f1d135104
+Revises: 5ccc0a83b8f5
+Create Date: 2026-10-17 12:31:52.406117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'eb6f1d135104'
+down_revision: Union[str, Sequence[str], None] = '5ccc0a83b8f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Trebuie să fie identice cu movie_sort_keys() din app/routers/movies.py
+BROWSE_KEYS = [
+    sa.text("coalesce(popularity, -1.0) DESC"),
+    sa.text("coalesce(avg_rating, 0.0) DESC"),
+    sa.text("id DESC"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GET /movies și /movies/genre/{id}: ORDER BY ... LIMIT citit direct din index, fără sort
+    op.create_index("ix_movies_browse", "movies", BROWSE_KEYS)
+    # Aceeași ordine doar pentru filmele cu rating (filtrul min_rating > 0)
+    op.create_index("ix_movies_browse_rated", "movies", BROWSE_KEYS, postgresql_where=sa.text("avg_rating > 0"))
+    # Filtrul pe an e acum un interval pe release_date
+    op.create_index("ix_movies_release_date", "movies", ["release_date"])
+    # PK-ul e (movie_id, genre_id); join-ul pornește de la genre_id
+    op.create_index("ix_movie_genres_genre_id_movie_id", "movie_genres", ["genre_id", "movie_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_movie_genres_genre_id_movie_id", table_name="movie_genres")
+    op.drop_index("ix_movies_release_date", table_name="movies")
+    op.drop_index("ix_movies_browse_rated", table_name="movies")
+    op.drop_index("ix_movies_browse", table_name="movies")
@@ -9,5 +9,84 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60*24*7
 
 #TMDB API
 TMDB_API_KEY = os.getenv("TMDB_API_KEY", "c49fed62d5c0d6b9f5a6ea85623d828b")
-TMDB_BASE_URL = "https://api.themoviedb.org/3"
-TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
\ No newline at end of file
+# Poate fi suprascris cu un TMDB local (app/scripts/fake_tmdb.py) pentru benchmark
+TMDB_BASE_URL = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")
+TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
+
+# Bugetul de request-uri TMDB (~40 req/s per IP), folosit de token bucket la ingestie
+TMDB_RATE_LIMIT = float(os.getenv("TMDB_RATE_LIMIT", "40"))
+TMDB_RATE_BURST = int(os.getenv("TMDB_RATE_BURST", "20"))
+
+# Ingestie (populate_movies)
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "8"))
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "100"))
+
+# Cache persistent pe disc pentru răspunsurile TMDB (dezactivat dacă nu e setat)
+TMDB_CACHE_PATH = os.getenv("TMDB_CACHE_PATH")
+TMDB_CACHE_MAX_MB = int(os.getenv("TMDB_CACHE_MAX_MB", "512"))
+# Offline replay: servește doar din cache, fără niciun request la TMDB
+TMDB_OFFLINE = os.getenv("TMDB_OFFLINE", "0") == "1"
+
+# Clientul HTTP TMDB: pool keep-alive, timeout-uri, retry și circuit breaker
+TMDB_POOL_SIZE = int(os.getenv("TMDB_POOL_SIZE", "32"))
+TMDB_CONNECT_TIMEOUT = float(os.getenv("TMDB_CONNECT_TIMEOUT", "3.05"))
+TMDB_READ_TIMEOUT = float(os.getenv("TMDB_READ_TIMEOUT", "10"))
+TMDB_MAX_RETRIES = int(os.getenv("TMDB_MAX_RETRIES", "4"))
+TMDB_BACKOFF_BASE = float(os.getenv("TMDB_BACKOFF_BASE", "0.5"))
+TMDB_BACKOFF_MAX = float(os.getenv("TMDB_BACKOFF_MAX", "30"))
+TMDB_BREAKER_THRESHOLD = int(os.getenv("TMDB_BREAKER_THRESHOLD", "5"))
+TMDB_BREAKER_RESET = float(os.getenv("TMDB_BREAKER_RESET", "30"))
+
+# Sincronizare incrementală TMDB (movie/changes): prima rulare pornește de la azi - N zile
+TMDB_SYNC_INITIAL_DAYS = int(os.getenv("TMDB_SYNC_INITIAL_DAYS", "1"))
+
+# Importuri TMDB din POST /movies/ (executor dedicat, separat de threadpool-ul FastAPI)
+TMDB_IMPORT_WORKERS = int(os.getenv("TMDB_IMPORT_WORKERS", "8"))
+
+# Coada de importuri în background (POST /movies/?background=true)
+IMPORT_QUEUE_SIZE = int(os.getenv("IMPORT_QUEUE_SIZE", "1000"))
+IMPORT_QUEUE_WORKERS = int(os.getenv("IMPORT_QUEUE_WORKERS", "2"))
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "20"))
+# cât așteaptă un worker să se adune un batch după primul id
+IMPORT_BATCH_WAIT = float(os.getenv("IMPORT_BATCH_WAIT", "0.2"))
+# după atâtea încercări eșuate (scriere în DB, proces căzut) jobul devine "failed"
+IMPORT_MAX_ATTEMPTS = int(os.getenv("IMPORT_MAX_ATTEMPTS", "3"))
+# pauza (secunde, x numărul încercării) până la reluarea unui job eșuat
+IMPORT_RETRY_DELAY = float(os.getenv("IMPORT_RETRY_DELAY", "30"))
+
+# Indexul in-memory pentru GET /movies/suggest: cât de des preia filmele inserate / modificate de alte procese
+TITLE_INDEX_REFRESH = float(os.getenv("TITLE_INDEX_REFRESH", "60"))
+# reconstrucția completă a indexului (prinde și filmele șterse sau rev-urile commit-uite cu întârziere)
+TITLE_INDEX_REBUILD = float(os.getenv("TITLE_INDEX_REBUILD", "3600"))
+
+# Cache de răspunsuri pentru listele de filme / genuri (0 = dezactivat)
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "2000"))
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "60"))
+
+# Cât de des se reîmprospătează materialized view-ul movie_facets (GET /movies/facets)
+FACETS_REFRESH = float(os.getenv("FACETS_REFRESH", "300"))
+
+# Calea rapidă de serializare pentru liste (rânduri -> orjson, fără validare response_model)
+FAST_JSON_LISTS = os.getenv("FAST_JSON_LISTS", "false").lower() in ("1", "true", "yes")
+
+# Compresie gzip a răspunsurilor (GZIP_LEVEL=0 o dezactivează)
+GZIP_MIN_SIZE = int(os.getenv("GZIP_MIN_SIZE", "1000"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+
+# Agregarea scrierilor de rating (filme "fierbinți"): deltele se adună în memorie și se aplică
+# pe movies într-un singur UPDATE per film, la RATING_FLUSH_INTERVAL secunde sau la
+# RATING_FLUSH_SIZE delte, deci avg_rating e în urmă cu cel mult un interval
+RATING_AGGREGATOR = os.getenv("RATING_AGGREGATOR", "false").lower() in ("1", "true", "yes")
+RATING_FLUSH_INTERVAL = float(os.getenv("RATING_FLUSH_INTERVAL", "0.5"))
+RATING_FLUSH_SIZE = int(os.getenv("RATING_FLUSH_SIZE", "500"))
+
+# Leaderboard-uri (GET /movies/top-rated, /movies/trending): snapshot-uri în memorie, completate
+# incremental la LEADERBOARD_REFRESH secunde și reconstruite complet la LEADERBOARD_REBUILD secunde
+LEADERBOARD_REFRESH = float(os.getenv("LEADERBOARD_REFRESH", "60"))
+LEADERBOARD_REBUILD = float(os.getenv("LEADERBOARD_REBUILD", "3600"))
+LEADERBOARD_SIZE = int(os.getenv("LEADERBOARD_SIZE", "200"))
+# Top rated bayesian: câte voturi "virtuale" la media globală primește fiecare film
+LEADERBOARD_MIN_VOTES = int(os.getenv("LEADERBOARD_MIN_VOTES", "10"))
+# Trending: activitatea (review-uri, intrări în jurnal) pierde jumătate din pondere la fiecare half-life
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "72"))
+TRENDING_WINDOW_DAYS = int(os.getenv("TRENDING_WINDOW_DAYS", "14"))
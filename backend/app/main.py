@@ -1,19 +1,84 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware #Android app
+from fastapi.middleware.gzip import GZipMiddleware
 from app.routers import auth, movies, reviews, genres, watchlists, diary_entries
+from app.config import TITLE_INDEX_REFRESH, FACETS_REFRESH, LEADERBOARD_REFRESH, GZIP_MIN_SIZE, GZIP_LEVEL
+from app.database import SessionLocal
+from app.services.facets import facet_rollup
+from app.services.genre_cache import genre_cache
+from app.services.import_queue import import_queue
+from app.services.leaderboards import leaderboards
+from app.services.periodic import PeriodicTask
+from app.services.ratings import rating_aggregator
+from app.services.response_cache import response_cache
+from app.services.title_index import rebuild_title_index, catch_up_title_index
+from app.utils.msgpack_negotiation import MsgpackMiddleware
+from app.utils.pagination import NEXT_CURSOR_HEADER
+
+
+def _with_session(fn):
+    def run():
+        db = SessionLocal()
+        try:
+            fn(db)
+        finally:
+            db.close()
+    return run
+
+
+title_index_refresh = PeriodicTask("title-index-refresh", TITLE_INDEX_REFRESH, _with_session(catch_up_title_index))
+# Primul tick rulează imediat, ca /movies/facets să aibă date de la pornire
+facets_refresh = PeriodicTask("facets-refresh", FACETS_REFRESH, _with_session(facet_rollup.refresh), run_on_start=True)
+leaderboards_refresh = PeriodicTask(
+    "leaderboards-refresh", LEADERBOARD_REFRESH, _with_session(leaderboards.refresh), run_on_start=True
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Indexul de titluri pentru /movies/suggest se construiește o dată, apoi doar se completează
+    try:
+        _with_session(rebuild_title_index)()
+        genre_cache.reload()
+    except Exception as e:
+        print(f"✗ Title index / genre cache build failed: {e}")
+    title_index_refresh.start()
+    facets_refresh.start()
+    leaderboards_refresh.start()
+    # Workerii de import pornesc odată cu aplicația și termină batch-ul curent la oprire
+    import_queue.start()
+    # RATING_AGGREGATOR: deltele de rating rămase în buffer se aplică la oprire
+    rating_aggregator.start()
+    yield
+    import_queue.stop()
+    rating_aggregator.stop()
+    title_index_refresh.stop()
+    facets_refresh.stop()
+    leaderboards_refresh.stop()
+
 
 app = FastAPI(
     title="Movie Review API",
     description="API pentru aplicația de review-uri filme",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Ordinea contează: ultimul adăugat e cel mai din exterior.
+# Accept: application/msgpack -> corpul JSON re-encodat ca MessagePack
+app.add_middleware(MsgpackMiddleware)
+# gzip peste reprezentarea finală (JSON sau msgpack), doar peste GZIP_MIN_SIZE bytes
+if GZIP_LEVEL > 0:
+    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_LEVEL)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include routers
@@ -27,3 +92,8 @@ app.include_router(diary_entries.router)
 @app.get("/")
 def root():
     return {"message": "Movie Review API", "status": "running"}
+
+@app.get("/cache/stats")
+def cache_stats():
+    """Hit/miss pentru response cache-ul listelor de filme și genuri (per proces)"""
+    return response_cache.snapshot()
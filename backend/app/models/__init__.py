@@ -4,8 +4,11 @@ from .genre import Genre
 from .review import Review
 from .watchlist import Watchlist
 from .diary_entry import DiaryEntry
+from .sync_checkpoint import SyncCheckpoint
+from .import_job import ImportJob
+from .movie_rating_stats import MovieRatingStats
 
 # Import Base pentru a putea crea tabelele
 from app.database import Base
 
-__all__ = ["User", "Movie", "Genre", "Review", "Watchlist", "Base", "DiaryEntry"]
\ No newline at end of file
+__all__ = ["User", "Movie", "Genre", "Review", "Watchlist", "Base", "DiaryEntry", "SyncCheckpoint", "ImportJob", "MovieRatingStats"]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -22,4 +22,9 @@ class MovieGenre(Base):
     genre_id = Column(Integer, ForeignKey("genres.id", ondelete="CASCADE"), primary_key=True)
     
     movie = relationship("Movie", back_populates="genres")
-    genre = relationship("Genre", back_populates="movies")
\ No newline at end of file
+    genre = relationship("Genre", back_populates="movies")
+
+    # browse pe gen: pornește de la genre_id (PK-ul e movie_id, genre_id)
+    __table_args__ = (
+        Index("ix_movie_genres_genre_id_movie_id", "genre_id", "movie_id"),
+    )
\ No newline at end of file
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, ForeignKey
+from datetime import datetime
+from app.database import Base
+
+
+class ImportJob(Base):
+    """
+    Import TMDB asincron (POST /movies/?background=true).
+    status: "queued" | "running" | "done" | "failed"
+    attempts: de câte ori a fost preluat de un worker (plafonat de IMPORT_MAX_ATTEMPTS)
+    run_after: un job "queued" reluat după un eșec nu e preluat înainte de acest moment
+    """
+    __tablename__ = "import_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tmdb_id = Column(Integer, nullable=False, index=True)
+    status = Column(String(10), nullable=False, server_default="queued", index=True)
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="SET NULL"), nullable=True)
+    error = Column(Text)
+    attempts = Column(Integer, nullable=False, server_default="0")
+    run_after = Column(TIMESTAMP, nullable=True)
+    created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
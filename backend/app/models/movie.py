@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, Date, Float, TIMESTAMP
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, BigInteger, Integer, String, Text, Date, Float, TIMESTAMP, Computed, FetchedValue, Index, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 from app.database import Base
 
@@ -15,9 +16,44 @@ class Movie(Base):
     poster_url = Column(Text)
     popularity = Column(Float)
     avg_rating = Column(Float, default=0.0)
+    # Totalurile din care e derivat avg_rating; actualizate cu delte (app/services/ratings.py)
+    rating_sum = Column(BigInteger, nullable=False, server_default="0")
+    rating_count = Column(Integer, nullable=False, server_default="0")
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    # Versiune pentru ETag-uri: nextval('content_rev_seq') la insert și (prin trigger) la orice update
+    rev = Column(
+        BigInteger, nullable=False,
+        server_default=text("nextval('content_rev_seq')"), server_onupdate=FetchedValue(),
+    )
+    # Full-text search (titlu + descriere), generat de Postgres; deferred ca să nu fie încărcat în liste
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    ))
     
     reviews = relationship("Review", back_populates="movie", cascade="all, delete-orphan")
     genres = relationship("MovieGenre", back_populates="movie", cascade="all, delete-orphan")
     watchlist_items = relationship("Watchlist", back_populates="movie", cascade="all, delete-orphan")
-    diary_entries = relationship("DiaryEntry", back_populates="movie", cascade="all, delete-orphan")
\ No newline at end of file
+    diary_entries = relationship("DiaryEntry", back_populates="movie", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Ordinea de browse din movie_sort_keys() (app/routers/movies.py)
+        Index(
+            "ix_movies_browse",
+            text("coalesce(popularity, -1.0) DESC"), text("id DESC"),
+        ),
+        Index(
+            "ix_movies_browse_rated",
+            text("coalesce(popularity, -1.0) DESC"), text("id DESC"),
+            postgresql_where=text("avg_rating > 0"),
+        ),
+        Index("ix_movies_release_date", "release_date"),
+        # refresh-ul incremental al leaderboard-urilor (filmele cu rev > watermark)
+        Index("ix_movies_rev", "rev"),
+        Index("ix_movies_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_movies_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
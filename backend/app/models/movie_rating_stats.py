@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from app.database import Base
+
+# Coloanele histogramei: rating_1 .. rating_10 = numărul de review-uri cu acel rating
+RATING_VALUES = range(1, 11)
+HISTOGRAM_COLUMNS = tuple(f"rating_{value}" for value in RATING_VALUES)
+STATS_COLUMNS = HISTOGRAM_COLUMNS + ("review_count", "spoiler_count")
+
+
+class MovieRatingStats(Base):
+    """
+    Distribuția rating-urilor unui film, întreținută incremental de scrierile
+    de review (app/services/ratings.py), ca GET /movies/{id}/stats să fie un
+    lookup pe PK, fără GROUP BY pe reviews. Lipsa rândului = niciun review.
+    """
+    __tablename__ = "movie_rating_stats"
+
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    rating_1 = Column(Integer, nullable=False, default=0)
+    rating_2 = Column(Integer, nullable=False, default=0)
+    rating_3 = Column(Integer, nullable=False, default=0)
+    rating_4 = Column(Integer, nullable=False, default=0)
+    rating_5 = Column(Integer, nullable=False, default=0)
+    rating_6 = Column(Integer, nullable=False, default=0)
+    rating_7 = Column(Integer, nullable=False, default=0)
+    rating_8 = Column(Integer, nullable=False, default=0)
+    rating_9 = Column(Integer, nullable=False, default=0)
+    rating_10 = Column(Integer, nullable=False, default=0)
+    # toate review-urile (și cele fără rating, doar cu comentariu)
+    review_count = Column(Integer, nullable=False, default=0)
+    spoiler_count = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, Boolean, TIMESTAMP, ForeignKey, CheckConstraint
+from sqlalchemy import Column, BigInteger, Integer, Text, Boolean, TIMESTAMP, ForeignKey, CheckConstraint, FetchedValue, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -24,7 +24,20 @@ class Review(Base):
     rating = Column(Integer, CheckConstraint("rating >= 1 AND rating <= 10"))
     comment = Column(Text)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    # Versiune pentru ETag-ul listei per film: nextval('content_rev_seq') la insert și (prin trigger) la update
+    rev = Column(
+        BigInteger, nullable=False,
+        server_default=text("nextval('content_rev_seq')"), server_onupdate=FetchedValue(),
+    )
 
     user = relationship("User", back_populates="reviews")
     movie = relationship("Movie", back_populates="reviews")
-    diary_entry = relationship("DiaryEntry", back_populates="review")
\ No newline at end of file
+    diary_entry = relationship("DiaryEntry", back_populates="review")
+
+    # Listele de reviews per film / user, paginate keyset pe (created_at, id)
+    __table_args__ = (
+        Index("ix_reviews_movie_created", "movie_id", "created_at", "id"),
+        Index("ix_reviews_user_created", "user_id", "created_at", "id"),
+        # ETag-ul pentru /reviews/movie/{id}: max(rev) și count fără să atingem movies
+        Index("ix_reviews_movie_rev", "movie_id", "rev"),
+    )
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, Date, TIMESTAMP
+from datetime import datetime
+from app.database import Base
+
+
+class SyncCheckpoint(Base):
+    """
+    Cursorul persistent al sincronizărilor incrementale (ex. TMDB changes).
+    Un rând per job; permite reluarea unui run căzut de la pagina la care a rămas.
+    """
+    __tablename__ = "sync_checkpoints"
+
+    name = Column(String(50), primary_key=True)
+    # tot ce e până la această dată (exclusiv) e sincronizat
+    synced_until = Column(Date)
+    # fereastra în curs [window_start, window_end) și următoarea pagină de procesat
+    window_start = Column(Date)
+    window_end = Column(Date)
+    page = Column(Integer, nullable=False, default=1)
+    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)
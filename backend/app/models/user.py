@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP
+from sqlalchemy import Column, BigInteger, Integer, String, Text, TIMESTAMP, FetchedValue, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -13,6 +13,11 @@ class User(Base):
     password_hash = Column(Text, nullable=False)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
     role = Column(String(10), nullable=False, server_default="user")  # "user" | "mod" | "admin"
+    # Versiune pentru ETag-uri; triggerii pe watchlist / diary_entries / reviews o cresc
+    rev = Column(
+        BigInteger, nullable=False,
+        server_default=text("nextval('content_rev_seq')"), server_onupdate=FetchedValue(),
+    )
     
     reviews = relationship("Review", back_populates="user", cascade="all, delete-orphan")
     watchlist_items = relationship("Watchlist", back_populates="user", cascade="all, delete-orphan")
@@ -1,5 +1,5 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
 
@@ -10,18 +10,17 @@ from app.models.user import User
 from app.models.movie import Movie
 from app.schemas.diary_entry import DiaryCreate, DiaryUpdate, DiaryOut, DiaryCountOut
 from app.routers.auth import get_current_user
+from app.services.catalog_events import movie_rating_changed
+from app.services.list_rows import diary_columns, diary_dicts, resolve_movie_genres
+from app.services.ratings import apply_review_change, review_state
+from app.utils.etag import conditional, request_etag
+from app.utils.fast_json import dumps, fast_lists
+from app.utils.fields import projected_response
+from app.utils.pagination import keyset_page, set_next_cursor
 
 router = APIRouter(prefix="/diary", tags=["diary"])
 
 
-def update_movie_avg_rating(db: Session, movie_id: int):
-    avg_rating = db.query(func.avg(Review.rating)).filter(Review.movie_id == movie_id).scalar() or 0.0
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
-    if movie:
-        movie.avg_rating = round(avg_rating, 2)
-        db.commit()
-
-
 @router.post("/", response_model=DiaryOut, status_code=status.HTTP_201_CREATED)
 def add_to_diary(
     payload: DiaryCreate,
@@ -38,10 +37,10 @@ def add_to_diary(
         watched_on=payload.watched_on,
     )
     db.add(entry)
-    db.commit()
-    db.refresh(entry)
+    db.flush()  # entry.id pentru review, fără commit separat
 
     # create review bound to this diary entry if user sent rating/comment
+    rating_changed = False
     if payload.rating is not None or payload.comment is not None:
         review = Review(
             user_id=current_user.id,
@@ -51,38 +50,71 @@ def add_to_diary(
             comment=payload.comment,
         )
         db.add(review)
-        db.commit()
-        update_movie_avg_rating(db, payload.movie_id)
+        rating_changed = apply_review_change(db, payload.movie_id, None, review_state(review))
+    db.commit()
+    if rating_changed:
+        movie_rating_changed(payload.movie_id)
 
     # RELOAD cu relationships pentru response embedded
     entry = (
         db.query(DiaryEntry)
-        .options(joinedload(DiaryEntry.movie), joinedload(DiaryEntry.review))
+        .options(joinedload(DiaryEntry.movie).selectinload(Movie.genres), joinedload(DiaryEntry.review))
         .filter(DiaryEntry.id == entry.id)
         .first()
     )
+    resolve_movie_genres([entry.movie])
     return entry
 
 
 @router.get("/me", response_model=List[DiaryOut])
 def get_my_diary(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    entries = (
+    # ETag: rev-ul user-ului (intrări + review-urile lui) + cel mai nou rev dintre filmele din jurnal
+    movies_rev = (
+        db.query(func.max(Movie.rev))
+        .join(DiaryEntry, DiaryEntry.movie_id == Movie.id)
+        .filter(DiaryEntry.user_id == current_user.id)
+        .scalar()
+    )
+    etag = request_etag(request, current_user.id, current_user.rev, movies_rev)
+    not_modified = conditional(request, response, etag, private=True)
+    if not_modified is not None:
+        return not_modified
+
+    # watched_on, apoi ordinea adăugării (created_at), id ca tiebreak
+    sort_keys = [DiaryEntry.watched_on, DiaryEntry.created_at, DiaryEntry.id]
+
+    if fast_lists.enabled:
+        # Calea rapidă: un singur SELECT pe coloane (intrare + film + review), fără obiecte ORM
+        head = ("id", "user_id", "watched_on", "created_at")
+        query = (
+            db.query(*diary_columns([getattr(DiaryEntry, name) for name in head]))
+            .join(Movie, Movie.id == DiaryEntry.movie_id)
+            .outerjoin(Review, Review.diary_entry_id == DiaryEntry.id)
+            .filter(DiaryEntry.user_id == current_user.id)
+        )
+        rows, next_cursor = keyset_page(query, sort_keys, limit, cursor=cursor, skip=skip)
+        set_next_cursor(response, next_cursor)
+        return projected_response(response, dumps(diary_dicts(db, rows, head)))
+
+    query = (
         db.query(DiaryEntry)
         .options(
-            joinedload(DiaryEntry.movie),
+            joinedload(DiaryEntry.movie).selectinload(Movie.genres),
             joinedload(DiaryEntry.review),
         )
         .filter(DiaryEntry.user_id == current_user.id)
-        .order_by(DiaryEntry.watched_on.desc(), DiaryEntry.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    entries, next_cursor = keyset_page(query, sort_keys, limit, cursor=cursor, skip=skip)
+    resolve_movie_genres(e.movie for e in entries)
+    set_next_cursor(response, next_cursor)
     return entries
 
 
@@ -104,9 +136,11 @@ def update_diary_entry(
         entry.watched_on = payload.watched_on
 
     fields = payload.model_fields_set  # pydantic v2
+    rating_changed = False
 
     if "rating" in fields or "comment" in fields:
-        review = db.query(Review).filter(Review.diary_entry_id == entry.id).first()
+        review = db.query(Review).filter(Review.diary_entry_id == entry.id).with_for_update().first()
+        old_state = review_state(review)
 
         if not review:
             # creezi review doar dacă măcar unul e non-null
@@ -128,18 +162,21 @@ def update_diary_entry(
             # dacă după update ambele sunt None/empty → ștergi review-ul
             if review.rating is None and (review.comment is None or review.comment.strip() == ""):
                 db.delete(review)
+                review = None
 
-        db.commit()
-        update_movie_avg_rating(db, entry.movie_id)
+        rating_changed = apply_review_change(db, entry.movie_id, old_state, review_state(review))
 
     db.commit()
+    if rating_changed:
+        movie_rating_changed(entry.movie_id)
 
     entry = (
         db.query(DiaryEntry)
-        .options(joinedload(DiaryEntry.movie), joinedload(DiaryEntry.review))
+        .options(joinedload(DiaryEntry.movie).selectinload(Movie.genres), joinedload(DiaryEntry.review))
         .filter(DiaryEntry.id == entry_id)
         .first()
     )
+    resolve_movie_genres([entry.movie])
     return entry
 
 
@@ -156,20 +193,28 @@ def delete_diary_entry(
         raise HTTPException(status_code=403, detail="Forbidden")
 
     movie_id = entry.movie_id
+    # review-ul legat se șterge prin ondelete=CASCADE; rating-ul lui iese din totaluri
+    review = db.query(Review).filter(Review.diary_entry_id == entry.id).with_for_update().first()
+    rating_changed = apply_review_change(db, movie_id, review_state(review), None)
     db.delete(entry)
     db.commit()
-
-    # dacă ai ondelete=CASCADE pe review.diary_entry_id, review se șterge automat,
-    # dar avg_rating trebuie recalculat
-    update_movie_avg_rating(db, movie_id)
+    if rating_changed:
+        movie_rating_changed(movie_id)
     return None
 
 
 @router.get("/me/count", response_model=DiaryCountOut)
 def get_my_diary_count(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
+    etag = request_etag(request, current_user.id, current_user.rev)
+    not_modified = conditional(request, response, etag, private=True)
+    if not_modified is not None:
+        return not_modified
+
     count = (
         db.query(func.count(DiaryEntry.id))
         .filter(DiaryEntry.user_id == current_user.id)
@@ -1,18 +1,28 @@
 # backend/app/routers/genres.py
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.genre import Genre
 from app.schemas.genre import GenreOut
+from app.services.catalog_events import GENRES
+from app.services.response_cache import response_cache, render_json
 
 router = APIRouter(prefix="/genres", tags=["genres"])
 
+genre_list_adapter = TypeAdapter(List[GenreOut])
+
 @router.get("/", response_model=List[GenreOut])
-def get_genres(db: Session = Depends(get_db)):
+def get_genres(request: Request, db: Session = Depends(get_db)):
     """Listă toate genurile (pentru filtre în UI)"""
+    cached = response_cache.get(request)
+    if cached is not None:
+        return cached
+
+    epoch = response_cache.epoch
     genres = db.query(Genre).order_by(Genre.name).all()
-    return genres
+    return response_cache.put(request, render_json(genre_list_adapter, genres), [GENRES], epoch)
 
 @router.get("/{genre_id}", response_model=GenreOut)
 def get_genre(genre_id: int, db: Session = Depends(get_db)):
@@ -1,131 +1,485 @@
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+import requests
+from datetime import date
+from typing import Callable, Optional, List, Tuple
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, Query as QueryType, selectinload
+from sqlalchemy import func, or_, cast, Float
 from app.database import get_db
 from app.models.movie import Movie
 from app.models.genre import Genre, MovieGenre
-from app.schemas.movie import MovieOut, MovieImport
-from app.services.tmdb import tmdb_service
+from app.models.import_job import ImportJob
+from app.models.movie_rating_stats import MovieRatingStats, RATING_VALUES, STATS_COLUMNS
+from app.schemas.movie import (
+    MovieOut, MovieImport, MovieSuggestionOut, MovieFacetsOut, MovieBatchRequest, MovieBatchOut, MovieStatsOut,
+    LeaderboardOut,
+)
+from app.schemas.import_job import ImportJobOut
+from app.services.catalog_events import MOVIE_LISTS, RATED_MOVIE_LISTS, movie_tag
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.movie_import import import_movie
+from app.services.facets import facet_rollup
+from app.services.import_queue import import_queue, ImportQueueFull
+from app.services.leaderboards import LEADERBOARDS, Ranking, leaderboards
+from app.services.genre_cache import genre_cache
+from app.services.list_rows import MOVIE_COLUMNS, attach_genres, movie_columns, resolve_movie_genres, to_dicts
+from app.services.response_cache import response_cache, render_json
+from app.services.title_index import title_index
+from app.utils.fast_json import dumps, fast_lists
+from app.utils.fields import Fields, column_options, parse_fields, project, render_projection
+from app.utils.pagination import NEXT_CURSOR_HEADER, keyset_page
 
 
 router = APIRouter(prefix="/movies", tags=["movies"])
 
+movie_adapter = TypeAdapter(MovieOut)
+movie_list_adapter = TypeAdapter(List[MovieOut])
+leaderboard_adapter = TypeAdapter(LeaderboardOut)
+
+# fields= pe liste: câmpurile din MovieOut sau preset-ul "card" (ce randează un card de film)
+MOVIE_FIELDS = tuple(MovieOut.model_fields)
+MOVIE_PRESETS = {"card": ("id", "title", "release_date", "poster_url", "avg_rating")}
+FIELDS_DESCRIPTION = "Comma-separated fields to return, or 'card'; full objects when omitted"
+
+# Limita pentru GET/POST /movies/batch (un singur IN (...))
+MAX_BATCH_IDS = 300
+
+
+def movie_sort_keys() -> list:
+    """
+    Cheia de sortare pentru listele de filme (toate DESC): popularitate, id.
+    NULL-urile sunt coalesce-uite ca să se comporte ca NULLS LAST și în comparația keyset.
+    Fără avg_rating: o schimbare de rating nu mută filmul între paginile din
+    response cache, deci ajunge invalidarea pe tag-ul filmului.
+    """
+    return [
+        func.coalesce(Movie.popularity, -1.0),
+        Movie.id,
+    ]
+
+
+def movie_load_options(fields: Optional[Fields] = None) -> list:
+    """Coloanele încărcate pentru o listă: toate + genurile, sau doar cele din `fields`"""
+    if fields is None:
+        return [selectinload(Movie.genres)]
+    options = column_options(Movie, fields, relationships=("genres",))
+    if "genres" in fields:
+        options.append(selectinload(Movie.genres))
+    return options
+
+
+def render_movies(movies: list, fields: Optional[Fields] = None) -> bytes:
+    if fields is None:
+        resolve_movie_genres(movies)
+        return render_json(movie_list_adapter, movies)
+    computed = {"genres": lambda m: genre_cache.genres(g.genre_id for g in m.genres)}
+    return render_projection(project(m, fields, computed) for m in movies)
+
+
+def movie_list_query(
+    db: Session,
+    genre_id: Optional[int] = None,
+    year: Optional[int] = None,
+    min_rating: Optional[float] = None,
+    search: Optional[str] = None,
+    fields: Optional[Fields] = None,
+) -> Tuple[QueryType, list]:
+    """
+    Query-ul de browse pentru GET /movies cu filtrele aplicate + cheia de sortare.
+    Folosit și de app/scripts/check_query_plans.py, ca verificarea EXPLAIN să
+    ruleze exact SQL-ul din endpoint.
+    """
+    # genurile paginii vin într-un singur SELECT ... IN, nu lazy per film;
+    # cu `fields`, coloanele necerute (ex. description) nu sunt selectate deloc
+    query = db.query(Movie).options(*movie_load_options(fields))
+
+    # many-to-many MovieGenre (PK-ul secundar ix_movie_genres_genre_id_movie_id)
+    if genre_id:
+        query = query.join(MovieGenre).filter(MovieGenre.genre_id == genre_id)
+    
+    if year:
+        # interval de date în loc de extract(year) -> poate folosi indexul pe release_date
+        query = query.filter(
+            Movie.release_date >= date(year, 1, 1),
+            Movie.release_date < date(year + 1, 1, 1),
+        )
+    
+    if min_rating is not None:
+        query = query.filter(Movie.avg_rating >= min_rating)
+    
+    sort_keys = movie_sort_keys()
+
+    if search:
+        # Full-text (GIN pe search_vector) + trigram pe titlu (typo-uri și substring, GIN gin_trgm_ops)
+        ts_query = func.websearch_to_tsquery("english", search)
+        query = query.filter(or_(
+            Movie.search_vector.op("@@")(ts_query),
+            Movie.title.op("%")(search),
+            Movie.title.ilike(f"%{search}%"),
+        ))
+        relevance = func.ts_rank_cd(Movie.search_vector, ts_query) + func.similarity(Movie.title, search)
+        # float8 ca valoarea din cursor să se compare exact
+        sort_keys.insert(0, cast(relevance, Float))
+
+    return query, sort_keys
+
+
+def movie_page(
+    db: Session,
+    query: QueryType,
+    sort_keys: list,
+    limit: int,
+    cursor: Optional[str],
+    skip: int,
+    fields: Optional[Fields] = None,
+) -> Tuple[bytes, List[int], Optional[str]]:
+    """
+    O pagină de filme serializată: (body, movie_ids, next_cursor). Pe calea
+    rapidă (fast_lists) rândurile sunt tuple de coloane, transformate direct în
+    dict-uri + orjson, fără obiecte ORM și fără validarea MovieOut.
+    """
+    if fast_lists.enabled:
+        names = movie_columns(fields)
+        rows, next_cursor = keyset_page(
+            query.with_entities(*(MOVIE_COLUMNS[n] for n in names)), sort_keys, limit, cursor=cursor, skip=skip
+        )
+        movies = to_dicts(rows, names)
+        if fields is None or "genres" in fields:
+            attach_genres(db, movies)
+        return dumps(movies), [m["id"] for m in movies], next_cursor
+
+    movies, next_cursor = keyset_page(query, sort_keys, limit, cursor=cursor, skip=skip)
+    return render_movies(movies, fields), [m.id for m in movies], next_cursor
+
+
+def cached_movie_list(
+    request: Request,
+    load_page: Callable[[], Tuple[bytes, List[int], Optional[str]]],
+    rated: bool = False,
+) -> Response:
+    """
+    Pagină de filme prin response cache; `load_page` (vezi movie_page) rulează
+    doar la miss. Intrarea e etichetată cu fiecare film din pagină, deci o
+    schimbare de rating invalidează doar paginile care îl conțin (plus cele
+    filtrate după min_rating, când `rated`).
+    """
+    cached = response_cache.get(request)
+    if cached is not None:
+        return cached
+
+    epoch = response_cache.epoch
+    body, movie_ids, next_cursor = load_page()
+    tags = [MOVIE_LISTS, *(movie_tag(movie_id) for movie_id in movie_ids)]
+    if rated:
+        tags.append(RATED_MOVIE_LISTS)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    return response_cache.put(request, body, tags, epoch, headers)
+
+
 @router.get("/", response_model=List[MovieOut])
 def get_movies(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=0, le=100, description="Number of records to return"),
     genre_id: Optional[int] = Query(None, description="Filter by genre ID"),
-    year: Optional[int] = Query(None, description="Filter by release year"),
+    year: Optional[int] = Query(None, ge=1, le=9998, description="Filter by release year"),
     min_rating: Optional[float] = Query(None, ge=0, le=10, description="Minimum average rating"),
     search: Optional[str] = Query(None, description="Search by title"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
-    """Listă filme cu paginare și filtre"""
-    query = db.query(Movie)
-
+    """Listă filme cu paginare (keyset prin cursor, sau skip) și filtre"""
     # hardcodat pt a evita http 422, nu ramane asa
     if limit == 0:
         limit = 51
-    
-    # many-to-many MovieGenre
-    if genre_id:
-        query = query.join(MovieGenre).filter(MovieGenre.genre_id == genre_id)
-    
-    if year:
-        query = query.filter(
-            func.extract('year', Movie.release_date) == year
+    projection = parse_fields(fields, MOVIE_FIELDS, MOVIE_PRESETS)
+
+    def load_page():
+        query, sort_keys = movie_list_query(
+            db, genre_id=genre_id, year=year, min_rating=min_rating, search=search, fields=projection
         )
-    
-    if min_rating is not None:
-        query = query.filter(Movie.avg_rating >= min_rating)
-    
-    if search:
-        query = query.filter(Movie.title.ilike(f"%{search}%"))
-    
-    movies = query.order_by(Movie.popularity.desc().nullslast(), Movie.avg_rating.desc()).offset(skip).limit(limit).all()
-    return movies
+        return movie_page(db, query, sort_keys, limit, cursor, skip, projection)
+
+    return cached_movie_list(request, load_page, rated=min_rating is not None)
+
+@router.get("/suggest", response_model=List[MovieSuggestionOut])
+def suggest_movies(
+    q: str = Query(..., min_length=1, max_length=100, description="Title prefix typed so far"),
+    limit: int = Query(10, ge=1, le=25),
+):
+    """Autocomplete pe titlu, servit din indexul in-memory (fără query în DB)"""
+    return title_index.suggest(q, limit)
+
+@router.get("/facets", response_model=MovieFacetsOut)
+def get_movie_facets(
+    genre_id: Optional[int] = Query(None, description="Filter by genre ID"),
+    year: Optional[int] = Query(None, ge=1, le=9998, description="Filter by release year"),
+    min_rating: Optional[int] = Query(None, ge=0, le=10, description="Minimum average rating (whole points)"),
+):
+    """
+    Numărători per gen / an / bucket de rating pentru filtrele curente, din
+    rollup-ul movie_facets (reîmprospătat periodic, deci poate întârzia puțin
+    față de GET /movies). Căutarea după titlu nu are fațete.
+    """
+    return facet_rollup.facets(genre_id=genre_id, year=year, min_rating=min_rating)
+
+def leaderboard_page(request: Request, db: Session, ranking: Ranking, skip: int, limit: int) -> Response:
+    """
+    O pagină din snapshot-ul in-memory al unui leaderboard. La miss în
+    response cache, filmele paginii sunt încărcate cu un singur SELECT pe PK;
+    intrarea e invalidată la următorul snapshot sau când se schimbă un film.
+    """
+    cached = response_cache.get(request)
+    if cached is not None:
+        return cached
+
+    epoch = response_cache.epoch
+    refreshed_at = leaderboards.refreshed_at
+    page = ranking[skip:skip + limit]
+    ids = [movie_id for movie_id, _ in page]
+    found = {
+        m.id: m for m in db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.id.in_(ids)).all()
+    } if ids else {}
+    resolve_movie_genres(found.values())
+    items = [
+        {"rank": skip + i + 1, "score": round(score, 4), "movie": found[movie_id]}
+        for i, (movie_id, score) in enumerate(page)
+        if movie_id in found
+    ]
+    body = render_json(leaderboard_adapter, {"items": items, "refreshed_at": refreshed_at})
+    return response_cache.put(request, body, [LEADERBOARDS, *(movie_tag(movie_id) for movie_id in ids)], epoch)
+
+@router.get("/top-rated", response_model=LeaderboardOut)
+def get_top_rated(
+    request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """Top rated după media bayesiană (filmele cu puține note trag spre media globală)"""
+    return leaderboard_page(request, db, leaderboards.top_rated, skip, limit)
+
+@router.get("/trending", response_model=LeaderboardOut)
+def get_trending(
+    request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """Filmele cu cea mai multă activitate recentă (review-uri, jurnal), cu decădere în timp"""
+    return leaderboard_page(request, db, leaderboards.trending, skip, limit)
+
+def movies_by_ids(db: Session, ids: List[int]) -> dict:
+    """Un singur SELECT ... WHERE id IN (...); ordinea cerută e păstrată, duplicatele ignorate"""
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_IDS} ids per request"
+        )
+
+    found = {
+        m.id: m for m in db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.id.in_(ids)).all()
+    } if ids else {}
+    resolve_movie_genres(found.values())
+    return {
+        "items": [found[i] for i in ids if i in found],
+        "missing": [i for i in ids if i not in found],
+    }
+
+@router.get("/batch", response_model=MovieBatchOut)
+def get_movies_batch(
+    ids: List[str] = Query(..., description="Movie IDs, comma-separated (ids=1,2,3) or repeated (ids=1&ids=2)"),
+    db: Session = Depends(get_db)
+):
+    """Mai multe filme după ID într-un singur request (ex. ecranele de diary / watchlist)"""
+    try:
+        parsed = [int(part) for value in ids for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be integers"
+        )
+    return movies_by_ids(db, parsed)
+
+@router.post("/batch", response_model=MovieBatchOut)
+def post_movies_batch(payload: MovieBatchRequest, db: Session = Depends(get_db)):
+    """Varianta POST pentru liste lungi de ID-uri (URL-uri prea lungi pe GET)"""
+    return movies_by_ids(db, payload.ids)
 
 @router.get("/{movie_id}", response_model=MovieOut)
-def get_movie_by_id(movie_id: int, db: Session = Depends(get_db)):
+def get_movie_by_id(movie_id: int, request: Request, db: Session = Depends(get_db)):
     """Obține film după ID"""
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
+    cached = response_cache.get(request)
+    if cached is not None:
+        return cached
+
+    epoch = response_cache.epoch
+    movie = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.id == movie_id).first()
     if not movie:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Movie with id {movie_id} not found"
         )
-    return movie
+    resolve_movie_genres([movie])
+    return response_cache.put(request, render_json(movie_adapter, movie), [movie_tag(movie.id)], epoch)
+
+@router.get("/{movie_id}/stats", response_model=MovieStatsOut)
+def get_movie_stats(movie_id: int, db: Session = Depends(get_db)):
+    """Distribuția rating-urilor: un lookup pe PK în movies + movie_rating_stats, fără GROUP BY pe reviews"""
+    row = (
+        db.query(Movie.avg_rating, *(getattr(MovieRatingStats, column) for column in STATS_COLUMNS))
+        .outerjoin(MovieRatingStats, MovieRatingStats.movie_id == Movie.id)
+        .filter(Movie.id == movie_id)
+        .first()
+    )
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Movie with id {movie_id} not found"
+        )
+    # fără rând în movie_rating_stats = niciun review
+    stats = {column: value or 0 for column, value in zip(STATS_COLUMNS, row[1:])}
+    histogram = [{"rating": value, "count": stats[f"rating_{value}"]} for value in RATING_VALUES]
+    return {
+        "movie_id": movie_id,
+        "avg_rating": row.avg_rating or 0.0,
+        "rating_count": sum(bucket["count"] for bucket in histogram),
+        "review_count": stats["review_count"],
+        "spoiler_count": stats["spoiler_count"],
+        "histogram": histogram,
+    }
 
 @router.get("/tmdb/{tmdb_id}", response_model=MovieOut)
 def get_movie_by_tmdb_id(tmdb_id: int, db: Session = Depends(get_db)):
     """Obține film după TMDB ID"""
-    movie = db.query(Movie).filter(Movie.tmdb_id == tmdb_id).first()
+    movie = db.query(Movie).options(selectinload(Movie.genres)).filter(Movie.tmdb_id == tmdb_id).first()
     if not movie:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Movie with TMDB id {tmdb_id} not found"
         )
+    resolve_movie_genres([movie])
     return movie
 
-@router.post("/", response_model=MovieOut)
-def create_movie(movie_data: MovieImport, db: Session = Depends(get_db)):
-    """Importă film din TMDB după tmdb_id (fără creare manuală)"""
+@router.post(
+    "/",
+    response_model=MovieOut,
+    responses={202: {"model": ImportJobOut, "description": "Import queued (background=true)"}},
+)
+async def create_movie(
+    movie_data: MovieImport,
+    background: bool = Query(False, description="Enqueue the import and return 202 with a job id"),
+    db: Session = Depends(get_db),
+):
+    """
+    Importă film din TMDB după tmdb_id (fără creare manuală).
+    Importurile concurente ale aceluiași tmdb_id împart un singur fetch,
+    iar request-ul TMDB nu ține ocupat un thread din pool-ul FastAPI.
+
+    Cu background=true importul intră în coada de joburi și răspunsul e
+    202 + job-ul; statusul se urmărește la GET /movies/import-jobs/{id}.
+    """
+    if background:
+        try:
+            job = await run_in_threadpool(import_queue.submit, db, movie_data.tmdb_id)
+        except ImportQueueFull:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Import queue is full",
+                headers={"Retry-After": "5"},
+            )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=jsonable_encoder(ImportJobOut.model_validate(job)),
+            headers={"Location": f"/movies/import-jobs/{job.id}"},
+        )
+
+    def find_movie():
+        # genurile încărcate și rezolvate aici: serializarea rulează pe event loop, fără I/O
+        movie = (
+            db.query(Movie)
+            .options(selectinload(Movie.genres))
+            .filter(Movie.tmdb_id == movie_data.tmdb_id)
+            .first()
+        )
+        resolve_movie_genres([movie])
+        return movie
 
     # 1) Idempotent: dacă există deja, returnează-l
-    existing = db.query(Movie).filter(Movie.tmdb_id == movie_data.tmdb_id).first()
+    existing = await run_in_threadpool(find_movie)
     if existing:
         return existing
 
-    # 2) Fetch din TMDB
+    # 2) Fetch din TMDB + insert (single-flight, tolerant la conflicte)
     try:
-        tmdb_movie = tmdb_service.get_movie_details(movie_data.tmdb_id)
+        await import_movie(movie_data.tmdb_id)
+    except CircuitOpenError as e:
+        # TMDB e degradat: răspundem imediat, fără să ținem thread-ul în retry-uri
+        raise HTTPException(
+            status_code=502,
+            detail="TMDB unavailable",
+            headers={"Retry-After": str(int(e.retry_after) + 1)},
+        )
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            # tmdb_id inexistent: eroarea clientului, nu a upstream-ului
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Movie with TMDB id {movie_data.tmdb_id} not found on TMDB"
+            )
+        raise HTTPException(status_code=502, detail="TMDB request failed")
     except Exception:
-        # poți diferenția 404 vs rate limit etc, dar pentru început e ok:
+        # restul erorilor TMDB (rate limit după retry-uri, offline etc.)
         raise HTTPException(status_code=502, detail="TMDB request failed")
 
-    # 3) Map TMDB -> modelul Movie
-    parsed = tmdb_service.parse_movie_data(tmdb_movie)  # tmdb_id/title/description/release_date/poster_url/popularity
-    db_movie = Movie(**parsed)
-
-    db.add(db_movie)
-    db.flush()  # ca să obții db_movie.id înainte de commit
-
-    # 4) Genuri + movie_genres (TMDB details are "genres": [{id, name}, ...])
-    for g in tmdb_movie.get("genres", []):
-        name = (g.get("name") or "").strip()
-        if not name:
-            continue
-
-        genre = db.query(Genre).filter(Genre.name == name).first()
-        if not genre:
-            genre = Genre(name=name)
-            db.add(genre)
-            db.flush()
-
-        db.add(MovieGenre(movie_id=db_movie.id, genre_id=genre.id))
+    # 3) Toți cei care au așteptat același import primesc același rând
+    movie = await run_in_threadpool(find_movie)
+    if movie is None:
+        # importul n-a scris nimic sau filmul a fost șters între timp
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Movie with TMDB id {movie_data.tmdb_id} not found"
+        )
+    return movie
 
-    db.commit()
-    db.refresh(db_movie)
-    return db_movie
+@router.get("/import-jobs/{job_id}", response_model=ImportJobOut)
+def get_import_job(job_id: int, db: Session = Depends(get_db)):
+    """Statusul unui import pus în coadă cu POST /movies/?background=true"""
+    job = db.query(ImportJob).filter(ImportJob.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Import job with id {job_id} not found"
+        )
+    return job
 
 @router.get("/genre/{genre_id}", response_model=List[MovieOut])
 def get_movies_by_genre(
     genre_id: int,
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Listă filme după gen"""
-    genre = db.query(Genre).filter(Genre.id == genre_id).first()
-    if not genre:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Genre with id {genre_id} not found"
-        )
-    
-    movies = db.query(Movie).join(MovieGenre).filter(
-        MovieGenre.genre_id == genre_id
-    ).order_by(Movie.popularity.desc().nullslast()).offset(skip).limit(limit).all()
-    
-    return movies
\ No newline at end of file
+    projection = parse_fields(fields, MOVIE_FIELDS, MOVIE_PRESETS)
+
+    def load_page():
+        genre = db.query(Genre).filter(Genre.id == genre_id).first()
+        if not genre:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Genre with id {genre_id} not found"
+            )
+
+        query, sort_keys = movie_list_query(db, genre_id=genre_id, fields=projection)
+        return movie_page(db, query, sort_keys, limit, cursor, skip, projection)
+
+    return cached_movie_list(request, load_page)
\ No newline at end of file
@@ -1,28 +1,88 @@
 # backend/app/routers/reviews.py
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.models.review import Review
 from app.models.user import User
 from app.models.movie import Movie
 from app.schemas.review import ReviewCreate, ReviewOut, ReviewUpdate, ReviewModerateUpdate
 from app.routers.auth import get_current_user
+from app.services.catalog_events import movie_rating_changed
+from app.utils.etag import conditional, request_etag
+from app.services.list_rows import (
+    AUTHOR_COLUMNS, MOVIE_CARD_COLUMNS, REVIEW_COLUMNS, REVIEW_EMBEDS, embed_columns, review_columns, review_dicts,
+)
+from app.services.ratings import apply_review_change, review_state
+from app.utils.fast_json import dumps, fast_lists
+from app.utils.fields import (
+    Fields, column_options, parse_embed, parse_fields, project, projected_response, render_projection,
+)
+from app.utils.pagination import keyset_page, set_next_cursor
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
-def update_movie_avg_rating(db: Session, movie_id: int):
-    """Recalculează avg_rating pentru un film"""
-    avg_rating = db.query(func.avg(Review.rating)).filter(
-        Review.movie_id == movie_id
-    ).scalar() or 0.0
-    
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
-    if movie:
-        movie.avg_rating = round(avg_rating, 2)
-        db.commit()
-    return None
+def review_sort_keys() -> list:
+    """Cheia de sortare (DESC) pentru listele de reviews: cele mai noi primele, id ca tiebreak"""
+    return [Review.created_at, Review.id]
+
+# fields= pe liste: "card" = fără textul review-ului (comment), pentru liste compacte
+REVIEW_FIELDS = tuple(ReviewOut.model_fields)
+REVIEW_PRESETS = {"card": ("id", "user_id", "movie_id", "rating", "is_spoiler", "created_at")}
+FIELDS_DESCRIPTION = "Comma-separated fields to return, or 'card'; full objects when omitted"
+# embed= pe liste: autorul (id, username) și cardul filmului, încărcate în același query
+REVIEW_EMBED_NAMES = tuple(REVIEW_EMBEDS)
+EMBED_DESCRIPTION = "Comma-separated related objects to include: author, movie"
+
+def review_page(
+    response: Response,
+    query,
+    limit: int,
+    cursor: Optional[str],
+    skip: int,
+    fields: Optional[Fields] = None,
+    embed: Fields = (),
+):
+    """
+    Pagină keyset de review-uri. Cu `fields`, coloanele necerute (ex. comment)
+    nu sunt selectate și răspunsul e serializat direct din câmpurile cerute.
+    Cu `embed`, autorul / filmul vin din același SELECT (join pe FK-uri).
+    Pe calea rapidă (fast_lists) rândurile sunt tuple de coloane -> orjson.
+    """
+    if fast_lists.enabled:
+        names = review_columns(fields)
+        if "author" in embed:
+            query = query.join(User, User.id == Review.user_id)
+        if "movie" in embed:
+            query = query.join(Movie, Movie.id == Review.movie_id)
+        rows, next_cursor = keyset_page(
+            query.with_entities(*(REVIEW_COLUMNS[n] for n in names), *embed_columns(embed)),
+            review_sort_keys(), limit, cursor=cursor, skip=skip,
+        )
+        set_next_cursor(response, next_cursor)
+        return projected_response(response, dumps(review_dicts(rows, names, embed)))
+
+    if fields is not None:
+        query = query.options(*column_options(Review, fields))
+    if "author" in embed:
+        query = query.options(joinedload(Review.user, innerjoin=True).load_only(*AUTHOR_COLUMNS.values()))
+    if "movie" in embed:
+        query = query.options(joinedload(Review.movie, innerjoin=True).load_only(*MOVIE_CARD_COLUMNS.values()))
+    reviews, next_cursor = keyset_page(query, review_sort_keys(), limit, cursor=cursor, skip=skip)
+    set_next_cursor(response, next_cursor)
+    if fields is None and not embed:
+        return reviews
+
+    def render(review: Review) -> dict:
+        item = project(review, fields or REVIEW_FIELDS)
+        if "author" in embed:
+            item["author"] = project(review.user, tuple(AUTHOR_COLUMNS))
+        if "movie" in embed:
+            item["movie"] = project(review.movie, tuple(MOVIE_CARD_COLUMNS))
+        return item
+
+    return projected_response(response, render_projection(render(r) for r in reviews))
 
 @router.post("/", response_model=ReviewOut, status_code=status.HTTP_201_CREATED)
 def create_review(
@@ -55,19 +115,24 @@ def create_review(
         is_spoiler = review_data.is_spoiler
     )
     db.add(db_review)
+    # avg_rating + histograma: delte aplicate în aceeași tranzacție cu review-ul
+    rating_changed = apply_review_change(db, review_data.movie_id, None, review_state(db_review))
     db.commit()
     db.refresh(db_review)
-    
-    # Recalculează avg_rating pentru film
-    update_movie_avg_rating(db, review_data.movie_id)
+    if rating_changed:
+        movie_rating_changed(review_data.movie_id)
     return db_review
 
 @router.get("/", response_model=List[ReviewOut])
 def get_reviews(
+    response: Response,
     movie_id: Optional[int] = Query(None, description="Filter by movie ID"),
     user_id: Optional[int] = Query(None, description="Filter by user ID"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    embed: Optional[str] = Query(None, description=EMBED_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Listă reviews cu filtrare"""
@@ -79,36 +144,54 @@ def get_reviews(
     if user_id:
         query = query.filter(Review.user_id == user_id)
     
-    reviews = query.order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
-    return reviews
+    projection = parse_fields(fields, REVIEW_FIELDS, REVIEW_PRESETS)
+    embeds = parse_embed(embed, REVIEW_EMBED_NAMES)
+    return review_page(response, query, limit, cursor, skip, projection, embeds)
 
 @router.get("/movie/{movie_id}", response_model=List[ReviewOut])
 def get_reviews_by_movie(
     movie_id: int,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    embed: Optional[str] = Query(None, description=EMBED_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Listă reviews pentru un anumit film"""
-    # Verifică dacă filmul există
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
-    if not movie:
+    # Verifică dacă filmul există; rev-ul lui acoperă embed=movie (rating, sync TMDB)
+    movie_rev = db.query(Movie.rev).filter(Movie.id == movie_id).scalar()
+    if movie_rev is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Movie with id {movie_id} not found"
         )
-    
-    reviews = db.query(Review).filter(
-        Review.movie_id == movie_id
-    ).order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
-    
-    return reviews
+
+    # Review adăugat / modificat -> max(rev) crește; șters -> count scade (index-only pe ix_reviews_movie_rev)
+    reviews_rev, review_count = (
+        db.query(func.max(Review.rev), func.count()).filter(Review.movie_id == movie_id).one()
+    )
+    etag = request_etag(request, movie_rev, reviews_rev, review_count)
+    not_modified = conditional(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    query = db.query(Review).filter(Review.movie_id == movie_id)
+    projection = parse_fields(fields, REVIEW_FIELDS, REVIEW_PRESETS)
+    embeds = parse_embed(embed, REVIEW_EMBED_NAMES)
+    return review_page(response, query, limit, cursor, skip, projection, embeds)
 
 @router.get("/user/{user_id}", response_model=List[ReviewOut])
 def get_reviews_by_user(
     user_id: int,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    embed: Optional[str] = Query(None, description=EMBED_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """Listă reviews ale unui anumit user"""
@@ -119,25 +202,27 @@ def get_reviews_by_user(
             detail=f"User with id {user_id} not found"
         )
     
-    reviews = db.query(Review).filter(
-        Review.user_id == user_id
-    ).order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
-    
-    return reviews
+    query = db.query(Review).filter(Review.user_id == user_id)
+    projection = parse_fields(fields, REVIEW_FIELDS, REVIEW_PRESETS)
+    embeds = parse_embed(embed, REVIEW_EMBED_NAMES)
+    return review_page(response, query, limit, cursor, skip, projection, embeds)
 
 @router.get("/me", response_model=List[ReviewOut])
 def get_my_reviews(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    embed: Optional[str] = Query(None, description=EMBED_DESCRIPTION),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Listă reviews ale user-ului curent"""
-    reviews = db.query(Review).filter(
-        Review.user_id == current_user.id
-    ).order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
-    
-    return reviews
+    query = db.query(Review).filter(Review.user_id == current_user.id)
+    projection = parse_fields(fields, REVIEW_FIELDS, REVIEW_PRESETS)
+    embeds = parse_embed(embed, REVIEW_EMBED_NAMES)
+    return review_page(response, query, limit, cursor, skip, projection, embeds)
 
 @router.get("/{review_id}", response_model=ReviewOut)
 def get_review_by_id(review_id: int, db: Session = Depends(get_db)):
@@ -158,7 +243,7 @@ def update_review(
     db: Session = Depends(get_db)
 ):
     """Actualizează propriul review"""
-    review = db.query(Review).filter(Review.id == review_id).first()
+    review = db.query(Review).filter(Review.id == review_id).with_for_update().first()
     
     if not review:
         raise HTTPException(
@@ -173,6 +258,8 @@ def update_review(
             detail="You can only update your own reviews"
         )
     
+    old_state = review_state(review)
+
     # Actualizează doar câmpurile furnizate
     if review_update.rating is not None:
         review.rating = review_update.rating
@@ -181,11 +268,11 @@ def update_review(
     if review_update.is_spoiler is not None:
         review.is_spoiler = review_update.is_spoiler
     
+    rating_changed = apply_review_change(db, review.movie_id, old_state, review_state(review))
     db.commit()
     db.refresh(review)
-    
-    # Recalculează avg_rating pentru film
-    update_movie_avg_rating(db, review.movie_id)
+    if rating_changed:
+        movie_rating_changed(review.movie_id)
     
     return review
 
@@ -199,7 +286,7 @@ def moderate_review_comment(
     if current_user.role not in ("mod", "admin"):
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    review = db.query(Review).filter(Review.id == review_id).first()
+    review = db.query(Review).filter(Review.id == review_id).with_for_update().first()
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
 
@@ -213,12 +300,15 @@ def moderate_review_comment(
     if current_user.role == "admin" and target_user.role == "admin":
         raise HTTPException(status_code=403, detail="Cannot moderate this user's review")
 
+    old_state = review_state(review)
     if payload.comment is not None:
         review.comment = payload.comment
 
     if payload.is_spoiler is not None:
         review.is_spoiler = payload.is_spoiler
 
+    # rating-ul nu se schimbă aici, doar spoiler_count din histogramă
+    apply_review_change(db, review.movie_id, old_state, review_state(review))
     db.commit()
     db.refresh(review)
     return review
@@ -230,7 +320,7 @@ def delete_review(
     db: Session = Depends(get_db)
 ):
     """Șterge propriul review"""
-    review = db.query(Review).filter(Review.id == review_id).first()
+    review = db.query(Review).filter(Review.id == review_id).with_for_update().first()
     
     if not review:
         raise HTTPException(
@@ -245,12 +335,12 @@ def delete_review(
             detail="You can only delete your own reviews"
         )
     
-    movie_id = review.movie_id  # Salvează pentru recalculare
+    movie_id = review.movie_id  # Salvează pentru delta de rating
+    rating_changed = apply_review_change(db, movie_id, review_state(review), None)
     db.delete(review)
     db.commit()
-    
-    # Recalculează avg_rating pentru film
-    update_movie_avg_rating(db, movie_id)
+    if rating_changed:
+        movie_rating_changed(movie_id)
     
     return None
 
@@ -263,7 +353,7 @@ def moderate_delete_review(
     if current_user.role not in ("mod", "admin"):
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    review = db.query(Review).filter(Review.id == review_id).first()
+    review = db.query(Review).filter(Review.id == review_id).with_for_update().first()
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
 
@@ -278,7 +368,8 @@ def moderate_delete_review(
         raise HTTPException(status_code=403, detail="Cannot moderate this user's review")
 
     movie_id = review.movie_id
+    rating_changed = apply_review_change(db, movie_id, review_state(review), None)
     db.delete(review)
     db.commit()
-
-    update_movie_avg_rating(db, movie_id)
\ No newline at end of file
+    if rating_changed:
+        movie_rating_changed(movie_id)
\ No newline at end of file
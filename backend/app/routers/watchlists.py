@@ -1,13 +1,18 @@
 # backend/app/routers/watchlist.py
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func
 from app.database import get_db
 from app.models.watchlist import Watchlist
 from app.models.user import User
 from app.models.movie import Movie
 from app.schemas.watchlist import WatchListCreate, WatchListOut, WatchListWithMovieOut
 from app.routers.auth import get_current_user
+from app.services.list_rows import MOVIE_COLUMNS, resolve_movie_genres, split_movie_rows
+from app.utils.etag import conditional, request_etag
+from app.utils.fast_json import dumps, fast_lists
+from app.utils.fields import projected_response
 
 router = APIRouter(prefix="/watchlist", tags=["watchlist"])
 
@@ -75,15 +80,36 @@ def remove_from_watchlist(
 
 @router.get("/me", response_model=List[WatchListWithMovieOut])
 def get_my_watchlist(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Listă watchlist-ul user-ului curent"""
+    # ETag: rev-ul user-ului (add/remove) + cel mai nou rev dintre filmele din listă
+    movies_rev = db.query(func.max(Movie.rev)).join(Watchlist, Watchlist.movie_id == Movie.id).filter(
+        Watchlist.user_id == current_user.id
+    ).scalar()
+    etag = request_etag(request, current_user.id, current_user.rev, movies_rev)
+    not_modified = conditional(request, response, etag, private=True)
+    if not_modified is not None:
+        return not_modified
+
+    if fast_lists.enabled:
+        # Calea rapidă: intrare + coloanele filmului într-un singur SELECT, fără obiecte ORM
+        rows = db.query(Watchlist.user_id, Watchlist.added_at, *MOVIE_COLUMNS.values()).join(
+            Movie, Movie.id == Watchlist.movie_id
+        ).filter(
+            Watchlist.user_id == current_user.id
+        ).order_by(Watchlist.added_at.desc()).all()
+        return projected_response(response, dumps(split_movie_rows(db, rows, ("user_id", "added_at"))))
+
     watchlist_items = db.query(Watchlist).options(
-        joinedload(Watchlist.movie) #SQLAlchemy face join-ul pentru a accesa Movie prin joinedLoad
+        joinedload(Watchlist.movie).selectinload(Movie.genres) #SQLAlchemy face join-ul pentru a accesa Movie prin joinedLoad
     ).filter(
         Watchlist.user_id == current_user.id
     ).order_by(Watchlist.added_at.desc()).all()
+    resolve_movie_genres(item.movie for item in watchlist_items)
     
     return watchlist_items
 
@@ -102,10 +128,11 @@ def get_user_watchlist(
         )
     
     watchlist_items = db.query(Watchlist).options(
-        joinedload(Watchlist.movie) #SQLAlchemy face join-ul pentru a accesa Movie prin joinedLoad
+        joinedload(Watchlist.movie).selectinload(Movie.genres) #SQLAlchemy face join-ul pentru a accesa Movie prin joinedLoad
     ).filter(
         Watchlist.user_id == user_id
     ).order_by(Watchlist.added_at.desc()).all()
+    resolve_movie_genres(item.movie for item in watchlist_items)
     
     return watchlist_items
 
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+class ImportJobOut(BaseModel):
+    id: int
+    tmdb_id: int
+    status: str  # "queued" | "running" | "done" | "failed"
+    movie_id: Optional[int] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
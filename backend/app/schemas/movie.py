@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from datetime import date
+from app.schemas.genre import GenreOut
 
 class MovieImport(BaseModel):
     tmdb_id: int
@@ -15,6 +16,73 @@ class MovieOut(BaseModel):
     poster_url: Optional[str]
     avg_rating: float  # from reviews
     created_at: datetime
-    
+    # Pe obiecte Movie: genre_list, pus de list_rows.resolve_movie_genres() înainte de serializare
+    genres: List[GenreOut] = Field(default=[], validation_alias=AliasChoices("genre_list", "genres"))
+
+    class Config:
+        from_attributes = True
+
+class MovieCardOut(BaseModel):
+    """Forma compactă a unui film (preset-ul "card"), ex. embed=movie pe listele de reviews"""
+    id: int
+    title: str
+    release_date: Optional[date]
+    poster_url: Optional[str]
+    avg_rating: Optional[float]
+
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class MovieBatchRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1)
+
+class MovieBatchOut(BaseModel):
+    items: List[MovieOut]
+    missing: List[int]
+
+class MovieSuggestionOut(BaseModel):
+    id: int
+    title: str
+    release_date: Optional[date]
+    poster_url: Optional[str]
+
+class GenreFacet(BaseModel):
+    id: int
+    name: str
+    count: int
+
+class YearFacet(BaseModel):
+    year: Optional[int]  # None = fără release_date
+    count: int
+
+class RatingFacet(BaseModel):
+    rating: int  # bucket: floor(avg_rating)
+    count: int
+
+class MovieFacetsOut(BaseModel):
+    total: int
+    genres: List[GenreFacet]
+    years: List[YearFacet]
+    ratings: List[RatingFacet]
+    refreshed_at: Optional[datetime]
+
+class RatingBucket(BaseModel):
+    rating: int  # 1-10
+    count: int
+
+class MovieStatsOut(BaseModel):
+    movie_id: int
+    avg_rating: float
+    rating_count: int  # review-uri cu rating
+    review_count: int  # toate review-urile, inclusiv cele doar cu comentariu
+    spoiler_count: int
+    histogram: List[RatingBucket]
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    score: float  # top rated: media bayesiană; trending: activitate recentă ponderată
+    movie: MovieOut
+
+class LeaderboardOut(BaseModel):
+    items: List[LeaderboardEntry]
+    refreshed_at: Optional[datetime]
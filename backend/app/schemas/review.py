@@ -26,6 +26,14 @@ class ReviewOut(BaseModel):
     class Config:
         from_attributes = True
 
+class ReviewAuthorOut(BaseModel):
+    """Autorul unui review, pentru embed=author pe listele de reviews"""
+    id: int
+    username: str
+
+    class Config:
+        from_attributes = True
+
 class ReviewModerateUpdate(BaseModel):
     comment: Optional[str] = None
     is_spoiler: Optional[bool] = None
\ No newline at end of file
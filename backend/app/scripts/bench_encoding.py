@@ -0,0 +1,97 @@
+# backend/app/scripts/bench_encoding.py
+"""
+Benchmark pentru encodarea răspunsurilor de listă: bytes pe fir și CPU pe
+request pentru JSON / JSON+gzip / MessagePack / MessagePack+gzip, negociate
+prin Accept și Accept-Encoding exact ca un client real (TestClient in-process).
+
+Rulează cu response cache-ul dezactivat, ca fiecare request să includă
+query-ul + serializarea. Nivelul și pragul gzip vin din config
+(GZIP_LEVEL / GZIP_MIN_SIZE); pentru alt nivel:
+    GZIP_LEVEL=1 python -m app.scripts.bench_encoding
+
+Usage:
+    python -m app.scripts.bench_encoding [--iterations 30] [--limit 100]
+"""
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_path))
+
+import argparse
+import statistics
+import time
+from typing import Dict, List, Tuple
+from fastapi.testclient import TestClient
+from app.config import GZIP_LEVEL, GZIP_MIN_SIZE
+from app.database import SessionLocal
+from app.main import app
+from app.models.genre import Genre
+from app.services.genre_cache import genre_cache
+from app.services.response_cache import response_cache
+from app.utils.msgpack_negotiation import msgpack
+
+VARIANTS = {
+    "json": {"Accept": "application/json", "Accept-Encoding": "identity"},
+    "json+gzip": {"Accept": "application/json", "Accept-Encoding": "gzip"},
+    "msgpack": {"Accept": "application/msgpack", "Accept-Encoding": "identity"},
+    "msgpack+gzip": {"Accept": "application/msgpack", "Accept-Encoding": "gzip"},
+}
+
+
+def measure(client: TestClient, url: str, headers: Dict, iterations: int) -> Tuple[int, float]:
+    """(bytes pe fir, CPU ms median per request)"""
+    response = client.get(url, headers=headers)  # warm-up
+    response.raise_for_status()
+    # content-length e lungimea corpului transmis (comprimat, dacă e cazul)
+    wire_bytes = int(response.headers["content-length"])
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.process_time()
+        client.get(url, headers=headers)
+        samples.append((time.process_time() - start) * 1000)
+    return wire_bytes, statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bytes/CPU: JSON vs msgpack, cu și fără gzip")
+    parser.add_argument("--iterations", type=int, default=30, help="Request-uri per endpoint și variantă")
+    parser.add_argument("--limit", type=int, default=100, help="Dimensiunea paginii")
+    args = parser.parse_args()
+
+    response_cache.max_entries = 0
+    genre_cache.reload()
+    db = SessionLocal()
+    try:
+        genre_id = db.query(Genre.id).order_by(Genre.id).limit(1).scalar()
+    finally:
+        db.close()
+
+    urls = [
+        f"/movies/?limit={args.limit}",
+        f"/movies/?limit={args.limit}&fields=card",
+        f"/reviews/?limit={args.limit}",
+        "/genres/",
+    ]
+    if genre_id:
+        urls.append(f"/movies/genre/{genre_id}?limit={args.limit}")
+
+    variants = dict(VARIANTS)
+    if msgpack is None:
+        print("⚠️ msgpack nu e instalat - variantele msgpack sunt omise (pip install msgpack)")
+        variants = {k: v for k, v in variants.items() if not k.startswith("msgpack")}
+
+    client = TestClient(app)
+    print(f"📊 gzip level={GZIP_LEVEL}, min_size={GZIP_MIN_SIZE}; {args.iterations} request-uri / variantă")
+    print(f"{'endpoint':<34} {'variant':<14} {'bytes':>9} {'vs json':>8} {'CPU ms':>8}")
+    for url in urls:
+        baseline = None
+        for name, headers in variants.items():
+            wire_bytes, cpu_ms = measure(client, url, headers, args.iterations)
+            baseline = baseline or wire_bytes
+            print(f"{url:<34} {name:<14} {wire_bytes:>9} {wire_bytes / baseline:>7.0%} {cpu_ms:>8.2f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
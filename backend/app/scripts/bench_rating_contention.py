@@ -0,0 +1,234 @@
+# backend/app/scripts/bench_rating_contention.py
+"""
+Benchmark de contenție pe rating: N thread-uri scriu review-uri pe ACELAȘI
+film, exact ca POST /reviews/ (insert review + delta de rating + commit).
+
+Compară scrierea directă (fiecare tranzacție face UPDATE pe rândul filmului
+și așteaptă lock-ul) cu RatingAggregator (deltele se aplică la flush, un
+UPDATE per film). Raportează throughput și latența p50/p95/p99 per scriere,
+apoi verifică că totalurile filmului corespund review-urilor.
+
+În timpul fiecărei rulări, un thread eșantionează pg_stat_activity /
+pg_locks: câți scriitori așteaptă un lock și câți dintre ei sunt blocați de
+o tranzacție care a scris în movies (lock-ul pe rândul "fierbinte"). Cu
+agregatorul, a doua valoare trebuie să fie 0. Fiecare thread scrie cu alt
+user, ca rândul din users (rev-ul per user) să nu fie el punctul fierbinte.
+
+Review-urile de test sunt șterse la final și totalurile filmului refăcute.
+
+Usage:
+    python -m app.scripts.bench_rating_contention [--movie-id 1] [--threads 32] [--writes 50]
+"""
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_path))
+
+import argparse
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from sqlalchemy import create_engine, func, text
+from sqlalchemy.orm import sessionmaker
+from app.config import DATABASE_URL
+from app.database import SessionLocal
+from app.models.movie import Movie
+from app.models.review import Review
+from app.models.user import User
+from app.scripts.reconcile_ratings import fix_batch
+from app.services.ratings import apply_review_change, rating_aggregator
+
+BENCH_COMMENT = "bench-rating-contention"
+# application_name pe conexiunile scriitorilor, ca sampler-ul să le găsească în pg_stat_activity
+WRITER_APP = "bench-rating-writer"
+SAMPLE_EVERY = 0.01
+
+# Scriitorii blocați pe un lock, și câți dintre ei așteaptă o tranzacție care a scris în movies
+LOCK_WAITS = text("""
+    SELECT
+        count(*) AS waiting,
+        count(*) FILTER (WHERE EXISTS (
+            SELECT 1 FROM pg_locks l
+            WHERE l.pid = ANY(pg_blocking_pids(a.pid))
+              AND l.granted AND l.relation = 'movies'::regclass AND l.mode = 'RowExclusiveLock'
+        )) AS behind_movies
+    FROM pg_stat_activity a
+    WHERE a.application_name = :app AND a.wait_event_type = 'Lock'
+""")
+
+
+def pick_movie(movie_id: Optional[int]) -> int:
+    db = SessionLocal()
+    try:
+        if movie_id is None:
+            movie_id = db.query(Movie.id).order_by(Movie.popularity.desc().nullslast()).limit(1).scalar()
+        if movie_id is None or db.query(Movie.id).filter(Movie.id == movie_id).scalar() is None:
+            raise SystemExit("❌ Niciun film în baza de date (rulează populate_movies)")
+        return movie_id
+    finally:
+        db.close()
+
+
+def pick_users(count: int) -> List[int]:
+    db = SessionLocal()
+    try:
+        user_ids = [user_id for (user_id,) in db.query(User.id).order_by(User.id).limit(count)]
+        if not user_ids:
+            raise SystemExit("❌ Niciun user în baza de date (rulează populate_users)")
+        if len(user_ids) < count:
+            print(f"⚠️ Doar {len(user_ids)} useri pentru {count} thread-uri: unii scriitori vor împărți rândul din users")
+        return user_ids
+    finally:
+        db.close()
+
+
+class LockSampler:
+    """Eșantionează periodic lock wait-urile scriitorilor, pe un thread propriu"""
+
+    def __init__(self, every: float = SAMPLE_EVERY):
+        self.every = every
+        self.samples = 0
+        self.waiting = 0
+        self.behind_movies = 0
+        self.max_waiting = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self):
+        db = SessionLocal()
+        try:
+            while not self._stop.wait(self.every):
+                waiting, behind_movies = db.execute(LOCK_WAITS, {"app": WRITER_APP}).one()
+                db.rollback()
+                self.samples += 1
+                self.waiting += waiting
+                self.behind_movies += behind_movies
+                self.max_waiting = max(self.max_waiting, waiting)
+        finally:
+            db.close()
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, name="lock-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def report(self) -> None:
+        if not self.samples:
+            print("   (niciun eșantion de lock-uri)")
+            return
+        # suma scriitorilor în așteptare x intervalul ≈ timpul cumulat de lock wait
+        print(
+            f"   lock wait ≈ {self.waiting * self.every:.2f}s cumulat, "
+            f"din care {self.behind_movies * self.every:.2f}s în spatele unei tranzacții care a scris în movies | "
+            f"max {self.max_waiting} scriitori blocați simultan ({self.samples} eșantioane)"
+        )
+
+
+def write_review(sessions: sessionmaker, movie_id: int, user_id: int) -> float:
+    """O scriere ca în create_review; returnează latența în ms"""
+    rating = random.randint(1, 10)
+    start = time.perf_counter()
+    db = sessions()
+    try:
+        db.add(Review(user_id=user_id, movie_id=movie_id, rating=rating, comment=BENCH_COMMENT))
+        apply_review_change(db, movie_id, None, (rating, False))
+        db.commit()
+    finally:
+        db.close()
+    return (time.perf_counter() - start) * 1000
+
+
+def run(sessions: sessionmaker, movie_id: int, user_ids: List[int], threads: int, writes: int) -> None:
+    started = time.perf_counter()
+    with LockSampler() as sampler, ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [
+            pool.submit(write_review, sessions, movie_id, user_ids[i % len(user_ids)])
+            for i in range(threads * writes)
+        ]
+        latencies = [f.result() for f in futures]
+    elapsed = time.perf_counter() - started
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"   {len(latencies)} scrieri în {elapsed:.2f}s = {len(latencies) / elapsed:8.1f}/s | "
+        f"p50 {cuts[49]:7.2f} ms | p95 {cuts[94]:7.2f} ms | p99 {cuts[98]:7.2f} ms"
+    )
+    sampler.report()
+
+
+def check_totals(movie_id: int) -> bool:
+    db = SessionLocal()
+    try:
+        stored = db.query(Movie.rating_sum, Movie.rating_count).filter(Movie.id == movie_id).one()
+        expected = db.query(
+            func.coalesce(func.sum(Review.rating), 0), func.count(Review.rating)
+        ).filter(Review.movie_id == movie_id).one()
+        ok = (int(stored[0]), int(stored[1])) == (int(expected[0]), int(expected[1]))
+        print(f"   {'✓' if ok else '✗'} totaluri film: {tuple(stored)}, din reviews: {tuple(expected)}")
+        return ok
+    finally:
+        db.close()
+
+
+def cleanup(movie_id: int) -> None:
+    db = SessionLocal()
+    try:
+        deleted = (
+            db.query(Review)
+            .filter(Review.movie_id == movie_id, Review.comment == BENCH_COMMENT)
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        fix_batch(db, [movie_id])
+        print(f"🧹 Șterse {deleted} review-uri de test, totalurile filmului {movie_id} refăcute")
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contenție pe un singur film: UPDATE direct vs. RatingAggregator")
+    parser.add_argument("--movie-id", type=int, default=None, help="Filmul 'fierbinte' (implicit cel mai popular)")
+    parser.add_argument("--threads", type=int, default=32, help="Scriitori concurenți")
+    parser.add_argument("--writes", type=int, default=50, help="Review-uri per thread")
+    parser.add_argument("--interval", type=float, default=rating_aggregator.interval, help="Flush interval (s)")
+    args = parser.parse_args()
+
+    movie_id = pick_movie(args.movie_id)
+    user_ids = pick_users(args.threads)
+    # pool cât numărul de thread-uri: scriitorii nu așteaptă conexiuni, doar lock-uri
+    writer_engine = create_engine(
+        DATABASE_URL, pool_size=args.threads, connect_args={"application_name": WRITER_APP}
+    )
+    sessions = sessionmaker(bind=writer_engine, autocommit=False, autoflush=False)
+    print(f"📊 Film {movie_id}: {args.threads} thread-uri x {args.writes} review-uri")
+
+    try:
+        print("🔒 UPDATE direct pe rândul filmului (fiecare scriere așteaptă lock-ul)")
+        rating_aggregator.enabled = False
+        run(sessions, movie_id, user_ids, args.threads, args.writes)
+        check_totals(movie_id)
+
+        print(f"📦 RatingAggregator (flush la {args.interval}s / {rating_aggregator.max_pending} delte)")
+        rating_aggregator.enabled = True
+        rating_aggregator.interval = args.interval
+        rating_aggregator.start()
+        run(sessions, movie_id, user_ids, args.threads, args.writes)
+        rating_aggregator.stop()
+        print(f"   {rating_aggregator.coalesced} delte aplicate în {rating_aggregator.flushes} flush-uri")
+        check_totals(movie_id)
+    finally:
+        rating_aggregator.stop()
+        rating_aggregator.enabled = False
+        cleanup(movie_id)
+        writer_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
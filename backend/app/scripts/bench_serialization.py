@@ -0,0 +1,113 @@
+# backend/app/scripts/bench_serialization.py
+"""
+Benchmark: calea standard (obiecte ORM + validare response_model + encoder
+JSON) vs. calea rapidă (rânduri -> dict -> orjson, FAST_JSON_LISTS) pe fiecare
+endpoint de listă. Rulează in-process (TestClient) pe baza configurată, cu
+response cache-ul dezactivat, și verifică și că cele două căi dau același JSON.
+
+Usage:
+    python -m app.scripts.bench_serialization [--iterations 50] [--limit 100] [--username alice]
+"""
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_path))
+
+import argparse
+import statistics
+import time
+from typing import Dict, List, Optional
+from fastapi.testclient import TestClient
+from sqlalchemy import func
+from app.database import SessionLocal
+from app.main import app
+from app.models.diary_entry import DiaryEntry
+from app.models.genre import Genre
+from app.models.review import Review
+from app.models.user import User
+from app.routers.auth import create_access_token
+from app.services.genre_cache import genre_cache
+from app.services.response_cache import response_cache
+from app.utils.fast_json import fast_lists, orjson
+
+
+def pick_fixtures(username: Optional[str]) -> Dict:
+    """Genul, filmul cu cele mai multe review-uri și un user cu jurnal, pentru URL-uri realiste"""
+    db = SessionLocal()
+    try:
+        genre_id = db.query(Genre.id).order_by(Genre.id).limit(1).scalar()
+        movie_id = (
+            db.query(Review.movie_id).group_by(Review.movie_id)
+            .order_by(func.count(Review.id).desc()).limit(1).scalar()
+        )
+        if username is None:
+            username = (
+                db.query(User.username).join(DiaryEntry, DiaryEntry.user_id == User.id)
+                .group_by(User.username).order_by(func.count(DiaryEntry.id).desc()).limit(1).scalar()
+            )
+        return {"genre_id": genre_id, "movie_id": movie_id, "username": username}
+    finally:
+        db.close()
+
+
+def timed(client: TestClient, url: str, headers: Dict, iterations: int) -> List[float]:
+    client.get(url, headers=headers)  # warm-up
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = client.get(url, headers=headers)
+        samples.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serializare liste: standard vs. fast path")
+    parser.add_argument("--iterations", type=int, default=50, help="Request-uri per endpoint și per cale")
+    parser.add_argument("--limit", type=int, default=100, help="Dimensiunea paginii")
+    parser.add_argument("--username", type=str, default=None, help="User pentru /diary/me și /watchlist/me")
+    args = parser.parse_args()
+
+    response_cache.max_entries = 0  # măsurăm query + serializare, nu cache-ul
+    genre_cache.reload()
+    fixtures = pick_fixtures(args.username)
+    auth = {}
+    if fixtures["username"]:
+        auth = {"Authorization": f"Bearer {create_access_token({'sub': fixtures['username']})}"}
+
+    urls = [
+        f"/movies/?limit={args.limit}",
+        f"/movies/?limit={args.limit}&fields=card",
+        f"/reviews/?limit={args.limit}",
+    ]
+    if fixtures["genre_id"]:
+        urls.append(f"/movies/genre/{fixtures['genre_id']}?limit={args.limit}")
+    if fixtures["movie_id"]:
+        urls.append(f"/reviews/movie/{fixtures['movie_id']}?limit={args.limit}")
+    if auth:
+        urls += [f"/reviews/me?limit={args.limit}", f"/diary/me?limit={args.limit}", "/watchlist/me"]
+
+    client = TestClient(app)
+    print(f"📊 {args.iterations} request-uri / endpoint, encoder rapid: {'orjson' if orjson else 'pydantic-core'}")
+    print(f"{'endpoint':<42} {'standard ms':>12} {'fast ms':>9} {'speedup':>8} {'bytes':>9}  same JSON")
+
+    for url in urls:
+        results = {}
+        for enabled in (False, True):
+            fast_lists.enabled = enabled
+            samples = timed(client, url, auth, args.iterations)
+            body = client.get(url, headers=auth).json()
+            results[enabled] = (statistics.median(samples), body)
+
+        standard_ms, standard_body = results[False]
+        fast_ms, fast_body = results[True]
+        size = len(client.get(url, headers=auth).content)
+        same = "✓" if standard_body == fast_body else "✗"
+        print(
+            f"{url:<42} {standard_ms:>12.2f} {fast_ms:>9.2f} {standard_ms / fast_ms:>7.2f}x {size:>9}  {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
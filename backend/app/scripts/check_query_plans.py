@@ -0,0 +1,105 @@
+# backend/app/scripts/check_query_plans.py
+"""
+Verificare de regresie pe planurile de execuție ale query-urilor de browse.
+
+Rulează EXPLAIN pe exact SQL-ul generat de GET /movies și /movies/genre/{id}
+(movie_list_query + keyset_query) și eșuează (exit 1) dacă vreunul cade pe
+Seq Scan pe movies / movie_genres, sau dacă browse-ul nefiltrat are nevoie de
+un Sort în loc să citească ordinea direct din ix_movies_browse.
+
+enable_seqscan / enable_sort sunt dezactivate local: pe o bază mică un seq
+scan e legitim, dar dacă planner-ul îl alege chiar și așa, înseamnă că nu
+există niciun index utilizabil pentru query.
+
+Usage: python -m app.scripts.check_query_plans [--verbose]
+"""
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_path))
+
+import argparse
+import json
+from typing import Iterator, List, Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session, Query
+from app.database import SessionLocal
+from app.models.genre import Genre
+from app.routers.movies import movie_list_query
+from app.utils.pagination import encode_cursor, keyset_query
+
+CHECKED_TABLES = {"movies", "movie_genres"}
+PAGE_SIZE = 100
+
+
+def plan_nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def explain(db: Session, query: Query, allow_sort: bool) -> dict:
+    statement = query.statement.compile(dialect=db.bind.dialect)
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    db.execute(text(f"SET LOCAL enable_sort = {'on' if allow_sort else 'off'}"))
+    rows = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", statement.params).all()
+    db.rollback()
+    raw = rows[0][0]
+    return (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+
+def check(db: Session, name: str, query: Query, allow_sort: bool = True, verbose: bool = False) -> List[str]:
+    plan = explain(db, query, allow_sort)
+    problems = []
+    for node in plan_nodes(plan):
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in CHECKED_TABLES:
+            problems.append(f"Seq Scan on {node['Relation Name']}")
+        if not allow_sort and node["Node Type"] in ("Sort", "Incremental Sort"):
+            problems.append(f"{node['Node Type']} on {node.get('Sort Key')}")
+
+    status = "✗" if problems else "✓"
+    print(f"  {status} {name}" + (f": {', '.join(problems)}" if problems else ""))
+    if verbose:
+        print(json.dumps(plan, indent=2))
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN regression check pentru query-urile de browse")
+    parser.add_argument("--verbose", action="store_true", help="Afișează planurile complete")
+    args = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        genre_id: Optional[int] = db.query(Genre.id).order_by(Genre.id).limit(1).scalar() or 1
+        cursor = encode_cursor([10.0, 1_000_000])
+
+        def browse(**filters):
+            query, keys = movie_list_query(db, **filters)
+            return keyset_query(query, keys).limit(PAGE_SIZE + 1)
+
+        def next_page(**filters):
+            query, keys = movie_list_query(db, **filters)
+            return keyset_query(query, keys, cursor=cursor).limit(PAGE_SIZE + 1)
+
+        print("🔎 Verificare planuri de execuție pentru browse...")
+        failures = []
+        failures += check(db, "browse", browse(), allow_sort=False, verbose=args.verbose)
+        failures += check(db, "browse, pagina următoare (cursor)", next_page(), allow_sort=False, verbose=args.verbose)
+        failures += check(db, "browse, min_rating", browse(min_rating=7.0), allow_sort=False, verbose=args.verbose)
+        failures += check(db, "browse, year", browse(year=2010), verbose=args.verbose)
+        failures += check(db, "browse, genre_id", browse(genre_id=genre_id), verbose=args.verbose)
+        failures += check(db, "browse, genre_id + year", browse(genre_id=genre_id, year=2010), verbose=args.verbose)
+        failures += check(db, "search", browse(search="star wars"), verbose=args.verbose)
+    finally:
+        db.close()
+
+    if failures:
+        print(f"\n✗ {len(failures)} problem(e) în planuri")
+        sys.exit(1)
+    print("\n✅ Toate query-urile de browse folosesc indecși")
+
+
+if __name__ == "__main__":
+    main()
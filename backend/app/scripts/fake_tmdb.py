@@ -0,0 +1,200 @@
+# backend/app/scripts/fake_tmdb.py
+"""
+TMDB local (stand-in) pentru benchmark-ul ingestiei fără acces la rețea.
+Servește aceleași endpoint-uri pe care le folosește TMDBService, cu date
+deterministe și latență configurabilă.
+
+Usage: python -m app.scripts.fake_tmdb [--port 8765] [--latency 150] [--movies 10000] [--error-rate 0.05]
+Apoi: TMDB_BASE_URL=http://127.0.0.1:8765/3 python -m app.scripts.populate_movies
+
+Export sintetic pentru import_export:
+    python -m app.scripts.fake_tmdb --write-export movie_ids.json.gz --movies 500000
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+GENRES = [
+    (28, "Action"), (12, "Adventure"), (16, "Animation"), (35, "Comedy"),
+    (80, "Crime"), (99, "Documentary"), (18, "Drama"), (10751, "Family"),
+    (14, "Fantasy"), (36, "History"), (27, "Horror"), (10402, "Music"),
+    (9648, "Mystery"), (10749, "Romance"), (878, "Science Fiction"),
+    (10770, "TV Movie"), (53, "Thriller"), (10752, "War"), (37, "Western"),
+]
+
+PAGE_SIZE = 20
+CHANGES_PAGE_SIZE = 100
+FIRST_ID = 1000
+
+MOVIE_DETAILS = re.compile(r"^/3/movie/(\d+)$")
+
+
+def fake_movie(tmdb_id: int) -> dict:
+    """Detaliile unui film, deterministe după tmdb_id"""
+    rnd = random.Random(tmdb_id)
+    year = rnd.randint(1950, 2025)
+    return {
+        "id": tmdb_id,
+        "title": f"Movie {tmdb_id}",
+        "overview": " ".join(rnd.choice(["lorem", "ipsum", "dolor", "sit", "amet"]) for _ in range(60)),
+        "release_date": f"{year}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+        "poster_path": f"/poster_{tmdb_id}.jpg",
+        "popularity": round(rnd.uniform(1, 500), 3),
+        "genres": [{"id": gid, "name": name} for gid, name in rnd.sample(GENRES, rnd.randint(1, 3))],
+    }
+
+
+class FakeTMDBHandler(BaseHTTPRequestHandler):
+    server_version = "FakeTMDB/1.0"
+    protocol_version = "HTTP/1.1"  # keep-alive, ca TMDB-ul real
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 200:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _page(self, query: dict, order_seed: int) -> dict:
+        total_pages = max(1, self.server.movies // PAGE_SIZE)
+        page = int(query.get("page", ["1"])[0])
+        if page > total_pages:
+            return {"page": page, "results": [], "total_pages": total_pages}
+        start = FIRST_ID + (page - 1) * PAGE_SIZE
+        ids = list(range(start, start + PAGE_SIZE))
+        random.Random(order_seed + page).shuffle(ids)
+        results = [{"id": i, "title": f"Movie {i}"} for i in ids]
+        return {"page": page, "results": results, "total_pages": total_pages}
+
+    def _changes(self, query: dict) -> dict:
+        """~2% din catalog modificat pe zi, determinist după fereastră"""
+        window = query.get("start_date", [""])[0] + query.get("end_date", [""])[0]
+        rnd = random.Random(window)
+        ids = sorted(rnd.sample(range(FIRST_ID, FIRST_ID + self.server.movies), max(1, self.server.movies // 50)))
+        total_pages = max(1, -(-len(ids) // CHANGES_PAGE_SIZE))
+        page = int(query.get("page", ["1"])[0])
+        chunk = ids[(page - 1) * CHANGES_PAGE_SIZE:page * CHANGES_PAGE_SIZE]
+        return {
+            "page": page,
+            "results": [{"id": i, "adult": False} for i in chunk],
+            "total_pages": total_pages,
+            "total_results": len(ids),
+        }
+
+    def do_GET(self):
+        self.server.count_request()
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        # Simulează rate limiting-ul TMDB ca să exersăm retry-urile clientului
+        if self.server.error_rate and random.random() < self.server.error_rate:
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == "/3/movie/popular":
+            return self._send(200, self._page(query, order_seed=1))
+        if url.path == "/3/movie/top_rated":
+            return self._send(200, self._page(query, order_seed=2))
+        if url.path == "/3/movie/changes":
+            return self._send(200, self._changes(query))
+        if url.path == "/3/genre/movie/list":
+            return self._send(200, {"genres": [{"id": gid, "name": name} for gid, name in GENRES]})
+
+        match = MOVIE_DETAILS.match(url.path)
+        if match:
+            tmdb_id = int(match.group(1))
+            if not FIRST_ID <= tmdb_id < FIRST_ID + self.server.movies:
+                return self._send(404, {"status_code": 34, "status_message": "Not found"})
+            return self._send(200, fake_movie(tmdb_id))
+
+        self._send(404, {"status_code": 34, "status_message": "Not found"})
+
+
+def write_export(path: str, movies: int):
+    """Scrie un export zilnic sintetic (JSON lines gzip), format files.tmdb.org"""
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for tmdb_id in range(FIRST_ID, FIRST_ID + movies):
+            rnd = random.Random(tmdb_id)
+            record = {
+                "adult": False,
+                "id": tmdb_id,
+                "original_title": f"Movie {tmdb_id}",
+                "popularity": round(rnd.uniform(1, 500), 3),
+                "video": False,
+            }
+            f.write(json.dumps(record) + "\n")
+
+
+class FakeTMDBServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, movies: int, latency: float, error_rate: float = 0.0, verbose: bool = False):
+        super().__init__(address, FakeTMDBHandler)
+        self.movies = movies
+        self.latency = latency
+        self.error_rate = error_rate
+        self.verbose = verbose
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TMDB local pentru benchmark")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=150, help="Latență per request în ms (default: 150)")
+    parser.add_argument("--movies", type=int, default=10000, help="Număr de filme servite (default: 10000)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fracțiunea de request-uri care primesc 429")
+    parser.add_argument("--verbose", action="store_true", help="Loghează fiecare request")
+    parser.add_argument("--write-export", metavar="PATH", help="Scrie un export .json.gz cu --movies filme și iese")
+    args = parser.parse_args()
+
+    if args.write_export:
+        write_export(args.write_export, args.movies)
+        print(f"📦 Export scris: {args.write_export} ({args.movies} filme)")
+        return
+
+    server = FakeTMDBServer((args.host, args.port), args.movies, args.latency / 1000, args.error_rate, args.verbose)
+    print(f"🎭 Fake TMDB pe http://{args.host}:{args.port}/3 ({args.movies} filme, {args.latency:g}ms latență)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"\n   • Request-uri servite: {server.requests}")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
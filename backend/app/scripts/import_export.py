@@ -0,0 +1,139 @@
+# backend/app/scripts/import_export.py
+"""
+Import bulk din fișierele de export zilnic TMDB (JSON lines, gzip),
+ex. movie_ids_10_17_2026.json.gz de pe files.tmdb.org.
+
+Fișierul e citit în streaming (memorie constantă), fiecare înregistrare
+trece prin TMDBService.parse_movie_data și e scrisă în batch-uri mari
+prin MovieBatchWriter (INSERT ... ON CONFLICT, o tranzacție per batch).
+
+Usage: python -m app.scripts.import_export movie_ids_10_17_2026.json.gz [--batch-size 5000] [--limit 100000]
+
+Exporturile conțin doar id / original_title / popularity; descrierea,
+posterul și genurile se completează ulterior cu sync_changes sau populate_movies.
+"""
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_path))
+
+import argparse
+import gzip
+import json
+import time
+from itertools import islice
+from typing import Dict, Iterator, Optional
+from sqlalchemy.orm import Session
+from app.database import SessionLocal
+from app.services.movie_writer import MovieBatchWriter
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+class ExportReader:
+    """Generator peste înregistrările unui export; numără liniile invalide/sărite"""
+
+    def __init__(self, path: str, include_adult: bool = False):
+        self.path = path
+        self.include_adult = include_adult
+        self.lines = 0
+        self.bad = 0
+        self.filtered = 0
+
+    def _open(self):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, "rt", encoding="utf-8")
+        return open(self.path, "rt", encoding="utf-8")
+
+    def __iter__(self) -> Iterator[Dict]:
+        with self._open() as f:
+            for line in f:
+                self.lines += 1
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    self.bad += 1
+                    continue
+                if not record.get("id"):
+                    self.bad += 1
+                    continue
+                if record.get("adult") and not self.include_adult:
+                    self.filtered += 1
+                    continue
+                # Exporturile au doar original_title; parse_movie_data citește "title"
+                record.setdefault("title", record.get("original_title") or "")
+                yield record
+
+
+def import_export(
+    db: Session,
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    limit: Optional[int] = None,
+    include_adult: bool = False,
+):
+    print(f"📦 Import din {path} (batch {batch_size})...")
+
+    reader = ExportReader(path, include_adult=include_adult)
+    records = iter(reader) if limit is None else islice(reader, limit)
+    writer = MovieBatchWriter(db)
+
+    inserted = skipped = 0
+    started = time.monotonic()
+
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+        created = writer.write_movies(batch)
+        inserted += len(created)
+        skipped += len(batch) - len(created)
+
+        elapsed = time.monotonic() - started
+        rows = inserted + skipped
+        print(
+            f"  [{elapsed:7.1f}s] citite {rows} | inserate {inserted} | existente {skipped} | "
+            f"invalide {reader.bad} | {rows / elapsed if elapsed else 0:,.0f} rânduri/s"
+        )
+
+    elapsed = time.monotonic() - started
+    rows = inserted + skipped
+    print(f"\n✅ Finalizat în {elapsed:.1f}s")
+    print(f"   • Filme inserate: {inserted}")
+    print(f"   • Filme existente: {skipped}")
+    print(f"   • Linii invalide: {reader.bad}, filtrate (adult): {reader.filtered}")
+    print(f"   • Throughput: {rows / elapsed if elapsed else 0:,.0f} rânduri/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import bulk din exportul zilnic TMDB")
+    parser.add_argument("path", help="Fișier .json.gz (sau .json) cu câte un film pe linie")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rânduri per tranzacție (default: {DEFAULT_BATCH_SIZE})"
+    )
+    parser.add_argument("--limit", type=int, default=None, help="Importă doar primele N înregistrări")
+    parser.add_argument("--include-adult", action="store_true", help="Include și titlurile marcate adult")
+    args = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        import_export(
+            db,
+            args.path,
+            batch_size=max(1, args.batch_size),
+            limit=args.limit,
+            include_adult=args.include_adult,
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
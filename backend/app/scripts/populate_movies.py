@@ -1,7 +1,16 @@
 # backend/scripts/populate_db.py
 """
 Script pentru popularea bazei de date cu date din TMDB API
-Usage: python -m scripts.populate_db [--pages 5] [--source popular|top_rated]
+Usage: python -m app.scripts.populate_movies [--pages 5] [--source popular|top_rated]
+                                             [--workers 8] [--rate 40]
+
+Benchmark fără rețea, contra TMDB-ului local:
+    python -m app.scripts.fake_tmdb --port 8765 --latency 150
+    TMDB_BASE_URL=http://127.0.0.1:8765/3 python -m app.scripts.populate_movies --pages 50
+
+Re-seed dintr-o bază nouă doar din cache-ul de pe disc (fără TMDB):
+    TMDB_CACHE_PATH=tmdb_cache.sqlite3 python -m app.scripts.populate_movies --pages 50
+    TMDB_CACHE_PATH=tmdb_cache.sqlite3 TMDB_OFFLINE=1 python -m app.scripts.populate_movies --pages 50 --rate 100000
 """
 import sys
 import os
@@ -14,38 +23,24 @@ sys.path.insert(0, str(backend_path))
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.models.movie import Movie
-from app.models.genre import Genre, MovieGenre
 from app.services.tmdb import tmdb_service
+from app.services.movie_writer import MovieBatchWriter
+from app.services.rate_limiter import TokenBucket
+from app.config import INGEST_WORKERS, INGEST_BATCH_SIZE, TMDB_RATE_LIMIT, TMDB_RATE_BURST
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 import argparse
+import queue
+import threading
 import time
 
-def get_or_create_genre(db: Session, genre_name: str) -> Genre:
-    """Găsește sau creează un gen"""
-    genre = db.query(Genre).filter(Genre.name == genre_name).first()
-    if not genre:
-        genre = Genre(name=genre_name)
-        db.add(genre)
-        db.commit()
-        db.refresh(genre)
-        print(f"  ✓ Creat gen: {genre_name}")
-    return genre
-
-def sync_genres(db: Session):
-    """Sincronizează genurile din TMDB"""
+def sync_genres(db: Session, writer: Optional[MovieBatchWriter] = None):
+    """Sincronizează genurile din TMDB (un singur INSERT pentru cele lipsă)"""
     print("📚 Sincronizare genuri din TMDB...")
+    writer = writer or MovieBatchWriter(db)
     try:
         tmdb_genres = tmdb_service.get_genres()
-        created_count = 0
-        
-        for tmdb_genre in tmdb_genres:
-            genre_name = tmdb_genre.get("name")
-            if genre_name:
-                existing = db.query(Genre).filter(Genre.name == genre_name).first()
-                if not existing:
-                    genre = Genre(name=genre_name)
-                    db.add(genre)
-                    created_count += 1
-        
+        created_count = writer.ensure_genres(g.get("name") or "" for g in tmdb_genres)
         db.commit()
         print(f"  ✓ Genuri sincronizate: {created_count} noi, {len(tmdb_genres)} total")
         return True
@@ -54,96 +49,170 @@ def sync_genres(db: Session):
         print(f"  ✗ Eroare la sincronizare genuri: {e}")
         return False
 
-def populate_movies(db: Session, source: str = "popular", num_pages: int = 5):
+class IngestStats:
+    """Contoare de progres + throughput, thread-safe (producer și writer le actualizează)"""
+
+    def __init__(self, num_pages: int, report_every: float = 2.0):
+        self.num_pages = num_pages
+        self.report_every = report_every
+        self.pages_done = 0
+        self.created = 0
+        self.skipped = 0
+        self.errors = 0
+        self.started = time.monotonic()
+        self._last_report = self.started
+        self._lock = threading.Lock()
+
+    def add(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.created / elapsed if elapsed > 0 else 0.0
+
+    def line(self) -> str:
+        elapsed = time.monotonic() - self.started
+        return (
+            f"  [{elapsed:6.1f}s] pagini {self.pages_done}/{self.num_pages} | "
+            f"create {self.created} | skip {self.skipped} | erori {self.errors} | "
+            f"{self.rate():.1f} filme/s"
+        )
+
+    def maybe_report(self):
+        now = time.monotonic()
+        if now - self._last_report >= self.report_every:
+            self._last_report = now
+            print(self.line())
+
+
+def _produce_details(
+    source: str,
+    num_pages: int,
+    pool: ThreadPoolExecutor,
+    limiter: TokenBucket,
+    out: "queue.Queue",
+    stats: IngestStats,
+):
     """
-    Populează baza de date cu filme din TMDB
-    
+    Producer: parcurge paginile de listă și trimite fetch-urile de detalii în pool.
+    Pune în `out` perechi (tmdb_id, future); `None` marchează finalul.
+    Coada e mărginită, deci producer-ul nu o ia prea mult înaintea writer-ului.
+    """
+    list_page = tmdb_service.get_top_rated_movies if source == "top_rated" else tmdb_service.get_popular_movies
+
+    def limited(fn, *args):
+        limiter.acquire()
+        return fn(*args)
+
+    # Sesiune separată: Session nu e thread-safe, writer-ul o folosește pe a lui
+    db = SessionLocal()
+    try:
+        for page in range(1, num_pages + 1):
+            try:
+                response = limited(list_page, page)
+                tmdb_ids = [m.get("id") for m in response.get("results", []) if m.get("id")]
+
+                # Un singur SELECT pe pagină pentru filmele deja existente
+                existing = {
+                    row[0]
+                    for row in db.query(Movie.tmdb_id).filter(Movie.tmdb_id.in_(tmdb_ids)).all()
+                } if tmdb_ids else set()
+                stats.add(skipped=len(existing))
+
+                for tmdb_id in tmdb_ids:
+                    if tmdb_id in existing:
+                        continue
+                    out.put((tmdb_id, pool.submit(limited, tmdb_service.get_movie_details, tmdb_id)))
+            except Exception as e:
+                print(f"  ✗ Eroare la pagina {page}: {e}")
+                stats.add(errors=1)
+            finally:
+                stats.add(pages_done=1)
+    finally:
+        db.close()
+        out.put(None)
+
+
+def _write_batch(writer: MovieBatchWriter, batch: list, stats: IngestStats):
+    try:
+        inserted = writer.write_movies(batch)
+        # Diferența = filme inserate între timp de alt proces (ON CONFLICT DO NOTHING)
+        stats.add(created=len(inserted), skipped=len(batch) - len(inserted))
+    except Exception as e:
+        stats.add(errors=len(batch))
+        print(f"  ✗ Eroare la batch-ul de {len(batch)} filme: {e}")
+
+
+def populate_movies(
+    db: Session,
+    source: str = "popular",
+    num_pages: int = 5,
+    workers: int = INGEST_WORKERS,
+    rate: float = TMDB_RATE_LIMIT,
+    batch_size: int = INGEST_BATCH_SIZE,
+    writer: Optional[MovieBatchWriter] = None,
+):
+    """
+    Populează baza de date cu filme din TMDB.
+
+    Fetch-urile de detalii rulează concurent (`workers` thread-uri) sub un
+    token bucket de `rate` req/s; scrierile în DB se fac pe thread-ul curent,
+    în batch-uri de `batch_size` filme (MovieBatchWriter), în paralel cu
+    fetch-urile încă în zbor (pipeline fetch -> write).
+
     Args:
         db: Database session
         source: "popular" sau "top_rated"
         num_pages: Număr de pagini de preluat (20 filme/pagină)
+        workers: Număr maxim de request-uri TMDB simultane
+        rate: Bugetul de request-uri TMDB pe secundă
+        batch_size: Filme scrise per tranzacție
+        writer: Writer reutilizat (ex. cel din sync_genres, cu mapa de genuri deja încărcată)
     """
-    print(f"🎬 Populare filme din TMDB ({source}, {num_pages} pagini)...")
-    
-    movies_created = 0
-    movies_skipped = 0
-    errors = 0
-    
-    for page in range(1, num_pages + 1):
-        print(f"\n📄 Pagina {page}/{num_pages}...")
-        
-        try:
-            # Preia filme populare sau top-rated
-            if source == "top_rated":
-                response = tmdb_service.get_top_rated_movies(page=page)
-            else:
-                response = tmdb_service.get_popular_movies(page=page)
-            
-            movies_data = response.get("results", [])
-            
-            for tmdb_movie_data in movies_data:
+    writer = writer or MovieBatchWriter(db)
+    print(f"🎬 Populare filme din TMDB ({source}, {num_pages} pagini, {workers} workers, {rate:g} req/s)...")
+
+    limiter = TokenBucket(rate, burst=min(TMDB_RATE_BURST, max(1, workers)))
+    stats = IngestStats(num_pages)
+    pending: "queue.Queue" = queue.Queue(maxsize=workers * 4)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tmdb") as pool:
+        producer = threading.Thread(
+            target=_produce_details,
+            args=(source, num_pages, pool, limiter, pending, stats),
+            daemon=True,
+        )
+        producer.start()
+
+        batch = []
+        while True:
+            item = pending.get()
+            if item is not None:
+                tmdb_id, future = item
                 try:
-                    tmdb_id = tmdb_movie_data.get("id")
-                    
-                    # Verifică dacă filmul există deja
-                    existing = db.query(Movie).filter(Movie.tmdb_id == tmdb_id).first()
-                    if existing:
-                        movies_skipped += 1
-                        continue
-                    
-                    # Preia detaliile complete ale filmului (pentru genuri)
-                    movie_details = tmdb_service.get_movie_details(tmdb_id)
-                    
-                    # Parsează datele
-                    movie_data = tmdb_service.parse_movie_data(movie_details)
-                    
-                    # Creează filmul
-                    movie = Movie(
-                        tmdb_id=movie_data["tmdb_id"],
-                        title=movie_data["title"],
-                        description=movie_data["description"],
-                        release_date=movie_data["release_date"],
-                        poster_url=movie_data["poster_url"],
-                        popularity=movie_data["popularity"]
-                    )
-                    db.add(movie)
-                    db.flush()  # Pentru a obține ID-ul
-                    
-                    # Adaugă genurile (many-to-many)
-                    tmdb_genres = movie_details.get("genres", [])
-                    for tmdb_genre in tmdb_genres:
-                        genre_name = tmdb_genre.get("name")
-                        if genre_name:
-                            genre = get_or_create_genre(db, genre_name)
-                            # Creează legătura many-to-many
-                            movie_genre = MovieGenre(
-                                movie_id=movie.id,
-                                genre_id=genre.id
-                            )
-                            db.add(movie_genre)
-                    
-                    db.commit()
-                    movies_created += 1
-                    print(f"  ✓ {movie.title} ({tmdb_id})")
-                    
-                    # Rate limiting - nu întreba TMDB prea des
-                    time.sleep(0.25)  # 250ms între request-uri
-                    
+                    batch.append(future.result())
                 except Exception as e:
-                    db.rollback()
-                    errors += 1
+                    stats.add(errors=1)
                     print(f"  ✗ Eroare la film {tmdb_id}: {e}")
-                    continue
-            
-        except Exception as e:
-            print(f"  ✗ Eroare la pagina {page}: {e}")
-            errors += 1
-            continue
-    
+
+            if batch and (item is None or len(batch) >= batch_size):
+                _write_batch(writer, batch, stats)
+                batch = []
+            stats.maybe_report()
+
+            if item is None:
+                break
+
+        producer.join()
+
+    print(stats.line())
     print(f"\n✅ Finalizat!")
-    print(f"   • Filme create: {movies_created}")
-    print(f"   • Filme skip (existente): {movies_skipped}")
-    print(f"   • Erori: {errors}")
+    print(f"   • Filme create: {stats.created}")
+    print(f"   • Filme skip (existente): {stats.skipped}")
+    print(f"   • Erori: {stats.errors}")
+    print(f"   • Throughput: {stats.rate():.1f} filme/s")
 
 def main():
     parser = argparse.ArgumentParser(description="Populează baza de date cu date din TMDB")
@@ -159,6 +228,24 @@ def main():
         default="popular",
         help="Sursa filmelor: popular sau top_rated (default: popular)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=INGEST_WORKERS,
+        help=f"Request-uri TMDB simultane (default: {INGEST_WORKERS})"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=TMDB_RATE_LIMIT,
+        help=f"Buget TMDB în request-uri/secundă (default: {TMDB_RATE_LIMIT:g})"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=INGEST_BATCH_SIZE,
+        help=f"Filme scrise per tranzacție (default: {INGEST_BATCH_SIZE})"
+    )
     parser.add_argument(
         "--genres-only",
         action="store_true",
@@ -169,11 +256,20 @@ def main():
     
     db: Session = SessionLocal()
     try:
-        # Sincronizează genurile întotdeauna
-        sync_genres(db)
+        # Sincronizează genurile întotdeauna; writer-ul păstrează mapa nume -> id
+        writer = MovieBatchWriter(db)
+        sync_genres(db, writer)
         
         if not args.genres_only:
-            populate_movies(db, source=args.source, num_pages=args.pages)
+            populate_movies(
+                db,
+                source=args.source,
+                num_pages=args.pages,
+                workers=max(1, args.workers),
+                rate=args.rate,
+                batch_size=max(1, args.batch_size),
+                writer=writer,
+            )
         
     finally:
         db.close()
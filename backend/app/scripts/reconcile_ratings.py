@@ -0,0 +1,162 @@
+# backend/app/scripts/reconcile_ratings.py
+"""
+Reconciliere pentru agregatele de rating întreținute incremental
+(app/services/ratings.py): movies.rating_sum / rating_count / avg_rating și
+histograma din movie_rating_stats. Le compară cu valorile calculate din
+reviews și corectează filmele cu drift.
+
+Corecția se face cu rândurile din movies blocate (FOR UPDATE) și agregatele
+recalculate după lock: o scriere de review concurentă fie e deja vizibilă
+în agregat, fie își aplică delta după commit-ul nostru, deci nu se pierde.
+
+Cu RATING_AGGREGATOR garanția nu mai ține: un review commit-uit e deja numărat
+în agregatul recalculat, dar delta lui poate sta încă în buffer-ul unui
+RatingAggregator și ar fi aplicată a doua oară la flush. De aceea scriptul
+refuză să corecteze cât timp RATING_AGGREGATOR e activ. Oprește procesele API
+(stop() face flush-ul final) sau repornește-le fără agregator, apoi rulează
+cu --force dacă RATING_AGGREGATOR e încă setat în mediu. --dry-run merge oricând.
+
+Usage: python -m app.scripts.reconcile_ratings [--dry-run] [--batch-size 500] [--force]
+"""
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_path))
+
+import argparse
+from typing import Dict, List, Optional
+from sqlalchemy import case, func, literal, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.config import RATING_AGGREGATOR
+from app.database import SessionLocal
+from app.models.movie import Movie
+from app.models.movie_rating_stats import MovieRatingStats, RATING_VALUES, STATS_COLUMNS
+from app.models.review import Review
+from app.services.ratings import TOTALS_COLUMNS, avg_from_totals, rating_aggregator
+
+AGGREGATE_COLUMNS = TOTALS_COLUMNS + STATS_COLUMNS
+
+
+def review_aggregates(db: Session, movie_ids: Optional[List[int]] = None):
+    """Valorile corecte, calculate din reviews, per film (același nume de coloane ca agregatele)"""
+    query = db.query(
+        Review.movie_id.label("movie_id"),
+        func.coalesce(func.sum(Review.rating), 0).label("rating_sum"),
+        func.count(Review.rating).label("rating_count"),
+        *(func.count(case((Review.rating == value, 1))).label(f"rating_{value}") for value in RATING_VALUES),
+        func.count(Review.id).label("review_count"),
+        func.count(case((Review.is_spoiler, 1))).label("spoiler_count"),
+    )
+    if movie_ids is not None:
+        query = query.filter(Review.movie_id.in_(movie_ids))
+    return query.group_by(Review.movie_id)
+
+
+def stored_column(column: str):
+    if column in TOTALS_COLUMNS:
+        return getattr(Movie, column)
+    return func.coalesce(getattr(MovieRatingStats, column), 0)
+
+
+def drifted_movie_ids(db: Session) -> List[int]:
+    """Filmele ale căror totaluri / avg_rating / histogramă nu corespund reviews-urilor"""
+    expected = review_aggregates(db).subquery()
+    expected_value = {column: func.coalesce(expected.c[column], 0) for column in AGGREGATE_COLUMNS}
+    rows = (
+        db.query(Movie.id)
+        .outerjoin(expected, expected.c.movie_id == Movie.id)
+        .outerjoin(MovieRatingStats, MovieRatingStats.movie_id == Movie.id)
+        .filter(or_(
+            Movie.avg_rating.is_distinct_from(
+                avg_from_totals(expected_value["rating_sum"], expected_value["rating_count"])
+            ),
+            *(stored_column(column) != expected_value[column] for column in AGGREGATE_COLUMNS),
+        ))
+        .order_by(Movie.id)
+        .all()
+    )
+    return [movie_id for (movie_id,) in rows]
+
+
+def fix_batch(db: Session, movie_ids: List[int], verbose: bool = False) -> None:
+    if rating_aggregator.active:
+        # deltele din buffer ar fi numărate de două ori (vezi docstring-ul modulului)
+        raise RuntimeError("Rating aggregator is running: stop it before reconciling")
+    # Lock pe filme (în ordinea id-urilor), apoi agregatele citite după lock
+    db.query(Movie.id).filter(Movie.id.in_(movie_ids)).order_by(Movie.id).with_for_update().all()
+    expected: Dict[int, Dict[str, int]] = {
+        row.movie_id: {column: int(getattr(row, column)) for column in AGGREGATE_COLUMNS}
+        for row in review_aggregates(db, movie_ids)
+    }
+    stats_table = MovieRatingStats.__table__
+    for movie_id in movie_ids:
+        values = expected.get(movie_id, dict.fromkeys(AGGREGATE_COLUMNS, 0))
+        if verbose:
+            current = db.query(Movie.rating_sum, Movie.rating_count, Movie.avg_rating).filter(Movie.id == movie_id).first()
+            print(f"  • film {movie_id}: {tuple(current)} -> ({values['rating_sum']}, {values['rating_count']})")
+        db.query(Movie).filter(Movie.id == movie_id).update(
+            {
+                Movie.rating_sum: values["rating_sum"],
+                Movie.rating_count: values["rating_count"],
+                Movie.avg_rating: avg_from_totals(literal(values["rating_sum"]), literal(values["rating_count"])),
+            },
+            synchronize_session=False,
+        )
+        stmt = insert(stats_table).values(movie_id=movie_id, **{column: values[column] for column in STATS_COLUMNS})
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[stats_table.c.movie_id],
+            set_={column: stmt.excluded[column] for column in STATS_COLUMNS},
+        ))
+    db.commit()
+
+
+def reconcile(db: Session, dry_run: bool = False, batch_size: int = 500, verbose: bool = False) -> int:
+    print("🔍 Caut filme cu drift la rating...")
+    movie_ids = drifted_movie_ids(db)
+    if not movie_ids:
+        print("✅ Totalurile de rating sunt consistente cu reviews")
+        return 0
+
+    print(f"⚠️ {len(movie_ids)} filme cu drift: {movie_ids[:20]}{' ...' if len(movie_ids) > 20 else ''}")
+    if dry_run:
+        print("   (dry run - nimic modificat)")
+        return len(movie_ids)
+
+    for i in range(0, len(movie_ids), batch_size):
+        try:
+            fix_batch(db, movie_ids[i:i + batch_size], verbose=verbose)
+        except Exception:
+            db.rollback()
+            raise
+    print(f"✅ Corectate {len(movie_ids)} filme")
+    return len(movie_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconciliază totalurile de rating și histograma cu reviews")
+    parser.add_argument("--dry-run", action="store_true", help="Doar raportează drift-ul")
+    parser.add_argument("--batch-size", type=int, default=500, help="Filme corectate per tranzacție")
+    parser.add_argument("--verbose", action="store_true", help="Afișează valorile vechi și noi per film")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Corectează chiar dacă RATING_AGGREGATOR e setat (doar cu procesele API oprite)",
+    )
+    args = parser.parse_args()
+
+    if RATING_AGGREGATOR and not args.dry_run and not args.force:
+        raise SystemExit(
+            "❌ RATING_AGGREGATOR e activ: deltele din buffer ar fi aplicate de două ori. "
+            "Oprește API-ul (flush la shutdown) și rulează cu --force, sau folosește --dry-run"
+        )
+
+    db: Session = SessionLocal()
+    try:
+        reconcile(db, dry_run=args.dry_run, batch_size=max(1, args.batch_size), verbose=args.verbose)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
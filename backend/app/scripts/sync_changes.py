@@ -0,0 +1,174 @@
+# backend/app/scripts/sync_changes.py
+"""
+Sincronizare incrementală cu TMDB: actualizează doar filmele locale pe care
+TMDB le raportează ca modificate (movie/changes) de la ultimul checkpoint.
+
+Cursorul (fereastra de date + pagina) e salvat în `sync_checkpoints` în
+aceeași tranzacție cu update-urile fiecărei pagini, deci un run căzut se
+reia exact de unde a rămas. Dacă detaliile unui film de pe pagină nu pot fi
+aduse (TMDB căzut, circuit deschis), run-ul se oprește fără să avanseze
+pagina; următorul run o reia. Un 404 (film șters din TMDB) e doar sărit.
+
+Usage: python -m app.scripts.sync_changes [--since 2026-10-01] [--workers 8] [--rate 40]
+"""
+import sys
+from pathlib import Path
+
+backend_path = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(backend_path))
+
+import argparse
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.database import SessionLocal
+from app.models.movie import Movie
+from app.models.sync_checkpoint import SyncCheckpoint
+from app.services.tmdb import tmdb_service
+from app.services.rate_limiter import TokenBucket
+from app.services.movie_writer import MovieBatchWriter
+from app.config import INGEST_WORKERS, TMDB_RATE_LIMIT, TMDB_RATE_BURST, TMDB_SYNC_INITIAL_DAYS
+
+CHECKPOINT_NAME = "tmdb_movie_changes"
+MAX_WINDOW_DAYS = 14  # limita TMDB pentru movie/changes
+
+
+def load_checkpoint(db: Session, since: Optional[date] = None) -> SyncCheckpoint:
+    cp = db.query(SyncCheckpoint).filter(SyncCheckpoint.name == CHECKPOINT_NAME).first()
+    if cp is None:
+        cp = SyncCheckpoint(
+            name=CHECKPOINT_NAME,
+            synced_until=since or date.today() - timedelta(days=TMDB_SYNC_INITIAL_DAYS),
+            page=1,
+        )
+        db.add(cp)
+        db.commit()
+    elif since is not None and cp.window_end is None:
+        cp.synced_until = since
+        db.commit()
+    return cp
+
+
+def open_window(db: Session, cp: SyncCheckpoint, today: date) -> bool:
+    """Deschide următoarea fereastră de sincronizare; False dacă suntem la zi"""
+    if cp.window_end is not None:
+        return True  # run întrerupt: reluăm fereastra și pagina salvate
+    if cp.synced_until >= today:
+        return False
+    cp.window_start = cp.synced_until
+    cp.window_end = min(today, cp.synced_until + timedelta(days=MAX_WINDOW_DAYS))
+    cp.page = 1
+    db.commit()
+    return True
+
+
+def sync_changes(
+    db: Session,
+    since: Optional[date] = None,
+    workers: int = INGEST_WORKERS,
+    rate: float = TMDB_RATE_LIMIT,
+):
+    cp = load_checkpoint(db, since)
+    writer = MovieBatchWriter(db)
+    limiter = TokenBucket(rate, burst=min(TMDB_RATE_BURST, max(1, workers)))
+    today = date.today()
+
+    def limited(fn, *args):
+        limiter.acquire()
+        return fn(*args)
+
+    updated = errors = 0
+    started = time.monotonic()
+    print(f"🔄 Sincronizare modificări TMDB de la {cp.window_start or cp.synced_until}...")
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tmdb") as pool:
+        while open_window(db, cp, today):
+            while True:
+                response = limited(tmdb_service.get_movie_changes, cp.window_start, cp.window_end, cp.page)
+                total_pages = response.get("total_pages") or 1
+                changed = [r["id"] for r in response.get("results", []) if r.get("id")]
+
+                # Doar filmele pe care le avem local
+                local = dict(
+                    db.query(Movie.tmdb_id, Movie.id).filter(Movie.tmdb_id.in_(changed)).all()
+                ) if changed else {}
+
+                details = []
+                failed = []
+                futures = [pool.submit(limited, tmdb_service.get_movie_details, t) for t in local]
+                for tmdb_id, future in zip(local, futures):
+                    try:
+                        details.append(future.result())
+                    except requests.HTTPError as e:
+                        if e.response is None or e.response.status_code != 404:
+                            failed.append(tmdb_id)
+                        errors += 1
+                        print(f"  ✗ Eroare la film {tmdb_id}: {e}")
+                    except Exception as e:
+                        failed.append(tmdb_id)
+                        errors += 1
+                        print(f"  ✗ Eroare la film {tmdb_id}: {e}")
+
+                if failed:
+                    # Pagina nu e marcată ca gata: filmele ei s-ar pierde la închiderea ferestrei
+                    db.rollback()
+                    raise RuntimeError(
+                        f"{len(failed)} filme de pe pagina {cp.page} nu au putut fi aduse din TMDB; "
+                        f"checkpoint-ul rămâne pe pagina {cp.page}, rulează din nou mai târziu"
+                    )
+
+                # Update-urile paginii + avansarea cursorului: o singură tranzacție
+                try:
+                    count = writer.update_movies(local, details, commit=False)
+                    cp.page += 1
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+                updated += count
+
+                elapsed = time.monotonic() - started
+                print(
+                    f"  [{elapsed:6.1f}s] {cp.window_start}..{cp.window_end} pagina {cp.page - 1}/{total_pages} | "
+                    f"modificate {len(changed)} | locale {len(local)} | actualizate {updated} | erori {errors}"
+                )
+                if cp.page > total_pages:
+                    break
+
+            # Fereastra e completă: o închidem și avansăm synced_until
+            cp.synced_until = cp.window_end
+            cp.window_start = cp.window_end = None
+            cp.page = 1
+            db.commit()
+
+    print(f"\n✅ Sincronizat până la {cp.synced_until}")
+    print(f"   • Filme actualizate: {updated}")
+    print(f"   • Erori: {errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sincronizare incrementală cu TMDB (movie/changes)")
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        default=None,
+        help="Suprascrie checkpoint-ul: sincronizează de la această dată (YYYY-MM-DD)"
+    )
+    parser.add_argument("--workers", type=int, default=INGEST_WORKERS, help="Request-uri TMDB simultane")
+    parser.add_argument("--rate", type=float, default=TMDB_RATE_LIMIT, help="Buget TMDB în request-uri/secundă")
+    args = parser.parse_args()
+
+    db: Session = SessionLocal()
+    try:
+        sync_changes(db, since=args.since, workers=max(1, args.workers), rate=args.rate)
+    except RuntimeError as e:
+        raise SystemExit(f"❌ {e}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
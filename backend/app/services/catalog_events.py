@@ -0,0 +1,35 @@
+# backend/app/services/catalog_events.py
+"""
+Punct unic prin care scrierile din proces anunță schimbări în catalog, ca
+structurile in-memory (indexul de titluri, cache-ul de răspunsuri) să rămână
+consistente cu DB-ul. Se apelează după commit.
+"""
+from typing import Dict, List
+from app.services.response_cache import response_cache
+from app.services.title_index import title_index
+
+# Tag-uri din response cache
+MOVIE_LISTS = "movie-lists"
+RATED_MOVIE_LISTS = "movie-lists:rated"
+GENRES = "genres"
+
+
+def movie_tag(movie_id: int) -> str:
+    return f"movie:{movie_id}"
+
+
+def movies_inserted(rows: List[Dict]) -> None:
+    """Filme noi (POST /movies/, coada de importuri): pot apărea în orice listă"""
+    title_index.add_many(rows)
+    # write_movies poate crea și genuri noi
+    response_cache.invalidate(MOVIE_LISTS, GENRES)
+
+
+def movie_rating_changed(movie_id: int) -> None:
+    """
+    avg_rating s-a schimbat: detaliile filmului și listele care îl conțin,
+    plus listele filtrate după min_rating (filmul poate intra / ieși din ele).
+    Ordinea listelor (movie_sort_keys) nu depinde de avg_rating, deci filmul
+    nu se mută în pagini care nu-l conțin deja.
+    """
+    response_cache.invalidate(movie_tag(movie_id), RATED_MOVIE_LISTS)
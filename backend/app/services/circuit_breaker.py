@@ -0,0 +1,70 @@
+# backend/app/services/circuit_breaker.py
+import threading
+import time
+
+
+class CircuitOpenError(Exception):
+    """Circuit breaker deschis: dependența e considerată căzută, nu mai încercăm"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} circuit is open, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker thread-safe (closed -> open -> half-open).
+
+    După `failure_threshold` eșecuri consecutive circuitul se deschide și
+    `before_call` aruncă CircuitOpenError imediat, timp de `reset_timeout`
+    secunde. Apoi un singur apel de probă e lăsat să treacă (half-open):
+    succesul închide circuitul, eșecul îl redeschide. Apelantul care a primit
+    proba (before_call() == True) cheamă release_probe() într-un finally, ca
+    o excepție neprevăzută să nu lase circuitul blocat în half-open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> bool:
+        """Aruncă CircuitOpenError cât timp circuitul e deschis; True dacă apelul e proba half-open"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return False
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            raise CircuitOpenError(self.name, max(remaining, 0.0))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Eliberează proba half-open dacă apelul n-a ajuns la record_success / record_failure"""
+        with self._lock:
+            self._probe_in_flight = False
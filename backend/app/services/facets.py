@@ -0,0 +1,93 @@
+# backend/app/services/facets.py
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.models.genre import Genre
+
+# Cheie pentru pg_try_advisory_xact_lock: un singur proces face REFRESH odată
+REFRESH_LOCK_KEY = 0x6D66616365  # "mface"
+
+
+class FacetRollup:
+    """
+    Numărătorile pentru chip-urile de filtre (gen / an / rating), calculate din
+    materialized view-ul `movie_facets` (vezi migrarea 3f8da37049b2).
+
+    View-ul are câteva mii de rânduri (gen x an x bucket), așa că e ținut
+    integral în memorie și reîmprospătat periodic; un request doar însumează
+    rândurile potrivite, fără GROUP BY live peste movies / movie_genres.
+    """
+
+    def __init__(self):
+        self._rows: List[Tuple[int, int, int, int]] = []
+        self._genre_names: Dict[int, str] = {}
+        self.refreshed_at: Optional[datetime] = None
+
+    def load(self, db: Session) -> None:
+        rows = [
+            tuple(r) for r in db.execute(text("SELECT genre_id, year, rating_bucket, movies FROM movie_facets"))
+        ]
+        names = dict(db.query(Genre.id, Genre.name).all())
+        # înlocuire atomică: request-urile în curs văd fie setul vechi, fie cel nou
+        self._rows, self._genre_names = rows, names
+        self.refreshed_at = datetime.utcnow()
+
+    def refresh(self, db: Session) -> None:
+        """REFRESH CONCURRENTLY (dacă niciun alt proces nu o face deja), apoi reîncarcă"""
+        if db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": REFRESH_LOCK_KEY}).scalar():
+            db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY movie_facets"))
+        db.commit()
+        self.load(db)
+
+    def facets(
+        self,
+        genre_id: Optional[int] = None,
+        year: Optional[int] = None,
+        min_rating: Optional[int] = None,
+    ) -> dict:
+        """
+        Fiecare dimensiune e numărată cu celelalte filtre aplicate, dar nu cu
+        al ei (ex. anii arată câte filme are fiecare an pentru genul ales),
+        ca chip-urile să rămână utilizabile pentru schimbarea selecției.
+        """
+        rows, names = self._rows, self._genre_names
+        genres: Counter = Counter()
+        years: Counter = Counter()
+        ratings: Counter = Counter()
+        total = 0
+
+        for g, y, bucket, count in rows:
+            year_ok = year is None or y == year
+            rating_ok = min_rating is None or bucket >= min_rating
+            if g != 0 and year_ok and rating_ok:
+                genres[g] += count
+            # ani / rating / total: rândurile fără gen, sau cele ale genului filtrat
+            if g == (genre_id or 0):
+                if rating_ok:
+                    years[y] += count
+                if year_ok:
+                    ratings[bucket] += count
+                if year_ok and rating_ok:
+                    total += count
+
+        return {
+            "total": total,
+            "genres": [
+                {"id": gid, "name": names.get(gid, ""), "count": count}
+                for gid, count in sorted(genres.items(), key=lambda kv: (-kv[1], names.get(kv[0], "")))
+            ],
+            "years": [
+                {"year": y or None, "count": count}
+                for y, count in sorted(years.items(), reverse=True)
+            ],
+            "ratings": [
+                {"rating": bucket, "count": count}
+                for bucket, count in sorted(ratings.items(), reverse=True)
+            ],
+            "refreshed_at": self.refreshed_at,
+        }
+
+
+facet_rollup = FacetRollup()
@@ -0,0 +1,52 @@
+# backend/app/services/genre_cache.py
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+from app.database import SessionLocal
+from app.models.genre import Genre
+
+# Un id necunoscut declanșează reîncărcarea, dar nu mai des de atât
+RELOAD_MIN_INTERVAL = 5.0
+
+
+class GenreCache:
+    """
+    Tabela de genuri (câteva zeci de rânduri) ținută în memorie, ca listele
+    de filme să rezolve genre_id -> nume fără join / query per film. Genurile noi
+    (create la import) sunt preluate la primul id necunoscut.
+    """
+
+    def __init__(self):
+        self._names: Dict[int, str] = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def reload(self) -> None:
+        db = SessionLocal()
+        try:
+            names = dict(db.query(Genre.id, Genre.name).all())
+        finally:
+            db.close()
+        self._names = names
+        self._loaded_at = time.monotonic()
+
+    def name(self, genre_id: int) -> Optional[str]:
+        name = self._names.get(genre_id)
+        if name is None:
+            with self._lock:
+                if genre_id not in self._names and time.monotonic() - self._loaded_at >= RELOAD_MIN_INTERVAL:
+                    self.reload()
+            name = self._names.get(genre_id)
+        return name
+
+    def genres(self, genre_ids: Iterable[int]) -> List[dict]:
+        """[{id, name}] sortate după nume, forma GenreOut; id-urile necunoscute sunt omise"""
+        resolved = []
+        for genre_id in genre_ids:
+            name = self.name(genre_id)
+            if name is not None:
+                resolved.append({"id": genre_id, "name": name})
+        return sorted(resolved, key=lambda g: g["name"])
+
+
+genre_cache = GenreCache()
@@ -0,0 +1,314 @@
+# backend/app/services/import_queue.py
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+from app.config import (
+    IMPORT_QUEUE_SIZE, IMPORT_QUEUE_WORKERS, IMPORT_BATCH_SIZE, IMPORT_BATCH_WAIT,
+    IMPORT_MAX_ATTEMPTS, IMPORT_RETRY_DELAY,
+)
+from app.database import SessionLocal
+from app.models.import_job import ImportJob
+from app.models.movie import Movie
+from app.services.movie_import import tmdb_executor
+from app.services.movie_writer import MovieBatchWriter
+from app.services.catalog_events import movies_inserted
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.tmdb import tmdb_service
+
+# Un job "running" neatins de atâta timp aparține unui proces căzut
+STALE_RUNNING_AFTER = timedelta(minutes=10)
+# Cât de des caută un worker inactiv joburi rămase doar în DB
+RECOVER_EVERY = 30.0
+
+
+class ImportQueueFull(Exception):
+    """Coada de importuri e plină; clientul trebuie să reîncerce mai târziu"""
+
+
+class ImportQueue:
+    """
+    Coadă in-process pentru importuri TMDB, mărginită și persistată în
+    `import_jobs`. Workerii scot până la `batch_size` joburi odată: un singur
+    claim în DB, fetch-uri TMDB concurente și un singur MovieBatchWriter
+    (o tranzacție) pentru tot batch-ul.
+
+    Tabela e sursa de adevăr: la pornire (și periodic, când coada e goală)
+    joburile rămase "queued" sunt reîncărcate, deci nimic nu se pierde la
+    restart sau când coada in-memory e plină. Tot periodic, joburile
+    "running" abandonate de un proces căzut revin în "queued".
+
+    Eșecuri: un 404 / eroare TMDB marchează jobul "failed" direct. Cu
+    circuitul TMDB deschis jobul revine în "queued" cu run_after = momentul
+    redeschiderii, fără să consume o încercare. Dacă scrierea batch-ului
+    eșuează, filmele sunt rescrise unul câte unul ca să izolăm payload-ul
+    stricat; jobul care tot eșuează (ca și cele dintr-un batch întrerupt de
+    o eroare neprevăzută) e reluat după IMPORT_RETRY_DELAY, până la
+    IMPORT_MAX_ATTEMPTS încercări, apoi devine "failed".
+    """
+
+    def __init__(
+        self,
+        maxsize: int = IMPORT_QUEUE_SIZE,
+        workers: int = IMPORT_QUEUE_WORKERS,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        batch_wait: float = IMPORT_BATCH_WAIT,
+    ):
+        self._queue: "queue.Queue[int]" = queue.Queue(maxsize=maxsize)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._recover_lock = threading.Lock()
+        self._last_recover = 0.0
+
+    # ---- API folosit de router ----
+
+    def submit(self, db: Session, tmdb_id: int) -> ImportJob:
+        if self._queue.full():
+            raise ImportQueueFull()
+
+        # Deja importat: jobul e gata direct, fără să mai treacă prin coadă
+        movie_id = db.query(Movie.id).filter(Movie.tmdb_id == tmdb_id).scalar()
+        job = ImportJob(
+            tmdb_id=tmdb_id,
+            status="done" if movie_id else "queued",
+            movie_id=movie_id,
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        if job.status == "queued":
+            try:
+                self._queue.put_nowait(job.id)
+            except queue.Full:
+                # Rămâne "queued" în DB; îl preia următorul recover
+                pass
+        return job
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    # ---- lifecycle ----
+
+    def start(self):
+        self._stop.clear()
+        try:
+            self._recover(force=True)
+        except Exception as e:
+            # DB indisponibil la pornire: workerii reîncearcă recover-ul periodic
+            print(f"✗ Import queue recovery failed: {e}")
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"import-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self, timeout: float = 10.0):
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+    # ---- worker ----
+
+    def _run(self):
+        while not self._stop.is_set():
+            batch = self._next_batch()
+            try:
+                if batch:
+                    self._process(batch)
+                self._recover()
+            except Exception as e:
+                print(f"✗ Import worker error: {e}")
+
+    def _next_batch(self) -> List[int]:
+        try:
+            batch = [self._queue.get(timeout=1.0)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.batch_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _process(self, job_ids: List[int]):
+        db = SessionLocal()
+        claimed = []
+        try:
+            # Claim atomic: un job e preluat o singură dată, chiar cu mai multe procese
+            now = datetime.utcnow()
+            claimed = db.execute(
+                update(ImportJob)
+                .where(
+                    ImportJob.id.in_(job_ids),
+                    ImportJob.status == "queued",
+                    or_(ImportJob.run_after.is_(None), ImportJob.run_after <= now),
+                )
+                .values(status="running", attempts=ImportJob.attempts + 1, run_after=None, updated_at=now)
+                .returning(ImportJob.id, ImportJob.tmdb_id, ImportJob.attempts)
+            ).all()
+            db.commit()
+            if not claimed:
+                return
+
+            tmdb_ids = {tmdb_id for _, tmdb_id, _ in claimed}
+            movie_ids: Dict[int, int] = dict(
+                db.query(Movie.tmdb_id, Movie.id).filter(Movie.tmdb_id.in_(tmdb_ids)).all()
+            )
+
+            # Fetch-uri concurente doar pentru ce lipsește
+            errors: Dict[int, str] = {}
+            retry_errors: Dict[int, str] = {}
+            circuit_open: Dict[int, float] = {}
+            futures = {
+                t: tmdb_executor.submit(tmdb_service.get_movie_details, t)
+                for t in tmdb_ids if t not in movie_ids
+            }
+            details = []
+            for tmdb_id, future in futures.items():
+                try:
+                    details.append(future.result())
+                except CircuitOpenError as e:
+                    circuit_open[tmdb_id] = e.retry_after
+                except Exception as e:
+                    errors[tmdb_id] = str(e) or type(e).__name__
+
+            if details:
+                movie_ids.update(self._write(db, details, retry_errors))
+                # Conflicte cu alte procese: citim id-urile câștigătorilor
+                raced = [d["id"] for d in details if d["id"] not in movie_ids]
+                if raced:
+                    movie_ids.update(
+                        db.query(Movie.tmdb_id, Movie.id).filter(Movie.tmdb_id.in_(raced)).all()
+                    )
+
+            now = datetime.utcnow()
+            rows = []
+            for job_id, tmdb_id, attempts in claimed:
+                if tmdb_id in movie_ids:
+                    rows.append({
+                        "id": job_id, "status": "done", "movie_id": movie_ids[tmdb_id], "error": None, "updated_at": now,
+                    })
+                elif tmdb_id in circuit_open:
+                    # TMDB e căzut, nu jobul: încercarea nu se pune la socoteală
+                    rows.append({
+                        "id": job_id, "status": "queued", "attempts": attempts - 1,
+                        "run_after": now + timedelta(seconds=circuit_open[tmdb_id]), "updated_at": now,
+                    })
+                elif tmdb_id in retry_errors:
+                    rows.append(self._retry_row(job_id, attempts, retry_errors[tmdb_id], now))
+                else:
+                    error = errors.get(tmdb_id, "Import failed")
+                    rows.append({"id": job_id, "status": "failed", "error": error, "updated_at": now})
+            db.execute(update(ImportJob), rows)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            # Joburile revin în coadă (prin recover) în loc să rămână blocate în "running"
+            error = str(e) or type(e).__name__
+            now = datetime.utcnow()
+            rows = [self._retry_row(job_id, attempts, error, now) for job_id, _, attempts in claimed]
+            if rows:
+                db.execute(update(ImportJob), rows)
+                db.commit()
+            raise
+        finally:
+            db.close()
+
+    def _write(self, db: Session, details: List[Dict], errors: Dict[int, str]) -> Dict[int, int]:
+        """
+        Scrie batch-ul într-o tranzacție; dacă eșuează, filmele sunt rescrise
+        unul câte unul, iar cele care tot eșuează ajung în `errors`.
+        """
+        writer = MovieBatchWriter(db, on_inserted=movies_inserted)
+        try:
+            return writer.write_movies(details)
+        except Exception as e:
+            if len(details) == 1:
+                errors[details[0]["id"]] = str(e) or type(e).__name__
+                return {}
+        written: Dict[int, int] = {}
+        for detail in details:
+            try:
+                written.update(writer.write_movies([detail]))
+            except Exception as e:
+                errors[detail["id"]] = str(e) or type(e).__name__
+        return written
+
+    @staticmethod
+    def _retry_row(job_id: int, attempts: int, error: str, now: datetime) -> Dict:
+        """Jobul e reluat mai târziu sau, după IMPORT_MAX_ATTEMPTS încercări, marcat "failed" """
+        if attempts >= IMPORT_MAX_ATTEMPTS:
+            return {"id": job_id, "status": "failed", "error": error, "updated_at": now}
+        return {
+            "id": job_id, "status": "queued", "error": error,
+            "run_after": now + timedelta(seconds=IMPORT_RETRY_DELAY * attempts), "updated_at": now,
+        }
+
+    # ---- recovery ----
+
+    def _requeue_stale(self, db: Session):
+        """Joburile "running" ale unui proces căzut: înapoi în "queued" sau "failed" după IMPORT_MAX_ATTEMPTS"""
+        now = datetime.utcnow()
+        stale = (ImportJob.status == "running", ImportJob.updated_at < now - STALE_RUNNING_AFTER)
+        db.execute(
+            update(ImportJob)
+            .where(*stale, ImportJob.attempts >= IMPORT_MAX_ATTEMPTS)
+            .values(status="failed", error="Import abandoned by a stopped worker", updated_at=now)
+        )
+        db.execute(
+            update(ImportJob)
+            .where(*stale)
+            .values(status="queued", updated_at=now)
+        )
+        db.commit()
+
+    def _recover(self, force: bool = False):
+        """
+        La RECOVER_EVERY secunde: repune în "queued" joburile "running"
+        abandonate și, dacă coada in-memory e goală, reîncarcă joburile
+        "queued" rămase doar în DB (cele cu run_after trecut).
+        """
+        with self._recover_lock:
+            now = time.monotonic()
+            if not force and now - self._last_recover < RECOVER_EVERY:
+                return
+            self._last_recover = now
+
+            db = SessionLocal()
+            try:
+                self._requeue_stale(db)
+                if not self._queue.empty():
+                    return
+                free = self._queue.maxsize - self._queue.qsize()
+                job_ids = [
+                    job_id for (job_id,) in db.query(ImportJob.id)
+                    .filter(
+                        ImportJob.status == "queued",
+                        or_(ImportJob.run_after.is_(None), ImportJob.run_after <= datetime.utcnow()),
+                    )
+                    .order_by(ImportJob.id)
+                    .limit(free)
+                ]
+            finally:
+                db.close()
+
+            for job_id in job_ids:
+                try:
+                    self._queue.put_nowait(job_id)
+                except queue.Full:
+                    break
+
+
+import_queue = ImportQueue()
@@ -0,0 +1,156 @@
+# backend/app/services/leaderboards.py
+import heapq
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.config import (
+    LEADERBOARD_REBUILD, LEADERBOARD_SIZE, LEADERBOARD_MIN_VOTES,
+    TRENDING_HALF_LIFE_HOURS, TRENDING_WINDOW_DAYS,
+)
+from app.models.diary_entry import DiaryEntry
+from app.models.movie import Movie
+from app.models.review import Review
+from app.services.response_cache import response_cache
+
+# Tag în response cache pentru paginile de leaderboard (invalidat la fiecare snapshot nou)
+LEADERBOARDS = "leaderboards"
+
+# Ponderea unui eveniment la momentul creării, în scorul de trending
+REVIEW_WEIGHT = 2.0
+DIARY_WEIGHT = 1.0
+
+Ranking = List[Tuple[int, float]]  # (movie_id, scor), descrescător
+
+
+class Leaderboards:
+    """
+    Clasamentele "top rated" și "trending", ținute ca snapshot-uri ordonate
+    în memorie și servite fără query de ranking.
+
+    Top rated: media bayesiană (rating_sum + m * C) / (rating_count + m), cu C
+    media globală a rating-urilor și m = LEADERBOARD_MIN_VOTES, ca un film cu
+    un singur 10/10 să nu treacă înaintea unui film cu sute de note bune.
+    Totalurile per film sunt completate incremental din filmele cu rev nou.
+
+    Trending: suma ponderilor review-urilor și intrărilor din jurnal, fiecare
+    cu decădere exponențială (half-life TRENDING_HALF_LIFE_HOURS). Scorurile
+    sunt decăzute în bloc la fiecare refresh și primesc doar evenimentele cu
+    id nou. Ce iese din fereastră e eliminat.
+
+    Incrementul nu vede ștergerile de review / jurnal și nici rândurile
+    commit-uite cu întârziere față de watermark; reconstrucția completă de la
+    LEADERBOARD_REBUILD secunde le corectează.
+    """
+
+    def __init__(
+        self,
+        size: int = LEADERBOARD_SIZE,
+        min_votes: int = LEADERBOARD_MIN_VOTES,
+        half_life_hours: float = TRENDING_HALF_LIFE_HOURS,
+        window_days: int = TRENDING_WINDOW_DAYS,
+        rebuild_every: float = LEADERBOARD_REBUILD,
+    ):
+        self.size = size
+        self.min_votes = min_votes
+        self.decay = math.log(2) / (half_life_hours * 3600)
+        self.window = timedelta(days=window_days)
+        self.rebuild_every = rebuild_every
+        # sub acest scor, un film nu mai are activitate în fereastră
+        self.min_score = min(REVIEW_WEIGHT, DIARY_WEIGHT) * math.exp(-self.decay * self.window.total_seconds())
+
+        # starea incrementală (doar thread-ul de refresh o modifică)
+        self._totals: Dict[int, Tuple[int, int]] = {}  # movie_id -> (rating_sum, rating_count)
+        self._movies_rev = 0
+        self._scores: Dict[int, float] = {}
+        self._scored_at: Optional[datetime] = None
+        self._review_id = 0
+        self._diary_id = 0
+        self._rebuilt_at = 0.0
+
+        # snapshot-urile servite; înlocuite atomic
+        self.top_rated: Ranking = []
+        self.trending: Ranking = []
+        self.refreshed_at: Optional[datetime] = None
+
+    # ---- refresh (PeriodicTask) ----
+
+    def refresh(self, db: Session) -> None:
+        if self._scored_at is None or time.monotonic() - self._rebuilt_at >= self.rebuild_every:
+            self.rebuild(db)
+        else:
+            self._catch_up_totals(db)
+            self._catch_up_scores(db)
+        self._publish()
+
+    def rebuild(self, db: Session) -> None:
+        """Recalculare completă a stării incrementale"""
+        self._totals, self._movies_rev = {}, 0
+        self._scores, self._scored_at = {}, None
+        self._review_id = self._diary_id = 0
+        self._catch_up_totals(db)
+        self._catch_up_scores(db)
+        self._rebuilt_at = time.monotonic()
+
+    def _catch_up_totals(self, db: Session) -> None:
+        # ix_movies_rev: doar filmele modificate de la ultimul refresh
+        rows = (
+            db.query(Movie.id, Movie.rating_sum, Movie.rating_count, Movie.rev)
+            .filter(Movie.rev > self._movies_rev)
+            .all()
+        )
+        for movie_id, rating_sum, rating_count, rev in rows:
+            if rating_count:
+                self._totals[movie_id] = (rating_sum, rating_count)
+            else:
+                self._totals.pop(movie_id, None)
+            self._movies_rev = max(self._movies_rev, rev)
+
+    def _catch_up_scores(self, db: Session) -> None:
+        now = datetime.utcnow()
+        cutoff = now - self.window
+        if self._scored_at is not None:
+            factor = math.exp(-self.decay * (now - self._scored_at).total_seconds())
+            self._scores = {
+                movie_id: score * factor
+                for movie_id, score in self._scores.items()
+                if score * factor >= self.min_score
+            }
+        self._scored_at = now
+
+        for model, weight, attr in ((Review, REVIEW_WEIGHT, "_review_id"), (DiaryEntry, DIARY_WEIGHT, "_diary_id")):
+            rows = (
+                db.query(model.id, model.movie_id, model.created_at)
+                .filter(model.id > getattr(self, attr), model.created_at >= cutoff)
+                .all()
+            )
+            for event_id, movie_id, created_at in rows:
+                age = max(0.0, (now - created_at).total_seconds())
+                self._scores[movie_id] = self._scores.get(movie_id, 0.0) + weight * math.exp(-self.decay * age)
+                if event_id > getattr(self, attr):
+                    setattr(self, attr, event_id)
+            if not rows and getattr(self, attr) == 0:
+                # fără activitate în fereastră: watermark-ul pornește de la ultimul id existent
+                last_id = db.query(model.id).order_by(model.id.desc()).limit(1).scalar()
+                setattr(self, attr, last_id or 0)
+
+    def _publish(self) -> None:
+        total_sum = sum(s for s, _ in self._totals.values())
+        total_count = sum(c for _, c in self._totals.values())
+        mean = total_sum / total_count if total_count else 0.0
+        m = self.min_votes
+
+        top_rated = heapq.nlargest(
+            self.size,
+            ((movie_id, (s + m * mean) / (c + m)) for movie_id, (s, c) in self._totals.items()),
+            key=lambda item: (item[1], -item[0]),
+        )
+        trending = heapq.nlargest(self.size, self._scores.items(), key=lambda item: (item[1], -item[0]))
+
+        self.top_rated, self.trending = top_rated, trending
+        self.refreshed_at = datetime.utcnow()
+        response_cache.invalidate(LEADERBOARDS)
+
+
+leaderboards = Leaderboards()
@@ -0,0 +1,112 @@
+# backend/app/services/list_rows.py
+"""
+Construcția listelor direct din rânduri (tuple de coloane) pentru calea
+rapidă de serializare (app/utils/fast_json.py). Dict-urile au exact forma
+schemelor MovieOut / ReviewOut / DiaryOut / WatchListWithMovieOut.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+from sqlalchemy.orm import Session
+from app.models.genre import MovieGenre
+from app.models.movie import Movie
+from app.models.review import Review
+from app.models.user import User
+from app.schemas.movie import MovieCardOut, MovieOut
+from app.schemas.review import ReviewAuthorOut, ReviewOut
+from app.services.genre_cache import genre_cache
+
+MOVIE_COLUMNS = {name: getattr(Movie, name) for name in MovieOut.model_fields if name != "genres"}
+REVIEW_COLUMNS = {name: getattr(Review, name) for name in ReviewOut.model_fields}
+# embed= pe listele de reviews: autorul și cardul filmului, din același SELECT (join)
+AUTHOR_COLUMNS = {name: getattr(User, name) for name in ReviewAuthorOut.model_fields}
+MOVIE_CARD_COLUMNS = {name: getattr(Movie, name) for name in MovieCardOut.model_fields}
+REVIEW_EMBEDS = {"author": AUTHOR_COLUMNS, "movie": MOVIE_CARD_COLUMNS}
+
+
+def movie_columns(fields: Optional[Sequence[str]] = None) -> List[str]:
+    return [name for name in (fields or MovieOut.model_fields) if name in MOVIE_COLUMNS]
+
+
+def review_columns(fields: Optional[Sequence[str]] = None) -> List[str]:
+    return [name for name in (fields or ReviewOut.model_fields) if name in REVIEW_COLUMNS]
+
+
+def to_dicts(rows: Iterable[Sequence], names: Sequence[str]) -> List[dict]:
+    return [dict(zip(names, row)) for row in rows]
+
+
+def genres_by_movie(db: Session, movie_ids: Iterable[int]) -> Dict[int, List[dict]]:
+    """Un singur SELECT pe movie_genres pentru toată pagina; numele din GenreCache"""
+    ids = list(set(movie_ids))
+    if not ids:
+        return {}
+    genre_ids: Dict[int, List[int]] = {movie_id: [] for movie_id in ids}
+    for movie_id, genre_id in db.query(MovieGenre.movie_id, MovieGenre.genre_id).filter(MovieGenre.movie_id.in_(ids)):
+        genre_ids[movie_id].append(genre_id)
+    return {movie_id: genre_cache.genres(genre_ids[movie_id]) for movie_id in ids}
+
+
+def attach_genres(db: Session, movies: List[dict]) -> None:
+    genres = genres_by_movie(db, (m["id"] for m in movies))
+    for movie in movies:
+        movie["genres"] = genres[movie["id"]]
+
+
+def resolve_movie_genres(movies: Iterable[Optional[Movie]]) -> None:
+    """
+    Obiecte Movie (cu genres încărcat prin selectinload) -> movie.genre_list =
+    [{id, name}] din GenreCache, citit de MovieOut. Se apelează înainte de
+    serializare, pe thread-ul handler-ului (poate reîncărca GenreCache).
+    """
+    for movie in movies:
+        if movie is not None:
+            movie.genre_list = genre_cache.genres(g.genre_id for g in movie.genres)
+
+
+def split_movie_rows(db: Session, rows: Iterable[Sequence], head: Sequence[str]) -> List[dict]:
+    """
+    Rânduri (head..., coloanele MovieOut...) -> dict cu `movie` imbricat,
+    plus genurile filmelor din pagină (un singur query).
+    """
+    movie_names = list(MOVIE_COLUMNS)
+    items = []
+    for row in rows:
+        item = dict(zip(head, row[:len(head)]))
+        item["movie"] = dict(zip(movie_names, row[len(head):len(head) + len(movie_names)]))
+        items.append(item)
+    attach_genres(db, [item["movie"] for item in items])
+    return items
+
+
+def diary_columns(entry_fields: Sequence) -> list:
+    """Coloanele pentru DiaryOut: intrarea, filmul și review-ul (outer join)"""
+    return [*entry_fields, *MOVIE_COLUMNS.values(), *REVIEW_COLUMNS.values()]
+
+
+def diary_dicts(db: Session, rows: Iterable[Sequence], head: Sequence[str]) -> List[dict]:
+    rows = list(rows)
+    review_names = list(REVIEW_COLUMNS)
+    items = split_movie_rows(db, rows, head)
+    offset = len(head) + len(MOVIE_COLUMNS)
+    for item, row in zip(items, rows):
+        review = dict(zip(review_names, row[offset:offset + len(review_names)]))
+        item["review"] = review if review["id"] is not None else None
+    return items
+
+
+def embed_columns(embed: Sequence[str]) -> list:
+    """Coloanele adăugate după cele ale review-ului, în ordinea din `embed`"""
+    return [column for name in embed for column in REVIEW_EMBEDS[name].values()]
+
+
+def review_dicts(rows: Iterable[Sequence], names: Sequence[str], embed: Sequence[str] = ()) -> List[dict]:
+    """Rânduri (coloanele review-ului..., coloanele fiecărui embed...) -> dict cu embed-urile imbricate"""
+    items = []
+    for row in rows:
+        item = dict(zip(names, row))
+        offset = len(names)
+        for name in embed:
+            embed_names = list(REVIEW_EMBEDS[name])
+            item[name] = dict(zip(embed_names, row[offset:offset + len(embed_names)]))
+            offset += len(embed_names)
+        items.append(item)
+    return items
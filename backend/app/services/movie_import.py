@@ -0,0 +1,68 @@
+# backend/app/services/movie_import.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Hashable
+from fastapi.concurrency import run_in_threadpool
+from app.config import TMDB_IMPORT_WORKERS
+from app.database import SessionLocal
+from app.models.movie import Movie
+from app.services.movie_writer import MovieBatchWriter
+from app.services.catalog_events import movies_inserted
+from app.services.tmdb import tmdb_service
+
+# Executor dedicat pentru request-urile TMDB: un TMDB lent nu ocupă
+# threadpool-ul din care FastAPI servește handler-ele sync.
+tmdb_executor = ThreadPoolExecutor(max_workers=TMDB_IMPORT_WORKERS, thread_name_prefix="tmdb-import")
+
+
+class SingleFlight:
+    """
+    Apelurile concurente cu aceeași cheie împart un singur task în zbor.
+    Task-ul e protejat cu shield: dacă un client se deconectează, ceilalți
+    (și importul în sine) nu sunt anulați.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable]):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+
+_imports = SingleFlight()
+
+
+def _save_movie(movie_details: Dict) -> int:
+    """Insert tolerant la conflicte; întoarce id-ul rândului, oricine l-ar fi inserat"""
+    db = SessionLocal()
+    try:
+        inserted = MovieBatchWriter(db, on_inserted=movies_inserted).write_movies([movie_details])
+        movie_id = inserted.get(movie_details["id"])
+        if movie_id is None:
+            # Alt proces a câștigat cursa pe tmdb_id -> folosim rândul lui
+            movie_id = db.query(Movie.id).filter(Movie.tmdb_id == movie_details["id"]).scalar()
+        return movie_id
+    finally:
+        db.close()
+
+
+async def _import(tmdb_id: int) -> int:
+    loop = asyncio.get_running_loop()
+    movie_details = await loop.run_in_executor(tmdb_executor, tmdb_service.get_movie_details, tmdb_id)
+    return await run_in_threadpool(_save_movie, movie_details)
+
+
+async def import_movie(tmdb_id: int) -> int:
+    """
+    Importă un film din TMDB și întoarce movie_id-ul local. Importurile
+    concurente ale aceluiași tmdb_id împart un singur fetch + insert.
+    """
+    return await _imports.do(tmdb_id, lambda: _import(tmdb_id))
@@ -0,0 +1,129 @@
+# backend/app/services/movie_writer.py
+from typing import Callable, Dict, Iterable, List, Optional
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.models.movie import Movie
+from app.models.genre import Genre, MovieGenre
+from app.services.tmdb import tmdb_service
+
+
+class MovieBatchWriter:
+    """
+    Scrie filme + genuri din TMDB în batch-uri.
+
+    Genurile sunt rezolvate dintr-o mapă nume -> id încărcată o singură dată;
+    filmele și rândurile movie_genres intră prin INSERT ... ON CONFLICT
+    multi-row, cu o singură tranzacție per batch.
+
+    `on_inserted` (opțional) primește rândurile inserate efectiv (cu `id`),
+    după commit; aplicația îl folosește ca să țină la zi indexurile in-memory.
+    """
+
+    def __init__(self, db: Session, on_inserted: Optional[Callable[[List[Dict]], None]] = None):
+        self.db = db
+        self.on_inserted = on_inserted
+        self._genre_ids: Optional[Dict[str, int]] = None
+
+    @property
+    def genre_ids(self) -> Dict[str, int]:
+        if self._genre_ids is None:
+            self._genre_ids = {name: gid for gid, name in self.db.execute(select(Genre.id, Genre.name))}
+        return self._genre_ids
+
+    def ensure_genres(self, names: Iterable[str]) -> int:
+        """Creează genurile lipsă (un singur INSERT). Returnează câte au fost create."""
+        missing = sorted({n.strip() for n in names if n and n.strip()} - self.genre_ids.keys())
+        if not missing:
+            return 0
+
+        created = self.db.execute(
+            insert(Genre)
+            .values([{"name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=[Genre.name])
+            .returning(Genre.id, Genre.name)
+        ).all()
+        self.genre_ids.update({name: gid for gid, name in created})
+
+        # Alt proces le-a creat între timp -> le citim id-urile
+        raced = [name for name in missing if name not in self.genre_ids]
+        if raced:
+            self.genre_ids.update({
+                name: gid
+                for gid, name in self.db.execute(select(Genre.id, Genre.name).where(Genre.name.in_(raced)))
+            })
+        return len(created)
+
+    def write_movies(self, movie_details: List[Dict]) -> Dict[int, int]:
+        """
+        Inserează un batch de filme (payload-uri `movie/{id}` din TMDB) și
+        genurile lor, într-o singură tranzacție. Filmele deja existente
+        (după tmdb_id) sunt ignorate.
+
+        Returnează {tmdb_id: movie_id} pentru filmele inserate efectiv.
+        """
+        by_tmdb_id = {d["id"]: d for d in movie_details if d.get("id")}
+        if not by_tmdb_id:
+            return {}
+
+        try:
+            self.ensure_genres(
+                g.get("name") or "" for d in by_tmdb_id.values() for g in d.get("genres", [])
+            )
+
+            rows = [tmdb_service.parse_movie_data(d) for d in by_tmdb_id.values()]
+            inserted = {
+                tmdb_id: movie_id
+                for movie_id, tmdb_id in self.db.execute(
+                    insert(Movie)
+                    .on_conflict_do_nothing(index_elements=[Movie.tmdb_id])
+                    .returning(Movie.id, Movie.tmdb_id),
+                    rows,
+                )
+            }
+
+            links = [
+                {"movie_id": movie_id, "genre_id": self.genre_ids[name]}
+                for tmdb_id, movie_id in inserted.items()
+                for name in {(g.get("name") or "").strip() for g in by_tmdb_id[tmdb_id].get("genres", [])}
+                if name
+            ]
+            if links:
+                self.db.execute(insert(MovieGenre).on_conflict_do_nothing(), links)
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            # Mapa poate conține genuri create în tranzacția anulată
+            self._genre_ids = None
+            raise
+
+        if self.on_inserted and inserted:
+            self.on_inserted([
+                {**row, "id": inserted[row["tmdb_id"]]} for row in rows if row["tmdb_id"] in inserted
+            ])
+        return inserted
+
+    def update_movies(self, movie_ids: Dict[int, int], movie_details: List[Dict], commit: bool = True) -> int:
+        """
+        Actualizează câmpurile din TMDB (titlu, descriere, poster, popularitate...)
+        pentru filme existente, într-un singur UPDATE executemany după PK.
+
+        `movie_ids` e {tmdb_id: movie_id}; detaliile pentru tmdb_id-uri
+        necunoscute sunt ignorate. Cu commit=False apelantul închide tranzacția
+        (ex. împreună cu checkpoint-ul sincronizării).
+        """
+        rows = []
+        for d in movie_details:
+            movie_id = movie_ids.get(d.get("id"))
+            if movie_id is None:
+                continue
+            parsed = tmdb_service.parse_movie_data(d)
+            parsed.pop("tmdb_id")
+            rows.append({"id": movie_id, **parsed})
+
+        if rows:
+            self.db.execute(update(Movie), rows)
+        if commit:
+            self.db.commit()
+        return len(rows)
@@ -0,0 +1,43 @@
+# backend/app/services/periodic.py
+import threading
+from typing import Callable, Optional
+
+
+class PeriodicTask:
+    """
+    Rulează `fn` la fiecare `interval` secunde pe un thread daemon, până la stop().
+    Erorile sunt logate și nu opresc task-ul (ex. DB indisponibil temporar).
+    """
+
+    def __init__(self, name: str, interval: float, fn: Callable[[], None], run_on_start: bool = False):
+        self.name = name
+        self.interval = interval
+        self.fn = fn
+        self.run_on_start = run_on_start
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self):
+        if self.run_on_start:
+            self._tick()
+        while not self._stop.wait(self.interval):
+            self._tick()
+
+    def _tick(self):
+        try:
+            self.fn()
+        except Exception as e:
+            print(f"✗ {self.name} failed: {e}")
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
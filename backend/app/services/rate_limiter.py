@@ -0,0 +1,48 @@
+# backend/app/services/rate_limiter.py
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket thread-safe pentru bugetul de request-uri TMDB.
+
+    `rate` tokeni/secundă se reîncarcă continuu, până la maximum `burst`.
+    Fiecare request consumă un token; `acquire` blochează până există unul.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Consumă tokeni dacă sunt disponibili, fără să aștepte"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Așteaptă până sunt disponibili `tokens` tokeni și îi consumă"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,259 @@
+# backend/app/services/ratings.py
+"""
+Agregatele de rating ale filmelor, întreținute incremental: fiecare scriere
+de review aplică delta (starea veche a review-ului -> starea nouă) în aceeași
+tranzacție cu review-ul:
+  * movies.rating_sum / rating_count, plus avg_rating derivat din ele, printr-un
+    singur UPDATE atomic;
+  * movie_rating_stats (histograma 1-10, review_count, spoiler_count), printr-un
+    upsert cu incremente.
+
+Cu RATING_AGGREGATOR, deltele nu mai ating rândurile filmului în tranzacția
+review-ului: după commit ajung în RatingAggregator, care le aplică pe toate
+(un UPDATE / upsert per film) la fiecare RATING_FLUSH_INTERVAL secunde.
+
+Drift-ul (scrieri directe în DB, bug-uri, delte pierdute la un crash) se
+corectează cu
+    python -m app.scripts.reconcile_ratings
+dar nu cât timp un RatingAggregator are delte în buffer (vezi scriptul).
+"""
+import threading
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import Numeric, bindparam, case, cast, event, func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.config import RATING_AGGREGATOR, RATING_FLUSH_INTERVAL, RATING_FLUSH_SIZE
+from app.database import SessionLocal
+from app.models.movie import Movie
+from app.models.movie_rating_stats import MovieRatingStats, STATS_COLUMNS
+from app.models.review import Review
+from app.services.catalog_events import movie_rating_changed
+
+# Cheia din Session.info sub care stau deltele tranzacției curente, până la commit
+PENDING_KEY = "rating_deltas"
+TOTALS_COLUMNS = ("rating_sum", "rating_count")
+
+# Starea unui review relevantă pentru agregate: (rating, is_spoiler); None = review inexistent
+ReviewState = Optional[Tuple[Optional[int], bool]]
+
+
+def review_state(review: Optional[Review]) -> ReviewState:
+    if review is None:
+        return None
+    return review.rating, bool(review.is_spoiler)
+
+
+def _contribution(state: ReviewState) -> Counter:
+    counts = Counter()
+    if state is None:
+        return counts
+    rating, is_spoiler = state
+    counts["review_count"] = 1
+    if is_spoiler:
+        counts["spoiler_count"] = 1
+    if rating is not None:
+        counts["rating_sum"] = rating
+        counts["rating_count"] = 1
+        counts[f"rating_{rating}"] = 1
+    return counts
+
+
+def review_deltas(old: ReviewState, new: ReviewState) -> Dict[str, int]:
+    """Deltele nenule pe coloanele agregate pentru trecerea old -> new"""
+    deltas = _contribution(new)
+    deltas.subtract(_contribution(old))
+    return {column: value for column, value in deltas.items() if value}
+
+
+def avg_from_totals(rating_sum, rating_count):
+    """Expresia SQL pentru avg_rating (2 zecimale, 0.0 fără rating-uri)"""
+    return case(
+        (rating_count > 0, func.round(cast(rating_sum, Numeric) / rating_count, 2)),
+        else_=0.0,
+    )
+
+
+def _totals_statement():
+    """rating_sum / rating_count += delte și avg_rating din noile totaluri, un film per set de parametri"""
+    movies = Movie.__table__
+    new_sum = movies.c.rating_sum + bindparam("d_sum")
+    new_count = movies.c.rating_count + bindparam("d_count")
+    return (
+        update(movies)
+        .where(movies.c.id == bindparam("movie_id_"))
+        .values(rating_sum=new_sum, rating_count=new_count, avg_rating=avg_from_totals(new_sum, new_count))
+    )
+
+
+def _stats_statement():
+    """Upsert cu incremente pe movie_rating_stats (rândul apare la primul review)"""
+    table = MovieRatingStats.__table__
+    stmt = insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.movie_id],
+        set_={column: table.c[column] + stmt.excluded[column] for column in STATS_COLUMNS},
+    )
+
+
+def apply_deltas(db: Session, deltas_by_movie: Dict[int, Dict[str, int]]) -> List[int]:
+    """
+    Aplică deltele pe movies și movie_rating_stats (executemany, în ordinea
+    id-urilor, ca tranzacțiile concurente să nu facă deadlock). Fără read-modify-
+    write, deci sigur la scrieri concurente. Nu face commit: rămâne în
+    tranzacția apelantului. Returnează filmele al căror avg_rating s-a schimbat.
+    """
+    totals, stats = [], []
+    for movie_id, deltas in sorted(deltas_by_movie.items()):
+        if any(deltas.get(column) for column in TOTALS_COLUMNS):
+            totals.append({
+                "movie_id_": movie_id,
+                "d_sum": deltas.get("rating_sum", 0),
+                "d_count": deltas.get("rating_count", 0),
+            })
+        if any(deltas.get(column) for column in STATS_COLUMNS):
+            stats.append({"movie_id": movie_id, **{column: deltas.get(column, 0) for column in STATS_COLUMNS}})
+    if totals:
+        db.execute(_totals_statement(), totals)
+    if stats:
+        db.execute(_stats_statement(), stats)
+    return [p["movie_id_"] for p in totals]
+
+
+class RatingAggregator:
+    """
+    Coalescing pentru deltele de rating: sute de review-uri concurente pe
+    același film nu mai așteaptă fiecare lock-ul pe rândul din movies, ci
+    devin un singur UPDATE per film la fiecare flush.
+
+    Flush-ul rulează pe un thread propriu la `interval` secunde, mai devreme
+    când s-au adunat `max_pending` delte, și o dată la stop(). Un flush eșuat
+    își pune deltele înapoi în buffer și se reîncearcă la următorul tick.
+    Invalidarea cache-ului (movie_rating_changed) se face după flush, când
+    avg_rating chiar s-a schimbat.
+
+    Cât timp thread-ul nu rulează (ex. scripturi, teste fără lifespan),
+    apply_review_change scrie direct, ca înainte.
+    """
+
+    def __init__(
+        self,
+        interval: float = RATING_FLUSH_INTERVAL,
+        max_pending: int = RATING_FLUSH_SIZE,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.enabled = RATING_AGGREGATOR
+        self.interval = interval
+        self.max_pending = max_pending
+        self.session_factory = session_factory
+        self._pending: Dict[int, Counter] = {}
+        self._buffered = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushes = 0
+        self.coalesced = 0
+
+    @property
+    def active(self) -> bool:
+        return self.enabled and self._thread is not None
+
+    def add(self, movie_id: int, deltas: Dict[str, int], buffered: int = 1) -> None:
+        with self._lock:
+            self._pending.setdefault(movie_id, Counter()).update(deltas)
+            self._buffered += buffered
+            full = self._buffered >= self.max_pending
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Aplică deltele adunate; returnează numărul de filme actualizate"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                buffered, self._buffered = self._buffered, 0
+            pending = {movie_id: deltas for movie_id, deltas in pending.items() if any(deltas.values())}
+            if not pending:
+                return 0
+            db = self.session_factory()
+            try:
+                changed = apply_deltas(db, pending)
+                db.commit()
+            except Exception:
+                db.rollback()
+                for movie_id, deltas in pending.items():
+                    self.add(movie_id, deltas, buffered=0)
+                with self._lock:
+                    self._buffered += buffered
+                raise
+            finally:
+                db.close()
+            self.flushes += 1
+            self.coalesced += buffered
+        for movie_id in changed:
+            movie_rating_changed(movie_id)
+        return len(pending)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"✗ rating-aggregator flush failed: {e}")
+
+    def start(self):
+        if self._thread is not None or not self.enabled:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rating-aggregator", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """Oprește thread-ul și aplică ce a rămas în buffer"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"✗ rating-aggregator final flush failed: {e}")
+
+
+rating_aggregator = RatingAggregator()
+
+
+def apply_review_change(db: Session, movie_id: int, old: ReviewState, new: ReviewState) -> bool:
+    """
+    Review creat (old=None), modificat sau șters (new=None); stările vin din
+    review_state(). Returnează True dacă avg_rating s-a putut schimba;
+    apelantul face commit și apoi anunță catalog_events.movie_rating_changed.
+
+    Cu agregatorul activ deltele sunt doar reținute pe sesiune și predate
+    agregatorului la commit (pierdute la rollback); returnează False, pentru
+    că avg_rating se schimbă abia la flush.
+    """
+    deltas = review_deltas(old, new)
+    if not deltas:
+        return False
+    if rating_aggregator.active:
+        db.info.setdefault(PENDING_KEY, []).append((movie_id, deltas))
+        return False
+    return bool(apply_deltas(db, {movie_id: deltas}))
+
+
+@event.listens_for(Session, "after_commit")
+def _hand_off_rating_deltas(session: Session) -> None:
+    for movie_id, deltas in session.info.pop(PENDING_KEY, ()):
+        rating_aggregator.add(movie_id, deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rating_deltas(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
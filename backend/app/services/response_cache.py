@@ -0,0 +1,167 @@
+# backend/app/services/response_cache.py
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from app.config import RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL
+from app.utils.etag import body_etag, etag_matches, not_modified
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    headers: Dict[str, str]
+    tags: FrozenSet[str]
+    expires_at: float
+    media_type: str = "application/json"
+
+    def to_response(self, request: Request) -> Response:
+        """Corpul salvat sau, dacă clientul are deja versiunea asta, 304 fără corp"""
+        if etag_matches(request, self.headers["ETag"]):
+            return not_modified(self.headers["ETag"])
+        return Response(content=self.body, media_type=self.media_type, headers=self.headers)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    stale_fills: int = 0
+
+
+class ResponseCache:
+    """
+    Cache read-through pentru răspunsuri JSON identice între useri (liste de
+    filme, detalii film, genuri). LRU + TTL; cheia e path-ul plus query
+    params normalizați (sortați). Fiecare intrare are un ETag (hash-ul corpului),
+    deci un If-None-Match potrivit primește 304 fără să atingă DB-ul.
+
+    Fiecare intrare are tag-uri (ex. "movie:12", "movie-lists") și scrierile
+    invalidează exact tag-urile afectate. Un epoch global crescut la fiecare
+    invalidare împiedică un request început înainte de o scriere să pună în
+    cache date vechi după ea. Cache-ul e per proces; TTL-ul mărginește cât de
+    vechi pot fi datele scrise de alte procese (scripturile de ingestie).
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._by_tag: Dict[str, set] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    @staticmethod
+    def key(request: Request) -> str:
+        params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        return f"{request.url.path}?{params}"
+
+    def get(self, request: Request) -> Optional[Response]:
+        if not self.enabled:
+            return None
+        key = self.key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return entry.to_response(request)
+
+    def put(
+        self,
+        request: Request,
+        body: bytes,
+        tags: Iterable[str],
+        epoch: int,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """Salvează corpul serializat și îl întoarce ca Response (hit sau nu)"""
+        key = self.key(request)
+        entry = CachedResponse(
+            body=body,
+            headers={**(headers or {}), "ETag": body_etag(body)},
+            tags=frozenset(tags),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        if self.enabled:
+            with self._lock:
+                if epoch != self._epoch:
+                    # A avut loc o invalidare cât timp se construia răspunsul
+                    self.stats.stale_fills += 1
+                else:
+                    self._drop(key)
+                    self._entries[key] = entry
+                    for tag in entry.tags:
+                        self._by_tag.setdefault(tag, set()).add(key)
+                    while len(self._entries) > self.max_entries:
+                        oldest = next(iter(self._entries))
+                        self._drop(oldest)
+                        self.stats.evictions += 1
+        return entry.to_response(request)
+
+    def invalidate(self, *tags: str) -> None:
+        with self._lock:
+            self._epoch += 1
+            for tag in tags:
+                for key in list(self._by_tag.get(tag, ())):
+                    self._drop(key)
+                    self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._by_tag.clear()
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats.hits + self.stats.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "hit_ratio": round(self.stats.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.stats.evictions,
+                "invalidations": self.stats.invalidations,
+                "stale_fills": self.stats.stale_fills,
+            }
+
+
+def render_json(adapter: TypeAdapter, value: Any) -> bytes:
+    """Serializează obiecte ORM prin schema pydantic direct în bytes"""
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+response_cache = ResponseCache()
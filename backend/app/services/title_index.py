@@ -0,0 +1,188 @@
+# backend/app/services/title_index.py
+import math
+import re
+import threading
+import time
+import unicodedata
+from bisect import insort
+from typing import Dict, Iterable, List, Tuple
+from sqlalchemy.orm import Session
+from app.config import TITLE_INDEX_REBUILD
+from app.models.movie import Movie
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+# prefixele mai lungi de atât nu mai îngustează practic lista de candidați
+MAX_PREFIX_LEN = 12
+# câmpurile unei intrări care pot schimba rezultatele suggest()
+INDEXED_FIELDS = ("title", "release_date", "poster_url", "popularity")
+
+
+def normalize(text: str) -> str:
+    """lowercase, fără diacritice"""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(normalize(text))
+
+
+class TitleIndex:
+    """
+    Index de prefixe in-memory peste titlurile filmelor, pentru typeahead.
+
+    Fiecare token din titlu e indexat pe toate prefixele lui (până la
+    MAX_PREFIX_LEN); listele de postare sunt ținute sortate după popularitate
+    descrescătoare, așa că o căutare parcurge doar candidații cei mai populari
+    până strânge destule potriviri. Thread-safe; add() e incremental.
+
+    `max_rev` e watermark-ul pe movies.rev: catch-up-ul re-indexează doar
+    filmele cu rev mai mare (inserate sau modificate de alte procese).
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, List[Tuple[float, int]]] = {}
+        self._movies: Dict[int, dict] = {}
+        self.max_rev = 0
+        self.built_at = 0.0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._movies)
+
+    @staticmethod
+    def _prefixes(tokens: Iterable[str]) -> set:
+        return {t[:i] for t in tokens for i in range(1, min(len(t), MAX_PREFIX_LEN) + 1)}
+
+    def _entry(self, row: dict) -> dict:
+        return {
+            "id": row["id"],
+            "title": row["title"] or "",
+            "release_date": row.get("release_date"),
+            "poster_url": row.get("poster_url"),
+            "popularity": row.get("popularity") or 0.0,
+            "norm": normalize(row["title"]),
+            "tokens": tokenize(row["title"]),
+        }
+
+    def build(self, rows: Iterable[dict]) -> None:
+        """Reconstruiește indexul complet (la pornire); sortează fiecare listă o singură dată"""
+        postings: Dict[str, List[Tuple[float, int]]] = {}
+        movies: Dict[int, dict] = {}
+        max_rev = 0
+        for row in rows:
+            entry = self._entry(row)
+            movies[entry["id"]] = entry
+            max_rev = max(max_rev, row.get("rev") or 0)
+            key = (-entry["popularity"], entry["id"])
+            for prefix in self._prefixes(entry["tokens"]):
+                postings.setdefault(prefix, []).append(key)
+        for posting in postings.values():
+            posting.sort()
+
+        with self._lock:
+            self._postings = postings
+            self._movies = movies
+            self.max_rev = max_rev
+            self.built_at = time.monotonic()
+
+    def add(self, row: dict) -> None:
+        """Adaugă sau actualizează un film (titlu/popularitate schimbate)"""
+        entry = self._entry(row)
+        with self._lock:
+            self.max_rev = max(self.max_rev, row.get("rev") or 0)
+            old = self._movies.get(entry["id"])
+            # rev-ul crește și la schimbări de rating: fără modificări vizibile în index, nimic de refăcut
+            if old is not None and all(old[field] == entry[field] for field in INDEXED_FIELDS):
+                return
+            self._remove(entry["id"])
+            self._movies[entry["id"]] = entry
+            key = (-entry["popularity"], entry["id"])
+            for prefix in self._prefixes(entry["tokens"]):
+                insort(self._postings.setdefault(prefix, []), key)
+
+    def add_many(self, rows: Iterable[dict]) -> None:
+        for row in rows:
+            self.add(row)
+
+    def _remove(self, movie_id: int) -> None:
+        old = self._movies.pop(movie_id, None)
+        if old is None:
+            return
+        key = (-old["popularity"], movie_id)
+        for prefix in self._prefixes(old["tokens"]):
+            posting = self._postings.get(prefix)
+            if posting:
+                try:
+                    posting.remove(key)
+                except ValueError:
+                    pass
+
+    def suggest(self, q: str, limit: int = 10) -> List[dict]:
+        """
+        Titluri ale căror token-uri încep cu fiecare token din `q` (ultimul poate
+        fi incomplet). Scor: log(popularitate) + bonus dacă titlul începe cu `q`.
+        """
+        terms = [t[:MAX_PREFIX_LEN] for t in tokenize(q)]
+        if not terms:
+            return []
+        norm_q = normalize(q).strip()
+
+        with self._lock:
+            lists = [self._postings.get(t, []) for t in terms]
+            # pornim de la cea mai scurtă listă de postare
+            candidates = min(lists, key=len)
+            wanted = limit * 4  # strângem mai mulți ca să conteze bonusul de prefix
+            matches = []
+            for _, movie_id in candidates:
+                entry = self._movies[movie_id]
+                if all(any(tok.startswith(t) for tok in entry["tokens"]) for t in terms):
+                    matches.append(entry)
+                    if len(matches) >= wanted:
+                        break
+
+        def score(entry: dict) -> float:
+            return math.log1p(max(entry["popularity"], 0.0)) + (2.0 if entry["norm"].startswith(norm_q) else 0.0)
+
+        matches.sort(key=score, reverse=True)
+        return [
+            {
+                "id": e["id"],
+                "title": e["title"],
+                "release_date": e["release_date"],
+                "poster_url": e["poster_url"],
+            }
+            for e in matches[:limit]
+        ]
+
+
+SUGGEST_COLUMNS = (Movie.id, Movie.title, Movie.release_date, Movie.poster_url, Movie.popularity, Movie.rev)
+
+
+def load_rows(db: Session, after_rev: int = 0) -> Iterable[dict]:
+    query = db.query(*SUGGEST_COLUMNS)
+    if after_rev:
+        # ix_movies_rev: doar filmele modificate de la ultimul refresh
+        query = query.filter(Movie.rev > after_rev)
+    for row in query.yield_per(5000):
+        yield row._asdict()
+
+
+title_index = TitleIndex()
+
+
+def rebuild_title_index(db: Session) -> None:
+    title_index.build(load_rows(db))
+
+
+def catch_up_title_index(db: Session) -> None:
+    """
+    Re-indexează filmele inserate sau modificate (titlu, popularitate, ex.
+    de sync_changes) de alte procese, după watermark-ul pe rev. Ștergerile și
+    rândurile commit-uite cu întârziere față de watermark sunt prinse de
+    reconstrucția completă de la TITLE_INDEX_REBUILD secunde.
+    """
+    if time.monotonic() - title_index.built_at >= TITLE_INDEX_REBUILD:
+        rebuild_title_index(db)
+        return
+    title_index.add_many(load_rows(db, after_rev=title_index.max_rev))
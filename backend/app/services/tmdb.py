@@ -1,26 +1,304 @@
 # backend/app/services/tmdb.py
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
 import requests
-from typing import List, Optional, Dict
-from datetime import datetime
-from app.config import TMDB_API_KEY, TMDB_BASE_URL, TMDB_IMAGE_BASE_URL
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Tuple
+from datetime import date, datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from app.config import (
+    TMDB_API_KEY,
+    TMDB_BASE_URL,
+    TMDB_IMAGE_BASE_URL,
+    TMDB_CACHE_PATH,
+    TMDB_CACHE_MAX_MB,
+    TMDB_OFFLINE,
+    TMDB_POOL_SIZE,
+    TMDB_CONNECT_TIMEOUT,
+    TMDB_READ_TIMEOUT,
+    TMDB_MAX_RETRIES,
+    TMDB_BACKOFF_BASE,
+    TMDB_BACKOFF_MAX,
+    TMDB_BREAKER_THRESHOLD,
+    TMDB_BREAKER_RESET,
+)
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+# TTL per endpoint (secunde); primul pattern care se potrivește câștigă, 0 = nu se cache-uiește
+CACHE_TTLS: List[Tuple[re.Pattern, int]] = [
+    (re.compile(r"^genre/"), 7 * 24 * 3600),
+    (re.compile(r"^movie/(popular|top_rated)$"), 6 * 3600),
+    (re.compile(r"^movie/changes$"), 0),
+    (re.compile(r"^search/"), 3600),
+    (re.compile(r"^movie/\d+$"), 24 * 3600),
+]
+DEFAULT_CACHE_TTL = 3600
+
+# Răspunsuri după care are sens un retry (rate limit / TMDB degradat)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TMDBOfflineMiss(LookupError):
+    """Mod offline și răspunsul nu e în cache"""
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    ttl: int
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() - self.fetched_at < self.ttl
+
+    def payload(self) -> Dict:
+        return json.loads(self.body)
+
+
+class TMDBCache:
+    """
+    Cache persistent (SQLite) pentru răspunsurile TMDB.
+
+    Cheia e endpoint + parametrii sortați (fără api_key). Când dimensiunea
+    totală depășește `max_bytes`, intrările cel mai puțin recent folosite
+    sunt evacuate. Thread-safe: o conexiune partajată, protejată de lock.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at)")
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def key(endpoint: str, params: Dict) -> str:
+        clean = sorted((k, str(v)) for k, v in params.items() if k != "api_key")
+        return f"{endpoint}?{urlencode(clean)}" if clean else endpoint
+
+    def get(self, key: str, ttl: int) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return CacheEntry(body=row[0], etag=row[1], last_modified=row[2], fetched_at=row[3], ttl=ttl)
+
+    def put(self, key: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, etag, last_modified, fetched_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, now, now, len(body)),
+            )
+            self._size += len(body) - (old[0] if old else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def touch(self, key: str):
+        """Marchează o intrare ca proaspătă (după revalidare cu 304)"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?", (now, now, key)
+            )
+
+    def _evict(self):
+        # Coboară la 90% din limită ca să nu evacuăm la fiecare put
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        doomed = []
+        for key, size in rows:
+            if self._size <= target:
+                break
+            doomed.append((key,))
+            self._size -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
 
 class TMDBService:
     """Serviciu pentru interacțiune cu TMDB API"""
     
-    def __init__(self, api_key: str = TMDB_API_KEY):
+    def __init__(
+        self,
+        api_key: str = TMDB_API_KEY,
+        cache: Optional[TMDBCache] = None,
+        offline: bool = False,
+        pool_size: int = TMDB_POOL_SIZE,
+        timeout: Tuple[float, float] = (TMDB_CONNECT_TIMEOUT, TMDB_READ_TIMEOUT),
+        max_retries: int = TMDB_MAX_RETRIES,
+        backoff_base: float = TMDB_BACKOFF_BASE,
+        backoff_max: float = TMDB_BACKOFF_MAX,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
         self.api_key = api_key
         self.base_url = TMDB_BASE_URL
         self.image_base_url = TMDB_IMAGE_BASE_URL
-    
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Face request către TMDB API"""
+        self.cache = cache
+        self.offline = offline
+        if offline and cache is None:
+            raise ValueError("Offline mode requires a cache (set TMDB_CACHE_PATH)")
+
+        # Sesiune keep-alive: conexiunile TLS sunt refolosite între request-uri/thread-uri
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker(
+            "tmdb", failure_threshold=TMDB_BREAKER_THRESHOLD, reset_timeout=TMDB_BREAKER_RESET
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff cu full jitter"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Retry-After poate fi în secunde sau dată HTTP"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(self.backoff_max, max(0.0, delay))
+
+    def _fetch(self, endpoint: str, params: Dict, headers: Optional[Dict] = None) -> requests.Response:
+        """
+        Request HTTP efectiv către TMDB (fără cache), cu retry pe erori de
+        rețea (orice requests.RequestException) / 429 / 5xx. Aruncă
+        CircuitOpenError imediat cât timp TMDB e considerat căzut.
+        """
         url = f"{self.base_url}/{endpoint}"
-        if params is None:
-            params = {}
-        params["api_key"] = self.api_key
-        
-        response = requests.get(url, params=params)
-        response.raise_for_status()
+        attempt = 0
+        while True:
+            probe = self.breaker.before_call()
+            try:
+                try:
+                    response = self.session.get(
+                        url,
+                        params={**params, "api_key": self.api_key},
+                        headers=headers,
+                        timeout=self.timeout,
+                    )
+                except requests.RequestException:
+                    self.breaker.record_failure()
+                    if attempt >= self.max_retries:
+                        raise
+                    delay = self._backoff(attempt)
+                else:
+                    if response.status_code not in RETRYABLE_STATUSES:
+                        self.breaker.record_success()
+                        if response.status_code != 304:
+                            response.raise_for_status()
+                        return response
+
+                    self.breaker.record_failure()
+                    if attempt >= self.max_retries:
+                        response.raise_for_status()
+                    retry_after = self._retry_after(response)
+                    delay = retry_after if retry_after is not None else self._backoff(attempt)
+            finally:
+                if probe:
+                    self.breaker.release_probe()
+
+            attempt += 1
+            time.sleep(delay)
+
+    def _revalidate(self, endpoint: str, params: Dict, key: str, entry: CacheEntry) -> Dict:
+        """
+        Hook de revalidare pentru o intrare expirată: request condiționat
+        (If-None-Match / If-Modified-Since). La 304 intrarea e reîmprospătată
+        fără să mai transferăm body-ul; altfel e înlocuită.
+        """
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        response = self._fetch(endpoint, params, headers=headers)
+        if response.status_code == 304:
+            self.cache.touch(key)
+            return entry.payload()
+        self._store(key, response)
+        return response.json()
+
+    def _store(self, key: str, response: requests.Response):
+        self.cache.put(
+            key,
+            response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    @staticmethod
+    def cache_ttl(endpoint: str) -> int:
+        for pattern, ttl in CACHE_TTLS:
+            if pattern.match(endpoint):
+                return ttl
+        return DEFAULT_CACHE_TTL
+
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """Face request către TMDB API (prin cache-ul de pe disc, dacă e configurat)"""
+        params = dict(params or {})
+        ttl = self.cache_ttl(endpoint)
+        if self.cache is None or ttl <= 0:
+            if self.offline:
+                raise TMDBOfflineMiss(f"{endpoint} is never cached")
+            return self._fetch(endpoint, params).json()
+
+        key = self.cache.key(endpoint, params)
+        entry = self.cache.get(key, ttl)
+        if entry is not None and (entry.fresh or self.offline):
+            return entry.payload()
+        if self.offline:
+            raise TMDBOfflineMiss(f"{key} is not cached")
+
+        if entry is not None and (entry.etag or entry.last_modified):
+            return self._revalidate(endpoint, params, key, entry)
+
+        response = self._fetch(endpoint, params)
+        self._store(key, response)
         return response.json()
     
     def get_popular_movies(self, page: int = 1) -> Dict:
@@ -32,6 +310,13 @@ class TMDBService:
     def get_movie_details(self, tmdb_id: int) -> Dict:
         return self._make_request(f"movie/{tmdb_id}")
     
+    def get_movie_changes(self, start_date: date, end_date: date, page: int = 1) -> Dict:
+        """Filmele modificate pe TMDB în [start_date, end_date] (maximum 14 zile)"""
+        return self._make_request(
+            "movie/changes",
+            params={"start_date": start_date.isoformat(), "end_date": end_date.isoformat(), "page": page},
+        )
+    
     def get_genres(self) -> List[Dict]:
         response = self._make_request("genre/movie/list")
         return response.get("genres", [])
@@ -69,4 +354,7 @@ class TMDBService:
             "name": tmdb_genre.get("name", "")
         }
 
-tmdb_service = TMDBService()
\ No newline at end of file
+tmdb_service = TMDBService(
+    cache=TMDBCache(TMDB_CACHE_PATH, TMDB_CACHE_MAX_MB * 1024 * 1024) if TMDB_CACHE_PATH else None,
+    offline=TMDB_OFFLINE,
+)
\ No newline at end of file
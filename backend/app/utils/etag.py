@@ -0,0 +1,45 @@
+# backend/app/utils/etag.py
+import hashlib
+from typing import Dict, Optional
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts) -> str:
+    """ETag strong din ștampile de versiune (rev-uri, id-uri, query params)"""
+    raw = ":".join("" if p is None else str(p) for p in parts)
+    return f'"{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"'
+
+
+def body_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match: listă separată prin virgulă, "*" sau tag-uri W/ (comparație weak)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return "*" in tags or etag in tags
+
+
+def not_modified(etag: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**(headers or {}), "ETag": etag})
+
+
+def request_etag(request: Request, *parts) -> str:
+    """ETag pentru un endpoint: ștampilele de versiune + path + query params normalizați"""
+    params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return make_etag(request.url.path, params, *parts)
+
+
+def conditional(request: Request, response: Response, etag: str, private: bool = False) -> Optional[Response]:
+    """
+    Întoarce 304 dacă clientul are deja versiunea `etag`; altfel pune ETag-ul
+    (și Cache-Control) pe răspuns și întoarce None, iar handler-ul continuă.
+    """
+    headers = {"Cache-Control": "private, no-cache" if private else "no-cache"}
+    if etag_matches(request, etag):
+        return not_modified(etag, headers)
+    response.headers.update({**headers, "ETag": etag})
+    return None
@@ -0,0 +1,29 @@
+# backend/app/utils/fast_json.py
+from typing import Any
+from pydantic_core import to_json
+from app.config import FAST_JSON_LISTS
+
+try:
+    import orjson
+except ImportError:  # opțional: fără orjson rămâne encoder-ul Rust din pydantic-core
+    orjson = None
+
+
+class FastLists:
+    """
+    Comutatorul pentru calea rapidă a listelor: rânduri (tuple) din DB ->
+    dict-uri -> JSON, fără obiecte ORM și fără validarea response_model.
+    Implicit din FAST_JSON_LISTS; atributul poate fi schimbat la runtime
+    (ex. de scriptul de benchmark, ca să compare cele două căi).
+    """
+
+    enabled: bool = FAST_JSON_LISTS
+
+
+fast_lists = FastLists()
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return to_json(value)
@@ -0,0 +1,75 @@
+# backend/app/utils/fields.py
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+from fastapi import HTTPException, Response, status
+from pydantic_core import to_json
+from sqlalchemy.orm import load_only
+
+Fields = Tuple[str, ...]
+
+
+def parse_fields(
+    fields: Optional[str],
+    allowed: Sequence[str],
+    presets: Mapping[str, Sequence[str]],
+) -> Optional[Fields]:
+    """
+    `fields=` -> tuplul de câmpuri cerute, în ordinea schemei. None = forma
+    completă (implicit, pentru compatibilitate cu clientul Android). Acceptă un
+    preset (ex. "card") sau o listă separată prin virgulă; `id` e inclus mereu.
+    """
+    if not fields:
+        return None
+    requested = set()
+    for name in (f.strip() for f in fields.split(",")):
+        if not name:
+            continue
+        if name in presets:
+            requested.update(presets[name])
+        elif name in allowed:
+            requested.add(name)
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown field '{name}'. Allowed: {', '.join([*presets, *allowed])}"
+            )
+    requested.add("id")
+    return tuple(f for f in allowed if f in requested)
+
+
+def parse_embed(embed: Optional[str], allowed: Sequence[str]) -> Fields:
+    """`embed=` -> obiectele asociate cerute, în ordinea din `allowed`; () = fără embed"""
+    if not embed:
+        return ()
+    requested = {name.strip() for name in embed.split(",") if name.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown embed '{sorted(unknown)[0]}'. Allowed: {', '.join(allowed)}"
+        )
+    return tuple(name for name in allowed if name in requested)
+
+
+def column_options(model, fields: Fields, relationships: Iterable[str] = ()) -> list:
+    """load_only pe coloanele cerute: restul (ex. Text-uri mari) nu mai pleacă din DB"""
+    columns = [getattr(model, f) for f in fields if f not in relationships]
+    return [load_only(*columns)]
+
+
+def project(obj: Any, fields: Fields, computed: Optional[Dict[str, Callable[[Any], Any]]] = None) -> dict:
+    """Dict doar cu câmpurile cerute, citite direct de pe obiectul ORM"""
+    computed = computed or {}
+    return {f: computed[f](obj) if f in computed else getattr(obj, f) for f in fields}
+
+
+def render_projection(items: Iterable[dict]) -> bytes:
+    return to_json(list(items))
+
+
+def projected_response(response: Response, body: bytes) -> Response:
+    """
+    Răspuns JSON direct (fără response_model), păstrând headerele puse deja pe
+    `response` (X-Next-Cursor, ETag, Cache-Control).
+    """
+    headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+    return Response(content=body, media_type="application/json", headers=headers)
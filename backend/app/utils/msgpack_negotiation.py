@@ -0,0 +1,134 @@
+# backend/app/utils/msgpack_negotiation.py
+import json
+from typing import List, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import msgpack
+except ImportError:  # opțional: fără msgpack răspunsurile rămân JSON
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack")
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# Sufix pe ETag: reprezentarea msgpack e alta decât cea JSON (ETag strong diferit)
+ETAG_SUFFIX = "-mp"
+
+
+def wants_msgpack(accept: Optional[str]) -> bool:
+    """Accept conține application/msgpack (sau x-msgpack) cu q > 0"""
+    if not accept:
+        return False
+    for part in accept.split(","):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        if media_type.lower() not in MSGPACK_TYPES:
+            continue
+        q = next((p.split("=", 1)[1] for p in params if p.startswith("q=")), "1")
+        try:
+            if float(q) > 0:
+                return True
+        except ValueError:
+            return True
+    return False
+
+
+def msgpack_if_none_match(value: str) -> Optional[str]:
+    """
+    If-None-Match al unui request msgpack, tradus pentru handler: doar tag-urile
+    cu sufixul "-mp" (fără sufix) și "*". Un ETag JSON nu trebuie să dea 304
+    pe reprezentarea msgpack; None = nimic de păstrat.
+    """
+    tags = []
+    for tag in (t.strip() for t in value.split(",")):
+        if tag == "*":
+            tags.append(tag)
+        elif tag.endswith(f'{ETAG_SUFFIX}"'):
+            tags.append(f'{tag[:-len(ETAG_SUFFIX) - 1]}"')
+    return ", ".join(tags) or None
+
+
+def json_to_msgpack(body: bytes) -> bytes:
+    value = orjson.loads(body) if orjson is not None else json.loads(body)
+    return msgpack.packb(value, use_bin_type=True)
+
+
+class MsgpackMiddleware:
+    """
+    Negociere de conținut pentru GET-uri: cu `Accept: application/msgpack`,
+    răspunsurile JSON 200 sunt re-encodate ca MessagePack (mai compact, parsare
+    mai ieftină pe mobil). Fără header-ul Accept nimic nu se schimbă.
+
+    ETag-ul primește sufixul "-mp", iar If-None-Match e tradus înapoi pentru
+    handler, ca 304-urile (ETag / response cache) să funcționeze și pe msgpack.
+    Orice GET primește `Vary: Accept`, inclusiv răspunsurile JSON, ca un cache
+    (proxy, OkHttp) să nu servească o reprezentare în locul celeilalte.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if msgpack is None or scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if not wants_msgpack(Headers(scope=scope).get("accept")):
+            async def send_json(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(raw=list(message["headers"]))
+                    headers.add_vary_header("Accept")
+                    message = {**message, "headers": headers.raw}
+                await send(message)
+
+            await self.app(scope, receive, send_json)
+            return
+
+        request_headers = MutableHeaders(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match:
+            translated = msgpack_if_none_match(if_none_match)
+            if translated is None:
+                del request_headers["if-none-match"]
+            else:
+                request_headers["if-none-match"] = translated
+
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            status, headers, body = self._encode(start, b"".join(chunks))
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _encode(start: Message, body: bytes) -> Tuple[int, list, bytes]:
+        headers = MutableHeaders(raw=list(start["headers"]))
+        status = start["status"]
+        headers.add_vary_header("Accept")
+        etag = headers.get("etag")
+        if etag and etag.endswith('"'):
+            headers["etag"] = f'{etag[:-1]}{ETAG_SUFFIX}"'
+
+        if status == 200 and headers.get("content-type", "").startswith("application/json"):
+            body = json_to_msgpack(body)
+            headers["content-type"] = MSGPACK_MEDIA_TYPE
+            headers["content-length"] = str(len(body))
+        return status, headers.raw, body
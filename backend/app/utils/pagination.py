@@ -0,0 +1,114 @@
+# backend/app/utils/pagination.py
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+# Header-ul în care list endpoint-urile întorc cursorul paginii următoare
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_value(value: Any):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise ValueError("unknown cursor value")
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Cursor opac (base64url JSON) din valorile cheii de sortare ale ultimului rând"""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _matches_key(key, value: Any) -> bool:
+    """Valoarea din cursor are tipul cheii de sortare (număr, datetime sau date)"""
+    try:
+        expected = key.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value is not None
+    if isinstance(value, bool):
+        return False
+    if expected is datetime:
+        return isinstance(value, datetime)
+    if expected is date:
+        return isinstance(value, date) and not isinstance(value, datetime)
+    if expected is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, expected)
+
+
+def decode_cursor(cursor: str, keys: Sequence) -> List[Any]:
+    """Valorile din cursor, validate ca număr și tip față de `keys`; 400 pentru orice cursor invalid"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = [_decode_value(v) for v in json.loads(raw)]
+    except (ValueError, TypeError):
+        values = None
+    if (
+        not isinstance(values, list)
+        or len(values) != len(keys)
+        or not all(_matches_key(key, value) for key, value in zip(keys, values))
+    ):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return values
+
+
+def keyset_query(query: Query, keys: Sequence, cursor: Optional[str] = None, skip: int = 0) -> Query:
+    """Aplică filtrul keyset, ordinea DESC și (fără cursor) offset-ul; fără LIMIT"""
+    query = query.add_columns(*keys)
+    if cursor:
+        query = query.filter(tuple_(*keys) < tuple_(*decode_cursor(cursor, keys)))
+
+    query = query.order_by(*[k.desc() for k in keys])
+    if skip and not cursor:
+        query = query.offset(skip)
+    return query
+
+
+def keyset_page(
+    query: Query,
+    keys: Sequence,
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+) -> Tuple[list, Optional[str]]:
+    """
+    Paginare keyset: sortează descendent după `keys` (ultima cheie trebuie să fie
+    unică, ex. id) și, dacă există cursor, continuă strict după rândul din cursor
+    (WHERE (k1, k2, ...) < (:v1, :v2, ...)), fără OFFSET.
+
+    `skip` rămâne pentru compatibilitate și e ignorat când e dat un cursor.
+    Întoarce (items, next_cursor); next_cursor e None pe ultima pagină. Pentru
+    un query pe o entitate items sunt obiectele, pentru un query pe coloane
+    (with_entities) sunt tuple cu acele coloane.
+    """
+    rows = keyset_query(query, keys, cursor=cursor, skip=skip).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    descriptions = query.column_descriptions
+    width = len(descriptions)
+    single_entity = width == 1 and descriptions[0]["type"] is descriptions[0]["entity"]
+    items = [row[0] if single_entity else tuple(row[:width]) for row in rows]
+    next_cursor = encode_cursor(rows[-1][width:]) if has_more and rows else None
+    return items, next_cursor
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor